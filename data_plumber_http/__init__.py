@@ -1,2 +1,48 @@
-from .keys import *
-from .types import *
+from typing import TYPE_CHECKING
+from importlib.util import find_spec
+import importlib
+
+if TYPE_CHECKING:  # static re-exports for type checkers (see `__getattr__`)
+    from .keys import DPKey, Property, AllOf, OneOf
+    from .types import (
+        DPType,
+        Any, Array, Boolean, Float, Integer, Null, Number, Object, String,
+        Uri, Url, FileSystemObject, Ref, FileUpload
+    )
+
+# attributes are loaded lazily on first access (PEP 562)
+_KEYS = ["DPKey", "Property", "AllOf", "OneOf"]
+_TYPES = [
+    "DPType",
+    "Any", "Array", "Boolean", "Float", "Integer", "Null", "Number", "Object",
+    "String", "Uri", "Url", "FileSystemObject", "Ref",
+]
+# `FileUpload` requires werkzeug
+_OPTIONAL_TYPES = ["FileUpload"]
+_ATTRIBUTES = {name: ".keys" for name in _KEYS} \
+    | {name: ".types" for name in _TYPES + _OPTIONAL_TYPES}
+_SUBMODULES = [
+    "coercion", "compiler", "decorators", "engine", "execution",
+    "incremental", "instrumentation", "keys", "metrics", "output",
+    "profiling", "registry", "settings", "stat_cache", "types",
+]
+
+__all__ = _KEYS + _TYPES + (
+    _OPTIONAL_TYPES if find_spec("werkzeug") is not None else []
+)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _ATTRIBUTES:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    value = getattr(importlib.import_module(_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
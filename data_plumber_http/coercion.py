@@ -0,0 +1,91 @@
+from typing import Any, get_args
+from types import NoneType
+import sys
+import re
+
+
+# strings longer than this are never coerced; this bounds the cost of
+# `int()`/`float()` for pathological inputs (e.g. a query-parameter
+# with a million digits)
+MAX_LENGTH = 64
+
+# number grammar of JSON (RFC 8259)
+_INTEGER = re.compile(r"-?(?:0|[1-9][0-9]*)")
+_FLOAT = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_BOOLEAN = {"true": True, "false": False}
+
+
+def _options(type_) -> tuple:
+    """Returns tuple of the types that make up `type_`."""
+    return get_args(type_) or (type_,)
+
+
+def coerce_value(value: Any, type_) -> Any:
+    """
+    Returns `value` converted into (one of the options of) `type_` if
+    `value` is a string representing a JSON-literal of that type
+    (integer, number, 'true'/'false', or 'null'); otherwise `value` is
+    returned unchanged. Options are tried in order.
+
+    Keyword arguments:
+    value -- value to be converted
+    type_ -- target type (e.g. `DPType.TYPE`)
+    """
+    if not isinstance(value, str) or len(value) > MAX_LENGTH:
+        return value
+    for option in _options(type_):
+        if option is bool:
+            if value in _BOOLEAN:
+                return _BOOLEAN[value]
+        elif option is int:
+            if _INTEGER.fullmatch(value):
+                return int(value)
+        elif option is float:
+            if _FLOAT.fullmatch(value):
+                return float(value)
+        elif option is NoneType:
+            if value == "null":
+                return None
+    return value
+
+
+def _multi_dicts() -> tuple:
+    """
+    Returns `MultiDict`-types that store the lists of values in their
+    `dict`-storage (other subclasses like `CombinedMultiDict` do not).
+    """
+    # werkzeug is only loaded if such an object exists
+    datastructures = sys.modules.get("werkzeug.datastructures")
+    if datastructures is None:
+        return ()
+    return (datastructures.MultiDict, datastructures.ImmutableMultiDict)
+
+
+def coerce(json, origin: str, dptype) -> Any:
+    """
+    Returns value of field `origin` in `json` (e.g. a `MultiDict` of
+    query-string or form data) coerced into the type of `dptype`. Values
+    that already have the expected type are returned as is.
+
+    If `dptype` accepts an `Array` and `json` supports `getlist`, all
+    values given for `origin` are collected into a list. For (immutable)
+    `MultiDict`s (which store these lists internally) this list is not
+    copied unless its items need to be coerced.
+
+    Keyword arguments:
+    json -- input data
+    origin -- key in `json`
+    dptype -- `DPType` of the field
+    """
+    value = json[origin]
+    type_ = dptype.TYPE
+    if isinstance(value, type_):
+        return value
+    if list in _options(type_) and hasattr(json, "getlist"):
+        values = dict.__getitem__(json, origin) \
+            if type(json) in _multi_dicts() else json.getlist(origin)
+        items = getattr(dptype, "_items", None)
+        if items is None or all(isinstance(v, items.TYPE) for v in values):
+            return values
+        return [coerce_value(v, items.TYPE) for v in values]
+    return coerce_value(value, type_)
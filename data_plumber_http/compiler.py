@@ -0,0 +1,644 @@
+from typing import Optional, Callable, Any, Mapping
+from types import NoneType, UnionType
+from itertools import count
+import ast
+import importlib
+import sys
+import typing
+
+from data_plumber.output import PipelineOutput, StageRecord
+
+from data_plumber_http.output import Output
+from data_plumber_http.settings import Responses
+from data_plumber_http.keys import Property
+from data_plumber_http.types import DPType, Object, Array, String, \
+    Integer, Float, Boolean, Null
+
+
+def reference(source: str, name: str, *path) -> Any:
+    """
+    Returns object referenced by `path` in the schema `name` of module
+    `source` (used by generated modules for parts of a schema that are
+    not compiled).
+
+    Keyword arguments:
+    source -- name of module containing the schema
+    name -- name of schema in `source`
+    path -- sequence of steps; either "items" (`Array`-items),
+            "additional" (type of `Object`-additional properties),
+            "model" (`Object`-model), or a pair of "key"/"value"/"option"
+            and an index (`Object`-properties or options in union type)
+    """
+    obj = getattr(importlib.import_module(source), name)
+    for step in path:
+        match step:
+            case "items":
+                obj = obj._items
+            case "additional":
+                obj = obj._additional_properties_typespec
+            case "model":
+                obj = obj._model
+            case ("key", index):
+                obj = list(obj.properties.keys())[index]
+            case ("value", index):
+                obj = list(obj.properties.values())[index]
+            case ("option", index):
+                obj = obj._TYPES[index]
+            case _:
+                raise ValueError(f"Bad step '{step}' in reference-path.")
+    return obj
+
+
+class CompiledValidator:
+    """
+    Validator generated by the schema compiler. Can be used in place of
+    the `Pipeline` returned by `Object.assemble` (e.g. as `handler` in
+    `flask_handler`).
+
+    Keyword arguments:
+    function -- generated validation function
+    """
+
+    def __init__(
+        self, function: Callable[[Any, Optional[str]], tuple]
+    ) -> None:
+        self._function = function
+
+    def run(self, json, **kwargs) -> PipelineOutput:
+        """
+        Returns `PipelineOutput` with the result of the validation of
+        `json` (a single record containing the final message and
+        status). Partial mode (`partial=True`) and coercion
+        (`coerce=True`) are not supported.
+        """
+        if kwargs.get("partial"):
+            raise ValueError(
+                "Compiled validators do not support partial validation."
+            )
+        if kwargs.get("coerce"):
+            raise ValueError(
+                "Compiled validators do not support coercion."
+            )
+        value, msg, status, data = self._function(json, None)
+        return PipelineOutput(
+            [StageRecord(0, "compiled", msg, status)],
+            kwargs | {"json": json},
+            Output(value, data)
+        )
+
+    def make(self, json, loc: Optional[str] = None) -> tuple[Any, str, int]:
+        """
+        Validate and instantiate type based on `json` (equivalent to
+        `Object.make`).
+        """
+        value, msg, status, _ = self._function(json, loc)
+        return (
+            value, msg or Responses().GOOD.msg, status or Responses().GOOD.status
+        )
+
+
+def _is_literal(value) -> bool:
+    """Returns `True` if `value` can be written as literal."""
+    try:
+        result = ast.literal_eval(repr(value))
+    except (ValueError, SyntaxError):
+        return False
+    return type(result) is type(value) and result == value
+
+
+class _Generator:
+    """
+    Generates the source of a validator-module for schemas in `source`.
+    """
+
+    _BUILTINS = {
+        str: "str", int: "int", float: "float", bool: "bool", list: "list",
+        dict: "dict", NoneType: "_NoneType",
+    }
+
+    def __init__(self, source: str) -> None:
+        self._source = source
+        self._header: list[str] = []
+        self._functions: list[str] = []
+        self._objects: dict[int, str] = {}
+        self._references: dict[tuple, str] = {}
+        self._count = count()
+        self._schema = ""
+
+    def _name(self, prefix: str) -> str:
+        return f"_{prefix}{next(self._count)}"
+
+    def _constant(self, expression: str, prefix: str = "C") -> str:
+        name = self._name(prefix)
+        self._header.append(f"{name} = {expression}")
+        return name
+
+    def _reference(self, path: tuple) -> str:
+        key = (self._schema, *path)
+        if key not in self._references:
+            self._references[key] = self._constant(
+                "reference(_SOURCE, "
+                + ", ".join(repr(step) for step in key)
+                + ")",
+                "F"
+            )
+        return self._references[key]
+
+    def _type_expression(self, type_) -> Optional[str]:
+        """Returns expression for `isinstance`-check or `None`."""
+        if isinstance(type_, UnionType):
+            args = [self._type_expression(t) for t in typing.get_args(type_)]
+            if any(a is None for a in args):
+                return None
+            return "(" + ", ".join(args) + ",)"  # type: ignore[arg-type]
+        return self._BUILTINS.get(type_)
+
+    def _is_union(self, dptype) -> bool:
+        return isinstance(dptype, DPType) \
+            and hasattr(dptype, "_TYPES") \
+            and type(dptype).__qualname__ == "DPType.__or__.<locals>._"
+
+    def _compilable(self, dptype) -> bool:
+        """Returns `True` if `dptype` can be compiled (not referenced)."""
+        if self._is_union(dptype):
+            return all(self._compilable(o) for o in dptype._TYPES)
+        if type(dptype) in (String,):
+            return (
+                dptype._pattern is None or isinstance(dptype._pattern, str)
+            ) and (dptype._enum is None or _is_literal(tuple(dptype._enum)))
+        if type(dptype) in (Integer, Float):
+            return all(
+                _is_literal(v) for v in (
+                    None if dptype._values is None else tuple(dptype._values),
+                    dptype._min_value, dptype._min_value_inclusive,
+                    dptype._max_value, dptype._max_value_inclusive,
+                )
+            )
+        if type(dptype) in (Boolean, Null, Object):
+            return True
+        if type(dptype) is Array:
+            return dptype._items is None or self._compilable(dptype._items)
+        return False
+
+    def _type_check(self, dptype, path) -> tuple[str, str]:
+        """
+        Returns expressions for type and type-name of `dptype`.
+        """
+        if self._compilable(dptype) \
+                and (type_ := self._type_expression(dptype.TYPE)) is not None:
+            return type_, repr(dptype.__name__)
+        ref = self._reference(path)
+        return f"{ref}.TYPE", f"{ref}.__name__"
+
+    @staticmethod
+    def _emit_result(lines, indent, value, loc, target, checks, success):
+        """
+        Emit chain of checks (pairs of condition and expected value for
+        the message of `BAD_VALUE`) followed by the success-value.
+        """
+        pad = " " * indent
+        r, m, s = target
+        for index, (condition, expected) in enumerate(checks):
+            lines.append(
+                pad + ("if " if index == 0 else "elif ") + condition + ":"
+            )
+            lines.append(
+                pad + f"    {r}, {m}, {s} = None, _R.BAD_VALUE.msg.format("
+                + f"origin={value}, loc={loc}, expected={expected}), "
+                + "_R.BAD_VALUE.status"
+            )
+        if checks:
+            lines.append(pad + "else:")
+            pad += "    "
+        lines.append(
+            pad + f"{r}, {m}, {s} = {success}, _R.GOOD.msg, _R.GOOD.status"
+        )
+
+    def _emit_make(self, lines, indent, dptype, path, value, loc, target):
+        """
+        Emit statements that assign the result of `dptype.make(value,
+        loc)` to the three variables in `target`.
+        """
+        pad = " " * indent
+        r, m, s = target
+
+        def emit(checks, success):
+            self._emit_result(
+                lines, indent, value, loc, target, checks, success
+            )
+
+        if not self._compilable(dptype):
+            ref = self._reference(path)
+            lines.append(pad + f"{r}, {m}, {s} = {ref}.make({value}, {loc})")
+            return
+        if self._is_union(dptype):
+            self._emit_union(lines, indent, dptype, path, value, loc, target)
+            return
+        if type(dptype) is String:
+            checks = []
+            if dptype._pattern is not None:
+                pattern = self._constant(f"re.compile({dptype._pattern!r})")
+                checks.append((
+                    f"{pattern}.fullmatch({value}) is None",
+                    repr(f"pattern '{dptype._pattern}'")
+                ))
+            if dptype._enum is not None:
+                checks.append((
+                    f"{value} not in {self._constant(repr(tuple(dptype._enum)))}",
+                    repr("one of " + ", ".join(f"'{v}'" for v in dptype._enum))
+                ))
+            emit(checks, f"str({value})")
+            return
+        if type(dptype) in (Integer, Float):
+            checks = []
+            if dptype._values is not None:
+                checks.append((
+                    f"{value} not in "
+                    + self._constant(repr(tuple(dptype._values))),
+                    repr(
+                        "one of " + ", ".join(f"'{v}'" for v in dptype._values)
+                    )
+                ))
+            bounds = [
+                f"{value} {op} {bound!r}" for op, bound in (
+                    ("<=", dptype._min_value),
+                    (">=", dptype._max_value),
+                    ("<", dptype._min_value_inclusive),
+                    (">", dptype._max_value_inclusive),
+                ) if bound is not None
+            ]
+            if bounds:
+                checks.append((
+                    " or ".join(bounds),
+                    repr(f"number in the interval {dptype._verbose_interval}")
+                ))
+            emit(checks, f"{dptype.TYPE.__name__}({value})")
+            return
+        if type(dptype) is Boolean:
+            emit([], f"bool({value})")
+            return
+        if type(dptype) is Null:
+            emit([], "None")
+            return
+        if type(dptype) is Array:
+            if dptype._items is None:
+                emit([], value)
+                return
+            self._emit_array(lines, indent, dptype, path, value, loc, target)
+            return
+        # Object
+        function = self._compile_object(dptype, path)
+        lines.append(pad + f"{r}, {m}, {s}, _ = {function}({value}, {loc})")
+        lines.append(pad + f"{m} = {m} or _R.GOOD.msg")
+        lines.append(pad + f"{s} = {s} or _R.GOOD.status")
+
+    def _emit_array(self, lines, indent, dptype, path, value, loc, target):
+        pad = " " * indent
+        r, m, s = target
+        suffix = next(self._count)
+        element, result = f"element{suffix}", f"array{suffix}"
+        child = (f"r{suffix}", f"m{suffix}", f"s{suffix}")
+        items = dptype._items
+        type_, name = self._type_check(items, (*path, "items"))
+        lines += [
+            pad + f"{result} = []",
+            pad + f"for {element} in {value}:",
+            pad + f"    if not isinstance({element}, {type_}):",
+            pad + f"        {r}, {m}, {s} = None, "
+            + f"f\"Element in '{{{loc}}}' has bad type. Expected "
+            + f"'{{{name}}}' but found '{{type({element}).__name__}}'.\", "
+            + "_R.BAD_TYPE.status",
+            pad + "        break",
+        ]
+        self._emit_make(
+            lines, indent + 4, items, (*path, "items"), element, loc, child
+        )
+        lines += [
+            pad + f"    if {child[2]} != _R.GOOD.status:",
+            pad + f"        {r}, {m}, {s} = None, {child[1]}, {child[2]}",
+            pad + "        break",
+            pad + f"    {result}.append({child[0]})",
+            pad + "else:",
+            pad + f"    {r}, {m}, {s} = {result}, _R.GOOD.msg, _R.GOOD.status",
+        ]
+
+    def _emit_union(self, lines, indent, dptype, path, value, loc, target):
+        pad = " " * indent
+        r, m, s = target
+        suffix = next(self._count)
+        done, last = f"done{suffix}", f"last{suffix}"
+        child = (f"r{suffix}", f"m{suffix}", f"s{suffix}")
+        lines += [pad + f"{done} = False", pad + f"{last} = None"]
+        for index, option in enumerate(dptype._TYPES):
+            type_, _ = self._type_check(option, (*path, ("option", index)))
+            lines.append(
+                pad + f"if not {done} and isinstance({value}, {type_}):"
+            )
+            self._emit_make(
+                lines, indent + 4, option, (*path, ("option", index)),
+                value, loc, child
+            )
+            lines += [
+                pad + f"    if {child[2]} == _R.GOOD.status:",
+                pad + f"        {r}, {m}, {s} = {child[0]}, _R.GOOD.msg, "
+                + "_R.GOOD.status",
+                pad + f"        {done} = True",
+                pad + "    else:",
+                pad + f"        {last} = ({child[1]}, {child[2]})",
+            ]
+        lines += [
+            pad + f"if not {done}:",
+            pad + f"    if {last} is None:",
+            pad + "        raise ValueError(",
+            pad + "            \"Union type constructor called with bad type. \"",
+            pad + f"            + f\"'{{type({value}).__name__}}' not in \"",
+            pad + f"            + {repr(chr(39) + dptype.__name__ + chr(39) + '.')}",
+            pad + "        )",
+            pad + f"    {r}, {m}, {s} = None, {last}[0], {last}[1]",
+        ]
+
+    def _object_compilable(self, object_) -> bool:
+        return all(
+            type(k) is Property and not callable(k.default)
+            for k in object_.properties
+        )
+
+    def _compile_object(self, object_, path) -> str:
+        """Returns name of generated function for `object_`."""
+        if id(object_) in self._objects:
+            return self._objects[id(object_)]
+        name = self._name("object")
+        self._objects[id(object_)] = name
+        lines = [f"def {name}(json, loc):"]
+        if not self._object_compilable(object_):
+            ref = self._reference(path)
+            lines += [
+                f"    output = {ref}.assemble(loc, register=False)"
+                + ".run(json=json)",
+                "    return (",
+                "        output.data.value",
+                "        if output.last_status == _R.GOOD.status else None,",
+                "        output.last_message,",
+                "        output.last_status,",
+                "        output.data.kwargs,",
+                "    )",
+            ]
+            self._functions.append("\n".join(lines))
+            return name
+
+        if object_._passthrough:
+            construct = empty = "_MappingProxyType(json)"
+        elif object_._model is dict:
+            construct, empty = "dict(kwargs)", "{}"
+        else:
+            ref = self._reference(path)
+            construct = f"{ref}._construct(kwargs)"
+            empty = f"{ref}._model()"
+        properties = list(object_.properties.items())
+        if object_._accept_only is None \
+                and object_._additional_properties_typespec is None \
+                and not object_._free_form \
+                and not properties:
+            lines.append(f"    return {empty}, _R.GOOD.msg, _R.GOOD.status, {{}}")
+            self._functions.append("\n".join(lines))
+            return name
+
+        origins = self._constant(
+            f"frozenset({sorted(k.origin for k, _ in properties)!r})"
+        )
+        lines += [
+            "    _loc = loc or \".\"",
+            "    _base = loc or \"\"",
+            "    kwargs = {}",
+        ]
+        exit_ = "        if status >= 400:\n" \
+            + "            return None, msg, status, kwargs"
+        # accept_only
+        if object_._accept_only is not None:
+            accepted = object_._accept_only
+            lines += [
+                "    first = next(",
+                "        (k for k in json.keys() if k not in "
+                + self._constant(f"frozenset({sorted(accepted)!r})")
+                + "), None",
+                "    )",
+                "    if first:",
+                "        status = _R.UNKNOWN_PROPERTY.status",
+                "        msg = _R.UNKNOWN_PROPERTY.msg.format(",
+                "            origin=first, loc=_loc, accepted="
+                + repr(
+                    "accepted: " + ", ".join(f"'{x}'" for x in accepted)
+                    if len(accepted) > 0 else "none accepted"
+                ),
+                "        )",
+                exit_,
+                "    else:",
+                "        status, msg = _R.GOOD.status, _R.GOOD.msg",
+            ]
+        # additional properties
+        if object_._additional_properties_typespec is not None:
+            dptype = object_._additional_properties_typespec
+            type_, type_name = self._type_check(dptype, ("additional",))
+            lines += [
+                "    status, msg = _R.GOOD.status, _R.GOOD.msg",
+                "    additional = {}",
+                "    keys = [k for k in json.keys() if k not in "
+                + f"{origins}]",
+                "    if \"\" in keys:",
+                "        raise ValueError("
+                + "\"Empty Property-name is not allowed.\")",
+                "    for key in keys:",
+                "        value = json[key]",
+                f"        if not isinstance(value, {type_}):",
+                "            status = _R.BAD_TYPE.status",
+                "            msg = _R.BAD_TYPE.msg.format(",
+                "                origin=key, loc=_loc, xp_type="
+                + type_name + ",",
+                "                fnd_type=type(value).__name__",
+                "            )",
+                "            if status >= 400:",
+                "                return None, msg, status, kwargs",
+            ]
+            self._emit_make(
+                lines, 8, dptype, ("additional",), "value",
+                "_base + \".\" + key", ("result", "msg", "status")
+            )
+            lines += [
+                "        if status >= 400:",
+                "            return None, msg, status, kwargs",
+                "        if status == _R.GOOD.status:",
+                "            additional[key] = result",
+                "        status, msg = _R.GOOD.status, _R.GOOD.msg",
+                "    kwargs.update(additional)",
+            ]
+        # free-form
+        if object_._free_form:
+            lines += [
+                "    kwargs.update(",
+                f"        {{k: v for k, v in json.items() if k not in {origins}}}",
+                "    )",
+                "    status, msg = _R.GOOD.status, _R.GOOD.msg",
+            ]
+        # properties
+        for index, (key, dptype) in enumerate(properties):
+            origin = repr(key.origin)
+            lines += [
+                f"    # Property {key.origin!r} (name {key.name!r})",
+                f"    if {origin} in json:",
+                f"        value = json[{origin}]",
+            ]
+            type_, type_name = self._type_check(
+                dptype, (*path, ("value", index))
+            )
+            lines += [
+                f"        if not isinstance(value, {type_}):",
+                "            status = _R.BAD_TYPE.status",
+                "            msg = _R.BAD_TYPE.msg.format(",
+                f"                origin={origin}, loc=_loc, xp_type="
+                + type_name + ",",
+                "                fnd_type=type(value).__name__",
+                "            )",
+                "            if status >= 400:",
+                "                return None, msg, status, kwargs",
+            ]
+            self._emit_make(
+                lines, 8, dptype, (*path, ("value", index)), "value",
+                f"_base + {'.' + key.origin!r}", ("result", "msg", "status")
+            )
+            lines.append(exit_)
+            if not key.validation_only:
+                lines += [
+                    "        if status == _R.GOOD.status:",
+                    f"            kwargs[{key.name!r}] = result",
+                    "        status, msg = _R.GOOD.status, _R.GOOD.msg",
+                ]
+            lines.append("    else:")
+            if key.required and key.default is None:
+                lines += [
+                    "        status = _R.MISSING_REQUIRED.status",
+                    "        msg = _R.MISSING_REQUIRED.msg.format("
+                    + f"loc=_loc, origin={origin})",
+                ]
+            else:
+                lines += [
+                    "        status = _R.MISSING_OPTIONAL.status",
+                    "        msg = _R.MISSING_OPTIONAL.msg",
+                ]
+            lines.append(exit_)
+            if not key.validation_only:
+                if key.default is not None:
+                    default = repr(key.default) \
+                        if _is_literal(key.default) \
+                        else self._reference(
+                            (*path, ("key", index))
+                        ) + ".default"
+                    lines.append(
+                        f"        kwargs[{key.name!r}] = "
+                        + self._constant(default)
+                    )
+                lines.append("        status, msg = _R.GOOD.status, _R.GOOD.msg")
+        lines += [
+            "    if status == _R.GOOD.status:",
+            f"        return {construct}, msg, status, kwargs",
+            "    return None, msg, status, kwargs",
+        ]
+        self._functions.append("\n".join(lines))
+        return name
+
+    def generate(self, schemas: Mapping[str, Any]) -> str:
+        """Returns source of validator-module for `schemas`."""
+        entries = []
+        for schema, object_ in schemas.items():
+            self._schema = schema
+            entries.append(
+                f"{schema} = CompiledValidator("
+                + f"{self._compile_object(object_, ())})"
+            )
+        return "\n".join([
+            '"""',
+            f"Validators generated from '{self._source}' by "
+            + "data_plumber_http.compiler.",
+            "",
+            "Do not edit; regenerate with",
+            f"python -m data_plumber_http.compiler {self._source} "
+            + " ".join(schemas) + " -o <output>",
+            '"""',
+            "# pylint: skip-file",
+            "# flake8: noqa",
+            "from types import MappingProxyType as _MappingProxyType",
+            "import re",
+            "",
+            "from data_plumber_http.settings import Responses",
+            "from data_plumber_http.compiler import CompiledValidator, "
+            + "reference",
+            "",
+            "_R = Responses()",
+            "_NoneType = type(None)",
+            f"_SOURCE = {self._source!r}",
+            *self._header,
+            "",
+            "",
+            "\n\n\n".join(self._functions),
+            "",
+            "",
+            *entries,
+            "",
+            "__all__ = [" + ", ".join(repr(s) for s in schemas) + "]",
+            "",
+        ])
+
+
+def compile_schemas(source: str, names: Optional[list[str]] = None) -> str:
+    """
+    Returns source of a validator-module for the `Object`-schemas in
+    module `source`.
+
+    Keyword arguments:
+    source -- name of module that contains the schemas
+    names -- names of schemas in `source`
+             (default `None`; all `Object`s defined in `source`)
+    """
+    module = importlib.import_module(source)
+    if names is None:
+        names = [
+            k for k, v in vars(module).items()
+            if isinstance(v, Object) and not k.startswith("_")
+        ]
+    schemas = {}
+    for name in names:
+        if not isinstance(schema := getattr(module, name, None), Object):
+            raise ValueError(
+                f"'{name}' in '{source}' is not an 'Object' ({schema})."
+            )
+        schemas[name] = schema
+    return _Generator(source).generate(schemas)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command line interface of the schema compiler."""
+    import argparse
+    import py_compile
+
+    parser = argparse.ArgumentParser(
+        prog="python -m data_plumber_http.compiler",
+        description="Generate validator-module from 'Object'-schemas.",
+    )
+    parser.add_argument("module", help="module containing the schemas")
+    parser.add_argument(
+        "names", nargs="*",
+        help="names of schemas (default: all 'Object's in module)"
+    )
+    parser.add_argument(
+        "-o", "--output", required=True, help="path of generated module"
+    )
+    args = parser.parse_args(argv)
+
+    # allow importing schemas from the working directory
+    sys.path.insert(0, "")
+    with open(args.output, "w", encoding="utf-8") as file:
+        file.write(compile_schemas(args.module, args.names or None))
+    py_compile.compile(args.output, doraise=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,31 @@
-import sys
+from typing import TYPE_CHECKING
+from importlib.util import find_spec
+import importlib
 
-__all__ = []
+if TYPE_CHECKING:  # static re-exports for type checkers (see `__getattr__`)
+    from .flask_input import (
+        flask_handler, flask_args, flask_form, flask_files, flask_values,
+        flask_json
+    )
 
-if "flask" in sys.modules:
-    from .flask_input import flask_handler, flask_args, flask_form, \
-        flask_files, flask_values, flask_json
+# flask-related decorators are loaded lazily on first access (PEP 562)
+_FLASK = [
+    "flask_handler", "flask_args", "flask_form", "flask_files",
+    "flask_values", "flask_json"
+]
 
-    __all__.extend(
-        [
-            "flask_handler", "flask_args", "flask_form", "flask_files",
-            "flask_values", "flask_json"
-        ]
-    )
+__all__ = _FLASK if find_spec("flask") is not None else []
+
+
+def __getattr__(name: str):
+    if name not in _FLASK:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    value = getattr(importlib.import_module(".flask_input", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
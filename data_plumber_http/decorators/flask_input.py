@@ -1,11 +1,15 @@
 
-from typing import Callable
+from typing import Callable, Optional
 from functools import wraps
+from time import perf_counter
 
-from flask import request, Response
+from flask import request, Response, make_response
 from data_plumber import Pipeline
 
 from data_plumber_http.settings import Responses
+from data_plumber_http.metrics import MetricsCollector
+from data_plumber_http.profiling import SamplingProfiler, default_profiler
+from data_plumber_http.registry import SchemaRegistry
 
 
 def flask_args():
@@ -28,7 +32,29 @@ def flask_json():
     return request.json
 
 
-def flask_handler(handler: Pipeline, json: Callable[[], dict]):
+def _add_server_timing(response: Response, timings: dict) -> None:
+    """Add `Server-Timing`-header with `timings` to `response`."""
+    response.headers.add(
+        "Server-Timing",
+        ", ".join(
+            f"{k};dur={timings[k] * 1000:.3f}"
+            for k in ("decode", "validate", "model")
+            if k in timings
+        )
+    )
+
+
+def flask_handler(
+    handler: Pipeline,
+    json: Callable[[], dict],
+    metrics: Optional[MetricsCollector] = None,
+    server_timing: bool | Callable[[], bool] = False,
+    profiler: Optional[SamplingProfiler] = None,
+    partial: bool = False,
+    coerce: bool = False,
+    max_content_length: Optional[int] = None,
+    keep_records: Optional[bool] = None
+):
     """
     Returns decorator for flask view-functions to validate and process
     request-data.
@@ -45,22 +71,131 @@ def flask_handler(handler: Pipeline, json: Callable[[], dict]):
      ...     ...
 
     Keyword arguments:
-    handler -- `Pipeline` to be called
+    handler -- `Pipeline` (or `CompiledValidator`) to be called;
+               registered with the `SchemaRegistry`
     json -- callable that returns the input data as dictionary
+    metrics -- `MetricsCollector` that records duration, status, and
+               payload size of every validation
+               (default `None`)
+    server_timing -- if `True` (or a callable returning `True`, e.g.
+                     `lambda: current_app.debug`), add a
+                     `Server-Timing`-header to the response containing
+                     the time spent on decoding, validating, and
+                     constructing the model
+                     (default `False`)
+    profiler -- `SamplingProfiler` used to profile a sample of the
+                `handler.run`-calls
+                (default `None`; uses profiler configured via
+                environment if available)
+    partial -- if `True`, validate in partial mode (e.g. for
+               PATCH-requests; see `Object.assemble`): required
+               properties may be missing, defaults are not applied, and
+               only the given properties are passed to the view-function
+               (default `False`)
+    coerce -- if `True`, convert string values into the expected scalar
+              types (integer, number, boolean, null) and collect repeated
+              keys for `Array`s (use with `flask_args`, `flask_form`, or
+              `flask_values`; see `Object.assemble`)
+              (default `False`)
+    max_content_length -- maximum size of the request body in bytes;
+                          requests with a larger `Content-Length` are
+                          rejected with `Responses().PAYLOAD_TOO_LARGE`
+                          before the input data is read (note that
+                          `Object.max_json_size` only bounds the compact
+                          JSON-encoding)
+                          (default `None`)
+    keep_records -- if `False`, only keep the last `StageRecord` of
+                    every `Pipeline.run` (records-off mode; see
+                    `data_plumber_http.execution.ExecutionMode`)
+                    (default `None`; use `ExecutionMode().keep_records`)
     """
 
+    _profiler = profiler or default_profiler()
+    SchemaRegistry().register_handler(handler)
+
     def decorator(view):
         @wraps(view)
         def wrapped(*args, **kwargs):
-            output = handler.run(
-                json=json()
-            )
+            timings = {} if (
+                server_timing() if callable(server_timing) else server_timing
+            ) else None
+            if metrics is not None or timings is not None:
+                start = perf_counter()
+            if max_content_length is not None:
+                if request.content_length is None:
+                    # limit bodies without Content-Length (chunked) while
+                    # being read (requires Flask 3.1+)
+                    try:
+                        request.max_content_length = max_content_length
+                    except AttributeError:
+                        pass
+                elif request.content_length > max_content_length:
+                    end = perf_counter()
+                    if metrics is not None:
+                        metrics.observe(
+                            request.endpoint or view.__name__,
+                            end - start,
+                            Responses().PAYLOAD_TOO_LARGE.status,
+                            request.content_length
+                        )
+                    response = Response(
+                        response=Responses().PAYLOAD_TOO_LARGE.msg.format(
+                            size=request.content_length,
+                            max_size=max_content_length
+                        ),
+                        status=Responses().PAYLOAD_TOO_LARGE.status,
+                        mimetype="text/plain"
+                    )
+                    if timings is not None:
+                        # rejected before decoding
+                        timings["validate"] = end - start
+                        _add_server_timing(response, timings)
+                    return response
+            _json = json()
+            run_kwargs = {"json": _json}
+            if partial:
+                run_kwargs["partial"] = True
+            if coerce:
+                run_kwargs["coerce"] = True
+            if keep_records is not None:
+                run_kwargs["keep_records"] = keep_records
+            if timings is not None:
+                decoded = perf_counter()
+                run_kwargs["timings"] = timings
+            if _profiler is not None:
+                output = _profiler.profile(
+                    request.endpoint or view.__name__,
+                    handler.run,
+                    **run_kwargs
+                )
+            else:
+                output = handler.run(**run_kwargs)
+            if metrics is not None or timings is not None:
+                end = perf_counter()
+            if metrics is not None:
+                metrics.observe(
+                    request.endpoint or view.__name__,
+                    end - start,
+                    output.last_status or Responses().GOOD.status,
+                    request.content_length
+                )
+            if timings is not None:
+                timings["decode"] = decoded - start
+                timings["validate"] = end - decoded - timings.get("model", 0)
             if output.last_status != Responses().GOOD.status:
-                return Response(
+                response = Response(
                     response=output.last_message,
                     status=output.last_status,
                     mimetype="text/plain"
                 )
-            return view(*args, **(kwargs | output.data.value))
+            elif timings is None:
+                return view(*args, **(kwargs | output.data.value))
+            else:
+                response = make_response(
+                    view(*args, **(kwargs | output.data.value))
+                )
+            if timings is not None:
+                _add_server_timing(response, timings)
+            return response
         return wrapped
     return decorator
@@ -0,0 +1,346 @@
+from typing import Optional, Any, Generator, Mapping
+from types import MappingProxyType
+
+from data_plumber.output import PipelineOutput, StageRecord
+
+from data_plumber_http.output import Output
+from data_plumber_http.settings import Responses
+from data_plumber_http.coercion import coerce as _coerce
+from data_plumber_http.registry import SchemaRegistry
+from data_plumber_http.keys import Property
+from data_plumber_http.types import DPType, Object, Array
+from data_plumber_http.types.ref import Ref
+
+
+# a frame either requests the validation of a child (yields a tuple of
+# `DPType`, json, loc, and partial-flag) or returns its result
+Frame = Generator[tuple[DPType, Any, Optional[str], bool], tuple, tuple]
+
+
+class IterativeValidator:
+    """
+    Validator that walks a document with an explicit work stack instead
+    of nested `Pipeline`-runs. It produces the same output (value,
+    message, and status) as the `Pipeline` returned by
+    `Object.assemble` while the depth of the Python stack does not grow
+    with the nesting depth of the document. Can be used in place of that
+    `Pipeline` (e.g. as `handler` in `flask_handler`).
+
+    `Ref`s are resolved to their targets. `Object`s with keys other than
+    `Property` (`OneOf`/`AllOf`) or with callable defaults are validated
+    by their regular `Pipeline`.
+
+    Keyword arguments:
+    object_ -- schema to be validated against
+    """
+
+    def __init__(self, object_: Object) -> None:
+        self._object = object_
+        self._supported: dict[Object, bool] = {}
+
+    def run(
+        self, json, partial: bool = False, coerce: bool = False, **kwargs
+    ) -> PipelineOutput:
+        """
+        Returns `PipelineOutput` with the result of the validation of
+        `json` (a single record containing the final message and
+        status).
+
+        Keyword arguments:
+        json -- data to be validated
+        partial -- if `True`, validate in partial mode (see
+                   `Object.assemble`)
+                   (default `False`)
+        coerce -- if `True`, coerce string values of the top-level
+                  `Object` (see `Object.assemble`)
+                  (default `False`)
+        """
+        value, msg, status, data = self._evaluate(
+            self._object, json, None, partial, coerce
+        )
+        return PipelineOutput(
+            [StageRecord(0, "iterative", msg, status)],
+            kwargs | {"json": json} | ({"partial": True} if partial else {})
+            | ({"coerce": True} if coerce else {}),
+            Output(value, data)
+        )
+
+    def make(
+        self, json, loc: Optional[str] = None, partial: bool = False
+    ) -> tuple[Any, str, int]:
+        """
+        Validate and instantiate type based on `json` (equivalent to
+        `Object.make`).
+        """
+        value, msg, status, _ = self._evaluate(
+            self._object, json, loc, partial
+        )
+        return (
+            value,
+            msg or Responses().GOOD.msg,
+            status or Responses().GOOD.status
+        )
+
+    def _evaluate(
+        self,
+        dptype: DPType,
+        json,
+        loc: Optional[str],
+        partial: bool = False,
+        coerce: bool = False
+    ) -> tuple:
+        """
+        Returns result of validating `json` against `dptype` at `loc`.
+        Frames are resumed from a single loop such that the Python stack
+        does not grow with the depth of `json`.
+        """
+        root = self._frame(dptype, json, loc, partial, coerce)
+        if isinstance(root, tuple):
+            return root
+        stack = [root]
+        result: Any = None
+        while stack:
+            try:
+                request = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+                if stack:
+                    result = self._child_result(result)
+                continue
+            child = self._frame(*request)
+            if isinstance(child, tuple):
+                result = self._child_result(child)
+            else:
+                stack.append(child)
+                result = None
+        return result
+
+    @staticmethod
+    def _child_result(result: tuple) -> tuple:
+        """
+        Returns result in the format of `DPType.make` (`Object`-results
+        also contain kwargs).
+        """
+        if len(result) == 4:
+            return (
+                result[0],
+                result[1] or Responses().GOOD.msg,
+                result[2] or Responses().GOOD.status
+            )
+        return result
+
+    def _frame(
+        self,
+        dptype: DPType,
+        json,
+        loc: Optional[str],
+        partial: bool = False,
+        coerce: bool = False
+    ) -> Frame | tuple:
+        """
+        Returns either a `Frame` for `dptype` or, if `dptype` is not
+        processed by this engine, the result of its `make`. `partial`
+        and `coerce` only apply to `Object`s.
+        """
+        while type(dptype) is Ref:
+            dptype = dptype.target
+        if type(dptype) is Object:
+            if self._is_supported(dptype):
+                return self._object_frame(dptype, json, loc, partial, coerce)
+            pipeline = SchemaRegistry().pipeline(dptype, loc)
+            if partial or coerce:
+                output = pipeline.run(
+                    json=json,
+                    **({"partial": True} if partial else {}),
+                    **({"coerce": True} if coerce else {})
+                )
+            else:
+                output = pipeline.run(json=json)
+            return (
+                output.data.value
+                if output.last_status == Responses().GOOD.status else None,
+                output.last_message,
+                output.last_status,
+                output.data.kwargs
+            )
+        if type(dptype) is Array and dptype._items is not None \
+                and type(dptype._items).make_many is DPType.make_many:
+            return self._array_frame(dptype._items, json, loc)
+        if self._is_union(dptype):
+            return self._union_frame(dptype, json, loc)
+        # only the top-level `Object` has no location
+        return dptype.make(json, loc)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _is_union(dptype: DPType) -> bool:
+        return hasattr(dptype, "_TYPES") \
+            and type(dptype).__qualname__ == "DPType.__or__.<locals>._"
+
+    def _is_supported(self, object_: Object) -> bool:
+        """Returns `True` if `object_` is processed by this engine."""
+        try:
+            return self._supported[object_]
+        except KeyError:
+            supported = self._supported[object_] = all(
+                type(k) is Property and not callable(k.default)
+                for k in object_.properties
+            )
+            return supported
+
+    @staticmethod
+    def _object_frame(
+        object_: Object, json, loc: Optional[str], partial: bool,
+        coerce: bool = False
+    ) -> Frame:
+        """
+        Frame for an `Object`; returns value, message, status, and the
+        collected kwargs (equivalent to the `Pipeline` from
+        `Object.assemble`).
+        """
+        _loc = loc or "."
+        base = loc or ""
+        kwargs: dict = {}
+        # only `Property`-keys and `DPType`-values (see `_is_supported`)
+        properties: Mapping[Property, DPType] = \
+            object_.properties  # type: ignore[assignment]
+        if object_._accept_only is None \
+                and object_._additional_properties_typespec is None \
+                and not object_._free_form \
+                and not properties:
+            return (
+                {} if partial else object_._model(), Responses().GOOD.msg,
+                Responses().GOOD.status, kwargs
+            )
+        status, msg = Responses().GOOD.status, Responses().GOOD.msg
+        # accept only
+        if object_._accept_only is not None:
+            accepted = object_._accept_only
+            first = next((k for k in json.keys() if k not in accepted), None)
+            if first:
+                status = Responses().UNKNOWN_PROPERTY.status
+                msg = Responses().UNKNOWN_PROPERTY.msg.format(
+                    origin=first,
+                    loc=_loc,
+                    accepted="accepted: " + ", ".join(
+                        map(lambda x: f"'{x}'", accepted)
+                    ) if len(accepted) > 0 else "none accepted"
+                )
+                if status >= 400:
+                    return None, msg, status, kwargs
+        origins = {k.origin for k in properties}
+        # additional properties
+        if (dptype := object_._additional_properties_typespec) is not None:
+            keys = [k for k in json.keys() if k not in origins]
+            if "" in keys:
+                raise ValueError("Empty Property-name is not allowed.")
+            additional = {}
+            for key in keys:
+                value = _coerce(json, key, dptype) if coerce else json[key]
+                if not isinstance(value, dptype.TYPE):
+                    status = Responses().BAD_TYPE.status
+                    msg = Responses().BAD_TYPE.msg.format(
+                        origin=key, loc=_loc, xp_type=dptype.__name__,
+                        fnd_type=type(json[key]).__name__
+                    )
+                    if status >= 400:
+                        return None, msg, status, kwargs
+                result, msg, status = yield (
+                    dptype, value, base + "." + key, partial
+                )
+                if status >= 400:
+                    return None, msg, status, kwargs
+                if status == Responses().GOOD.status:
+                    additional[key] = result
+                status, msg = Responses().GOOD.status, Responses().GOOD.msg
+            kwargs.update(additional)
+        # free form
+        if object_._free_form:
+            kwargs.update({k: v for k, v in json.items() if k not in origins})
+            status, msg = Responses().GOOD.status, Responses().GOOD.msg
+        # properties
+        for key, dptype in properties.items():
+            if key.origin in json:
+                value = _coerce(json, key.origin, dptype) if coerce \
+                    else json[key.origin]
+                if not isinstance(value, dptype.TYPE):
+                    status = Responses().BAD_TYPE.status
+                    msg = Responses().BAD_TYPE.msg.format(
+                        origin=key.origin, loc=_loc, xp_type=dptype.__name__,
+                        fnd_type=type(json[key.origin]).__name__
+                    )
+                    if status >= 400:
+                        return None, msg, status, kwargs
+                result, msg, status = yield (
+                    dptype, value, base + "." + key.origin, partial
+                )
+                if status >= 400:
+                    return None, msg, status, kwargs
+                if key.validation_only:
+                    continue
+                if status == Responses().GOOD.status:
+                    kwargs[key.name] = result
+            else:
+                if key.required and key.default is None and not partial:
+                    status = Responses().MISSING_REQUIRED.status
+                    msg = Responses().MISSING_REQUIRED.msg.format(
+                        loc=_loc, origin=key.origin
+                    )
+                else:
+                    status = Responses().MISSING_OPTIONAL.status
+                    msg = Responses().MISSING_OPTIONAL.msg
+                if status >= 400:
+                    return None, msg, status, kwargs
+                if key.validation_only:
+                    continue
+                if key.default is not None and not partial:
+                    kwargs[key.name] = key.default
+            status, msg = Responses().GOOD.status, Responses().GOOD.msg
+        if status == Responses().GOOD.status:
+            if object_._passthrough:
+                return (
+                    dict(kwargs) if coerce else MappingProxyType(json),
+                    msg, status, kwargs
+                )
+            return (
+                dict(kwargs) if partial else object_._construct(kwargs),
+                msg, status, kwargs
+            )
+        return None, msg, status, kwargs
+
+    @staticmethod
+    def _array_frame(items: DPType, json, loc: Optional[str]) -> Frame:
+        """Frame for the items of an `Array` (see `DPType.make_many`)."""
+        array = []
+        for element in json:
+            if not isinstance(element, items.TYPE):
+                return (
+                    None,
+                    f"Element in '{loc}' has bad type. Expected "
+                    + f"'{items.__name__}' but found "
+                    + f"'{type(element).__name__}'.",
+                    Responses().BAD_TYPE.status
+                )
+            child = yield (items, element, loc, False)
+            if child[2] != Responses().GOOD.status:
+                return (None, child[1], child[2])
+            array.append(child[0])
+        return (array, Responses().GOOD.msg, Responses().GOOD.status)
+
+    @staticmethod
+    def _union_frame(dptype: DPType, json, loc: Optional[str]) -> Frame:
+        """Frame for a union type (see `DPType.__or__`)."""
+        last = None
+        for option in dptype._TYPES:  # type: ignore[attr-defined]
+            if not isinstance(json, option.TYPE):
+                continue
+            last = yield (option, json, loc, False)
+            if last[2] != Responses().GOOD.status:
+                continue
+            return (last[0], Responses().GOOD.msg, Responses().GOOD.status)
+        if last is not None:
+            return (None, last[1], last[2])
+        raise ValueError(
+            "Union type constructor called with bad type. "
+            + f"'{type(json).__name__}' not in '{dptype.__name__}'."
+        )
@@ -0,0 +1,274 @@
+from typing import Optional, Callable, Any
+from functools import partial
+import threading
+
+from data_plumber import Pipeline as _Pipeline, Stage
+from data_plumber.context import PipelineContext
+from data_plumber.error import PipelineError
+from data_plumber.output import StageRecord, PipelineOutput
+
+
+# internals of `data_plumber.Pipeline` (1.15) that are used for the
+# records-off mode; `Pipeline`s fall back to regular execution if any of
+# these are missing
+_INTERNALS = (
+    "_pipeline", "_stage_catalog", "_loop", "_initialize_output",
+    "_exit_on_status", "_validate_external_kwargs",
+)
+
+
+class ExecutionMode:
+    """
+    ExecutionMode-singleton that configures the execution of the
+    `Pipeline`s generated by `Object.assemble` and `DPKey.assemble`.
+
+    Properties:
+    keep_records -- if `False`, a `Pipeline.run` only keeps the last
+                    `StageRecord` (records-off mode; the final status
+                    and message are still available as
+                    `PipelineOutput.last_status`/`last_message`); can be
+                    overridden for individual runs via the `run`-argument
+                    `keep_records` (e.g. `flask_handler(keep_records=..)`)
+                    (default `True`)
+    """
+
+    _instance = None
+    keep_records: bool = True
+    _local: threading.local
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.keep_records = True
+            cls._instance._local = threading.local()
+        return cls._instance
+
+    @property
+    def current(self) -> bool:
+        """
+        Returns the mode that applies to a `Pipeline.run` in the current
+        thread (the mode of an enclosing run or `keep_records`).
+        """
+        keep_records = getattr(self._local, "keep_records", None)
+        if keep_records is None:
+            return self.keep_records
+        return keep_records
+
+
+class Pipeline(_Pipeline):
+    """
+    `data_plumber.Pipeline` that supports the records-off mode of
+    `ExecutionMode`.
+
+    In records-off mode, only the last `StageRecord` is kept and
+    requirements of `Stage`s are resolved based on the latest status per
+    `Stage`-identifier. `Pipeline`s that contain `Fork`s, loop, or use
+    other requirements than references by identifier are always executed
+    regularly (as are all `Pipeline`s if the installed version of
+    `data_plumber` does not provide the required internals).
+
+    In both modes, `finalize_output` additionally receives the status
+    and message of the last executed `Stage` as `last_status` and
+    `last_message` (both `None` if no `Stage` has been executed) such
+    that it does not depend on the records.
+    """
+
+    def __init__(
+        self,
+        *args,
+        finalize_output: Optional[Callable[..., Any]] = None,
+        **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._finalizer = finalize_output
+        self._compatible = all(hasattr(self, name) for name in _INTERNALS)
+        self._planned = False
+        self._plan: Optional[dict[str, list[tuple[str, Any]]]] = None
+        self._referenced: set[str] = set()
+
+    def append(self, element, **kwargs) -> None:
+        super().append(element, **kwargs)
+        self._planned = False
+
+    def prepend(self, element, **kwargs) -> None:
+        super().prepend(element, **kwargs)
+        self._planned = False
+
+    def insert(self, index: int, element, **kwargs) -> None:
+        super().insert(index, element, **kwargs)
+        self._planned = False
+
+    def _requirements(self) -> Optional[dict[str, list[tuple[str, Any]]]]:
+        """
+        Returns mapping of `Stage`-identifiers to their requirements as
+        pairs of referenced identifier and required status (or `None` if
+        this `Pipeline` does not support the records-off mode).
+        """
+        if self._planned:
+            return self._plan
+        plan: Optional[dict[str, list[tuple[str, Any]]]] = \
+            None if not self._compatible or self._loop else {}
+        context = PipelineContext(self._pipeline, 0, False, [], {}, None, -1)
+        for id_ in self._pipeline:
+            if plan is None:
+                break
+            s = self._stage_catalog.get(id_)
+            if s is None:
+                continue
+            if not isinstance(s, Stage):
+                plan = None
+                continue
+            if s.requires is None:
+                continue
+            requirements = []
+            for ref, req in s.requires.items():
+                # only references by identifier are supported
+                if not ref.__qualname__.startswith("StageById."):
+                    plan = None
+                    break
+                try:
+                    ref_id = ref.get(context).stage
+                except PipelineError:
+                    plan = None
+                    break
+                if not isinstance(self._stage_catalog.get(ref_id), Stage):
+                    plan = None
+                    break
+                requirements.append((ref_id, req))
+            if plan is not None:
+                plan[id_] = requirements
+        self._planned, self._plan = True, plan
+        self._referenced = {
+            ref_id
+            for requirements in (plan or {}).values()
+            for ref_id, _ in requirements
+        }
+        return plan
+
+    def run(
+        self,
+        finalize_output: Optional[Callable[..., Any]] = None,
+        keep_records: Optional[bool] = None,
+        **kwargs
+    ) -> PipelineOutput:
+        """
+        Trigger `Pipeline` execution (see `data_plumber.Pipeline.run`).
+
+        Keyword arguments:
+        finalize_output -- callable that overrides the `Pipeline`'s
+                           `finalize_output` (constructor-argument)
+                           (default `None`)
+        keep_records -- if `False`, only keep the last `StageRecord`;
+                        applies to nested `Pipeline.run`s as well
+                        (default `None`; use mode of an enclosing run
+                        or `ExecutionMode().keep_records`)
+        kwargs -- keyword arguments that are forwarded into
+                  `_PipelineComponent`s
+        """
+        mode = ExecutionMode()
+        local = mode._local
+        previous = getattr(local, "keep_records", None)
+        if keep_records is None:
+            keep_records = mode.keep_records if previous is None \
+                else previous
+        local.keep_records = keep_records
+        finalizer = finalize_output or self._finalizer
+        try:
+            if keep_records or (plan := self._requirements()) is None:
+                return super().run(
+                    None if finalizer is None
+                    else partial(self._finalize, finalizer),
+                    **kwargs
+                )
+            return self._run_last_record(plan, finalizer, kwargs)
+        finally:
+            local.keep_records = previous
+
+    @staticmethod
+    def _finalize(
+        finalizer: Callable[..., Any], data, records: list[StageRecord],
+        **kwargs
+    ) -> None:
+        """
+        Calls `finalizer` with the status and message of the last record
+        of a regular run.
+        """
+        last = records[-1] if records else None
+        finalizer(
+            data=data, records=records,
+            last_status=None if last is None else last.status,
+            last_message=None if last is None else last.message,
+            **kwargs
+        )
+
+    def _run_last_record(
+        self,
+        plan: dict[str, list[tuple[str, Any]]],
+        finalize_output: Optional[Callable[..., Any]],
+        kwargs: dict
+    ) -> PipelineOutput:
+        """Execute `Pipeline` in records-off mode."""
+        self._validate_external_kwargs(**kwargs)
+        data = self._initialize_output()
+        statuses: dict[str, int] = {}
+        last = None
+        count = -1
+        for index, _s in enumerate(self._pipeline):
+            s = self._stage_catalog.get(_s)
+            # empty component (other components are excluded by the plan)
+            if not isinstance(s, Stage):
+                continue
+            # requires
+            if _s in plan \
+                    and not self._meets_plan(_s, plan[_s], statuses):
+                continue
+            count = count + 1
+            primer = s.primer(**kwargs, out=data, count=count)
+            s.action(**kwargs, out=data, primer=primer, count=count)
+            exported_kwargs = s.export(
+                **kwargs, out=data, primer=primer, count=count
+            )
+            if exported_kwargs:
+                self._validate_external_kwargs(**exported_kwargs)
+                kwargs.update(exported_kwargs)
+            status = s.status(**kwargs, out=data, primer=primer, count=count)
+            msg = s.message(
+                **kwargs, out=data, primer=primer, count=count, status=status
+            )
+            if _s in self._referenced:
+                statuses[_s] = status
+            last = (index, _s, msg, status)
+            if self._exit_on_status(status):
+                break
+
+        records = [] if last is None else [StageRecord(*last)]
+        if finalize_output is not None:
+            finalize_output(
+                data=data, records=records,
+                last_status=None if last is None else last[3],
+                last_message=None if last is None else last[2],
+                **kwargs
+            )
+        return PipelineOutput(records, kwargs, data)
+
+    @staticmethod
+    def _meets_plan(
+        _s: str, requirements: list[tuple[str, Any]], statuses: dict
+    ) -> bool:
+        """
+        Returns `True` if the requirements of `Stage` `_s` are met
+        (analogous to `data_plumber.Pipeline._meets_requirements`).
+        """
+        for ref_id, req in requirements:
+            match_status = statuses.get(ref_id)
+            if match_status is None:
+                raise PipelineError(
+                    f"Referenced Stage '{ref_id}' (required by Stage"
+                    + f" '{_s}') has not been executed yet."
+                )
+            if callable(req):
+                if not req(status=match_status):
+                    return False
+            elif match_status != req:
+                return False
+        return True
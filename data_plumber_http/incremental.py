@@ -0,0 +1,365 @@
+from typing import Any, Optional, Callable
+from dataclasses import dataclass, field
+import re
+
+from data_plumber.output import PipelineOutput, StageRecord
+
+from data_plumber_http.output import Output
+from data_plumber_http.types import DPType, Object
+from data_plumber_http.engine import IterativeValidator
+
+
+_ARRAY_INDEX = re.compile(r"0|[1-9][0-9]*")
+
+
+def _tokens(pointer: str) -> list[str]:
+    """Returns reference tokens of JSON pointer (RFC 6901)."""
+    if not isinstance(pointer, str) \
+            or (pointer != "" and not pointer.startswith("/")):
+        raise ValueError(f"Bad JSON pointer '{pointer}'.")
+    if pointer == "":
+        return []
+    return [
+        t.replace("~1", "/").replace("~0", "~")
+        for t in pointer[1:].split("/")
+    ]
+
+
+def _key(
+    container: Any, token: str, pointer: str, append: bool = False
+) -> int | str:
+    """
+    Returns key for `token` in `container`; if `append`, the index may
+    point to the end of a list (including "-").
+    """
+    if isinstance(container, dict):
+        return token
+    if isinstance(container, list):
+        if append and token == "-":
+            return len(container)
+        if _ARRAY_INDEX.fullmatch(token) is None \
+                or int(token) > len(container) - (0 if append else 1):
+            raise ValueError(f"Bad array index in JSON pointer '{pointer}'.")
+        return int(token)
+    raise ValueError(
+        f"JSON pointer '{pointer}' references a child of a non-container."
+    )
+
+
+def _get(document: Any, tokens: list[str], pointer: str) -> Any:
+    """Returns value referenced by `tokens` in `document`."""
+    node = document
+    for token in tokens:
+        key = _key(node, token, pointer)
+        if isinstance(node, dict) and key not in node:
+            raise ValueError(f"Path '{pointer}' does not exist.")
+        node = node[key]
+    return node
+
+
+def _update(
+    document: Any,
+    tokens: list[str],
+    pointer: str,
+    change: Callable[[Any, str], None]
+) -> Any:
+    """
+    Returns copy of `document` where the parent of the location
+    referenced by `tokens` has been modified by `change` (which gets
+    passed a shallow copy of the parent and the last token). Only the
+    containers along the path are copied.
+    """
+    parents = [document]
+    for token in tokens[:-1]:
+        parents.append(_get(parents[-1], [token], pointer))
+    if not isinstance(parents[-1], (dict, list)):
+        raise ValueError(
+            f"JSON pointer '{pointer}' references a child of a non-container."
+        )
+    node = type(parents[-1])(parents[-1])
+    change(node, tokens[-1])
+    for parent, token in zip(reversed(parents[:-1]), reversed(tokens[:-1])):
+        copy = type(parent)(parent)
+        copy[_key(parent, token, pointer)] = node
+        node = copy
+    return node
+
+
+def _add(document: Any, tokens: list[str], pointer: str, value: Any) -> Any:
+    if not tokens:
+        return value
+
+    def change(container, token):
+        if isinstance(container, list):
+            container.insert(_key(container, token, pointer, True), value)
+        else:
+            container[token] = value
+    return _update(document, tokens, pointer, change)
+
+
+def _remove(document: Any, tokens: list[str], pointer: str) -> Any:
+    if not tokens:
+        raise ValueError("Unable to remove the root of a document.")
+
+    def change(container, token):
+        key = _key(container, token, pointer)
+        if isinstance(container, dict) and key not in container:
+            raise ValueError(f"Path '{pointer}' does not exist.")
+        del container[key]
+    return _update(document, tokens, pointer, change)
+
+
+def _replace(
+    document: Any, tokens: list[str], pointer: str, value: Any
+) -> Any:
+    if not tokens:
+        return value
+
+    def change(container, token):
+        key = _key(container, token, pointer)
+        if isinstance(container, dict) and key not in container:
+            raise ValueError(f"Path '{pointer}' does not exist.")
+        container[key] = value
+    return _update(document, tokens, pointer, change)
+
+
+def _equal(a: Any, b: Any) -> bool:
+    """Returns `True` if `a` and `b` are equal JSON-values."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def apply_patch(document: Any, patch: list[dict]) -> Any:
+    """
+    Returns result of applying the JSON Patch (RFC 6902) `patch` to
+    `document`. `document` itself is not modified; the result shares all
+    containers that are not on a changed path with `document`. Raises
+    `ValueError` if the patch cannot be applied.
+
+    Keyword arguments:
+    document -- JSON-document
+    patch -- list of operations
+    """
+    for operation in patch:
+        try:
+            op, pointer = operation["op"], operation["path"]
+        except (KeyError, TypeError) as exc_info:
+            raise ValueError(
+                f"Bad JSON Patch operation '{operation}'."
+            ) from exc_info
+        tokens = _tokens(pointer)
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise ValueError(f"Missing 'value' in operation '{operation}'.")
+        if op in ("move", "copy"):
+            if "from" not in operation:
+                raise ValueError(
+                    f"Missing 'from' in operation '{operation}'."
+                )
+            source = _tokens(operation["from"])
+        match op:
+            case "add":
+                document = _add(document, tokens, pointer, operation["value"])
+            case "remove":
+                document = _remove(document, tokens, pointer)
+            case "replace":
+                document = _replace(
+                    document, tokens, pointer, operation["value"]
+                )
+            case "move":
+                if tokens[:len(source)] == source and tokens != source:
+                    raise ValueError(
+                        f"Unable to move '{operation['from']}' into itself."
+                    )
+                value = _get(document, source, operation["from"])
+                document = _remove(document, source, operation["from"])
+                document = _add(document, tokens, pointer, value)
+            case "copy":
+                value = _get(document, source, operation["from"])
+                document = _add(document, tokens, pointer, value)
+            case "test":
+                if not _equal(
+                    _get(document, tokens, pointer), operation["value"]
+                ):
+                    raise ValueError(f"Test of '{pointer}' failed.")
+            case _:
+                raise ValueError(f"Unknown JSON Patch operation '{op}'.")
+    return document
+
+
+class _Node:
+    """Cached result for a container in a validated document."""
+    __slots__ = ("json", "result", "children")
+
+    def __init__(self, json: Any, children: dict) -> None:
+        self.json = json
+        self.result: Optional[tuple] = None
+        self.children = children
+
+
+class _Scope:
+    """
+    Nodes of the children of a container in the previous and in the
+    current validation.
+    """
+    __slots__ = ("previous", "current", "counts", "_identity")
+
+    def __init__(self, previous: dict) -> None:
+        self.previous = previous
+        self.current: dict = {}
+        self.counts: dict = {}
+        self._identity: Optional[dict] = None
+
+    def find(self, key: tuple, json: Any) -> Optional[_Node]:
+        """
+        Returns previous node at position `key` or, if the position
+        does not match `json` (e.g. after inserting into a list), the
+        previous node for `json` itself.
+        """
+        node = self.previous.get(key)
+        if node is not None and node.json is json:
+            return node
+        if self._identity is None:
+            self._identity = {
+                (k[0], k[1], id(n.json)): n for k, n in self.previous.items()
+            }
+        return self._identity.get((key[0], key[1], id(json)), node)
+
+
+class _CachingValidator(IterativeValidator):
+    """
+    `IterativeValidator` that reuses the results for containers that
+    have not changed since the previous validation (identified by
+    object identity).
+    """
+
+    def __init__(self, object_: Object, previous: dict) -> None:
+        super().__init__(object_)
+        self._scope = _Scope(previous)
+        self.tree = self._scope.current
+        self.validated = 0
+
+    def _frame(
+        self, dptype: DPType, json, loc: Optional[str], partial=False,
+        coerce=False
+    ):
+        if coerce or not isinstance(json, (dict, list)):
+            return super()._frame(dptype, json, loc, partial, coerce)
+        scope = self._scope
+        base = (id(dptype), loc)
+        count = scope.counts.get(base, 0)
+        scope.counts[base] = count + 1
+        key = (*base, count)
+        previous = scope.find(key, json)
+        if previous is not None and previous.json is json:
+            scope.current[key] = previous
+            return previous.result
+        self.validated += 1
+        child_scope = _Scope(previous.children if previous else {})
+        node = scope.current[key] = _Node(json, child_scope.current)
+        frame = super()._frame(dptype, json, loc, partial)
+        if isinstance(frame, tuple):
+            node.result = frame
+            return frame
+        return self._record(frame, node, child_scope)
+
+    def _record(self, frame, node: _Node, scope: _Scope):
+        """Wraps `frame` to associate its requests with `scope`."""
+        result = None
+        while True:
+            self._scope = scope
+            try:
+                request = frame.send(result)
+            except StopIteration as stop:
+                node.result = stop.value
+                return stop.value
+            result = yield request
+
+
+@dataclass
+class IncrementalResult:
+    """
+    Result of `IncrementalValidator.validate`.
+
+    Keyword arguments:
+    json -- validated document
+    output -- `PipelineOutput` of the validation (a single record
+              containing the final message and status)
+    validated -- number of containers (objects and arrays) in `json`
+                 that have been validated (i.e. not been reused)
+    """
+    json: Any
+    output: PipelineOutput
+    validated: int
+    _tree: dict = field(default_factory=dict, repr=False)
+
+
+class IncrementalValidator:
+    """
+    Validator for documents that change in small steps. After an
+    initial validation, a document can be revalidated based on the
+    previous result and a JSON Patch (RFC 6902). Only the containers
+    on the changed paths are validated again, while the results (and
+    models) of all other parts are reused from the previous result
+    (the models of unchanged parts are shared between results).
+
+    Validation is based on the `IterativeValidator` and produces the
+    same output. Documents must not be modified in place after
+    validation (`apply_patch` returns a modified copy).
+
+    Keyword arguments:
+    object_ -- schema to be validated against
+    """
+
+    def __init__(self, object_: Object) -> None:
+        self._object = object_
+
+    def validate(
+        self, json, previous: Optional[IncrementalResult] = None
+    ) -> IncrementalResult:
+        """
+        Returns `IncrementalResult` of the validation of `json`.
+
+        Keyword arguments:
+        json -- document to be validated
+        previous -- result of a previous validation; containers of
+                    `json` that are identical (same object) to those in
+                    `previous.json` are not validated again
+                    (default `None`)
+        """
+        engine = _CachingValidator(
+            self._object, previous._tree if previous is not None else {}
+        )
+        value, msg, status, data = engine._evaluate(self._object, json, None)
+        return IncrementalResult(
+            json,
+            PipelineOutput(
+                [StageRecord(0, "incremental", msg, status)],
+                {"json": json},
+                Output(value, data)
+            ),
+            engine.validated,
+            engine.tree
+        )
+
+    def revalidate(
+        self, previous: IncrementalResult, patch: list[dict]
+    ) -> IncrementalResult:
+        """
+        Returns `IncrementalResult` of the validation of the document
+        that results from applying `patch` to `previous.json` (see
+        `apply_patch`).
+
+        Keyword arguments:
+        previous -- result of a previous validation
+        patch -- JSON Patch (list of operations)
+        """
+        return self.validate(apply_patch(previous.json, patch), previous)
@@ -0,0 +1,220 @@
+from typing import Callable
+from dataclasses import dataclass
+from time import perf_counter_ns
+import os
+import threading
+
+from data_plumber import Stage
+
+
+@dataclass
+class StageReport:
+    """
+    Timing-report for a single execution of a `Stage`.
+
+    Keyword arguments:
+    loc -- location of the associated `Object` in the input
+    name -- name of the associated `DPKey` (empty for `Object`-level
+            `Stage`s)
+    stage -- `Stage` identifier within its `Pipeline`
+    status -- status returned by the `Stage`
+    duration -- wall time in nanoseconds (including nested `Stage`s)
+    self_duration -- wall time in nanoseconds (excluding nested
+                     `Stage`s)
+    stack -- labels of all `Stage`s that were active during this
+             execution (outermost first, ending with this `Stage`)
+    """
+    loc: str
+    name: str
+    stage: str
+    status: int
+    duration: int
+    self_duration: int
+    stack: tuple[str, ...]
+
+
+class Instrumentation:
+    """
+    Instrumentation-singleton that manages timing-hooks for the
+    `Pipeline`s generated by `Object.assemble` and `DPKey.assemble`.
+
+    Every registered hook is called with a `StageReport` after a
+    `Stage` has been executed. `Stage`s are only instrumented if at least
+    one hook is registered at the time of calling `assemble`; otherwise
+    the uninstrumented `Stage`s are used.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._hooks = []
+            cls._instance._local = threading.local()
+        return cls._instance
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any hook is registered."""
+        return len(self._hooks) > 0  # type: ignore[attr-defined]
+
+    def register(self, hook: Callable[[StageReport], None]) -> None:
+        """
+        Register `hook`.
+
+        Keyword arguments:
+        hook -- callable that accepts a `StageReport`
+        """
+        self._hooks.append(hook)  # type: ignore[attr-defined]
+
+    def unregister(self, hook: Callable[[StageReport], None]) -> None:
+        """
+        Unregister `hook`.
+
+        Keyword arguments:
+        hook -- previously registered callable
+        """
+        self._hooks.remove(hook)  # type: ignore[attr-defined]
+
+    def _frames(self) -> list:
+        try:
+            return self._local.frames  # type: ignore[attr-defined]
+        except AttributeError:
+            self._local.frames = []  # type: ignore[attr-defined]
+            return self._local.frames  # type: ignore[attr-defined]
+
+    def stage(self, stage: Stage, loc: str, name: str, id_: str) -> Stage:
+        """
+        Returns instrumented version of `stage` (or `stage` itself if
+        no hook is registered).
+
+        Keyword arguments:
+        stage -- `Stage` to be instrumented
+        loc -- location of the associated `Object`
+        name -- name of the associated `DPKey`
+        id_ -- identifier of `stage` in its `Pipeline`
+        """
+        if not self.enabled:
+            return stage
+        # Object-level Stage-identifiers already contain loc
+        label = loc + ("" if loc.endswith(".") else ".") + id_ \
+            if name else id_
+        token = object()
+
+        def primer(**kwargs):
+            # frame: token, label, start, time spent in nested Stages
+            frame = [token, label, perf_counter_ns(), 0]
+            frames = self._frames()
+            frames.append(frame)
+            try:
+                return stage.primer(**kwargs)
+            except BaseException:
+                frames.remove(frame)
+                raise
+
+        def message(status, **kwargs):
+            msg = stage.message(status=status, **kwargs)
+            end = perf_counter_ns()
+            frames = self._frames()
+            # drop frames of Stages that did not finish (exceptions)
+            while frames and frames[-1][0] is not token:
+                frames.pop()
+            if not frames:
+                return msg
+            stack = tuple(f[1] for f in frames)
+            _, _, start, nested = frames.pop()
+            duration = end - start
+            if frames:
+                frames[-1][3] += duration
+            report = StageReport(
+                loc, name, id_, status, duration, duration - nested, stack
+            )
+            for hook in self._hooks:  # type: ignore[attr-defined]
+                hook(report)
+            return msg
+
+        return Stage(
+            requires=stage.requires,  # type: ignore[arg-type]
+            primer=primer,
+            action=stage.action,
+            export=stage.export,
+            status=stage.status,
+            message=message
+        )
+
+
+class StageTimer:
+    """
+    Hook for `Instrumentation` that aggregates `StageReport`s. The
+    results are available per field (`fields`) or can be written in the
+    collapsed-stack format that is used by common flame-graph tools
+    (`dump`).
+
+    Example usage:
+     >>> timer = StageTimer()
+     >>> Instrumentation().register(timer)
+     >>> pipeline = Object(...).assemble()
+     >>> pipeline.run(json=...)
+     >>> timer.dump("validation.folded")
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # stack -> accumulated self-duration
+        self._stacks: dict[tuple[str, ...], int] = {}
+        # (loc, name) -> [count, accumulated duration, count per status]
+        self._fields: dict[tuple[str, str], list] = {}
+
+    def __call__(self, report: StageReport) -> None:
+        with self._lock:
+            self._stacks[report.stack] = \
+                self._stacks.get(report.stack, 0) + report.self_duration
+            field = self._fields.setdefault(
+                (report.loc, report.name), [0, 0, {}]
+            )
+            field[0] += 1
+            field[1] += report.self_duration
+            field[2][report.status] = field[2].get(report.status, 0) + 1
+
+    @property
+    def fields(self) -> dict[tuple[str, str], dict]:
+        """
+        Returns mapping of `(loc, name)` to a dictionary containing the
+        number of `Stage`-executions (`count`), their accumulated
+        self-duration in nanoseconds (`duration`), and the number of
+        executions per returned status (`status`).
+        """
+        with self._lock:
+            return {
+                k: {"count": v[0], "duration": v[1], "status": v[2].copy()}
+                for k, v in self._fields.items()
+            }
+
+    def collapsed(self) -> str:
+        """
+        Returns aggregated timings in the collapsed-stack format (one
+        line per stack with self-duration in microseconds).
+        """
+        with self._lock:
+            return "".join(
+                ";".join(stack) + f" {duration // 1000}\n"
+                for stack, duration in self._stacks.items()
+            )
+
+    def dump(self, path: str | os.PathLike) -> None:
+        """
+        Write aggregated timings to `path` in the collapsed-stack
+        format.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.collapsed())
+
+    def clear(self) -> None:
+        """Reset aggregated timings."""
+        with self._lock:
+            self._stacks.clear()
+            self._fields.clear()
+
+
+# finalize initialization of singleton
+Instrumentation()
@@ -1,7 +1,13 @@
-from typing import TypeAlias, Mapping, Optional
+from typing import TYPE_CHECKING, TypeAlias, Mapping, Optional
 import abc
+import importlib
 
-from data_plumber import Pipeline
+if TYPE_CHECKING:
+    from data_plumber import Pipeline
+    # static re-exports for type checkers (see `__getattr__`)
+    from .property import Property
+    from .one_of import OneOf
+    from .all_of import AllOf
 
 
 Values: TypeAlias = "DPType" | Mapping["DPKey", "Values"]  # type: ignore[name-defined]
@@ -18,7 +24,7 @@ class DPKey(metaclass=abc.ABCMeta):
         )
 
     @abc.abstractmethod
-    def assemble(self, value: Values, loc: Optional[str]) -> Pipeline:
+    def assemble(self, value: Values, loc: Optional[str]) -> "Pipeline":
         """
         Returns `Pipeline` that processes the given `value` for this key.
         """
@@ -27,9 +33,27 @@ class DPKey(metaclass=abc.ABCMeta):
         )
 
 
-from .property import Property
-from .one_of import OneOf
-from .all_of import AllOf
+# concrete keys are loaded lazily on first access (PEP 562)
+_KEYS = {
+    "Property": ".property",
+    "OneOf": ".one_of",
+    "AllOf": ".all_of",
+}
+
+
+def __getattr__(name: str):
+    if name not in _KEYS:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    value = getattr(importlib.import_module(_KEYS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "DPKey",
@@ -1,8 +1,10 @@
 from typing import Optional, Callable, Any
 
-from data_plumber import Pipeline, Stage
+from data_plumber import Stage
 
 from data_plumber_http.output import Output
+from data_plumber_http.execution import Pipeline
+from data_plumber_http.instrumentation import Instrumentation
 from data_plumber_http.settings import Responses
 from .conditional_key import _ConditionalKey
 
@@ -102,13 +104,8 @@ class AllOf(_ConditionalKey):
         return Stage(
             action=lambda out, EXPORT_options, EXPORT_matches, **kwargs:
                 [
-                    out.update({"kwargs": {}})
-                    if "kwargs" not in out
-                    else None,
-                    [
-                        out.kwargs.update(EXPORT_options[v].data.kwargs)
-                        for v in EXPORT_matches
-                    ]
+                    out.kwargs.update(EXPORT_options[v].data.kwargs)
+                    for v in EXPORT_matches
                 ],
             status=lambda **kwargs: Responses().GOOD.status,
             message=lambda **kwargs: Responses().GOOD.msg
@@ -121,30 +118,27 @@ class AllOf(_ConditionalKey):
         )
         _loc = loc or "."
 
+        def append(id_, stage):
+            p.append(
+                id_,
+                **{id_: Instrumentation().stage(stage, _loc, self.name, id_)}
+            )
+
         # run options
-        p.append(
-            f"{self.name}[options]",
-            **{f"{self.name}[options]": self._run_options(value, _loc)}
-        )
+        append(f"{self.name}[options]", self._run_options(value, _loc))
 
         # evaluate options
         # validate existence
         if self.required and self.default is None:
-            p.append(
+            append(
                 f"{self.name}[exists]",
-                **{
-                    f"{self.name}[exists]":
-                        self._arg_exists_hard(_loc, self.name)
-                }
+                self._soft_if_partial(
+                    self._arg_exists_hard(_loc, self.name),
+                    self._arg_exists_soft()
+                )
             )
         else:
-            p.append(
-                f"{self.name}[exists]",
-                **{
-                    f"{self.name}[exists]":
-                        self._arg_exists_soft()
-                }
-            )
+            append(f"{self.name}[exists]", self._arg_exists_soft())
 
         # stop here if requested
         if self.validation_only:
@@ -152,15 +146,9 @@ class AllOf(_ConditionalKey):
 
         # set default
         if self.default is not None:
-            p.append(
-                f"{self.name}[default]",
-                **{f"{self.name}[default]": self._set_default(self)}
-            )
+            append(f"{self.name}[default]", self._set_default(self))
 
         # output
-        p.append(
-            f"{self.name}[output]",
-            **{f"{self.name}[output]": self._output()}
-        )
+        append(f"{self.name}[output]", self._output())
 
         return p
@@ -36,31 +36,61 @@ class _ConditionalKey(DPKey):
                 for k, v in options.items()
             }
         )
+        # in partial mode, options are validated partially (also nested
+        # Objects) such that an option only matches if present
+        origins = {k.name: k.get_origins(v) for k, v in options.items()}
         return Stage(
-            primer=lambda json, **kwargs: pa.run(json=json),
-            export=lambda primer, **kwargs:
+            primer=lambda json, coerce=False, partial=False, **kwargs:
+                pa.run(
+                    json=json, **({"coerce": True} if coerce else {}),
+                    **({"partial": True} if partial else {})
+                ),
+            export=lambda primer, json, partial=False, **kwargs:
                 {
                     "EXPORT_options": primer,
                     "EXPORT_matches": [
                         k for k, v in primer.items()
                         if v.last_status == Responses().GOOD.status
+                        and (
+                            not partial
+                            or any(o in json for o in origins[k])
+                        )
                     ]
                 },
             status=lambda **kwargs: Responses().GOOD.status,
             message=lambda **kwargs: Responses().GOOD.msg
         )
 
+    @staticmethod
+    def _soft_if_partial(hard: Stage, soft: Stage) -> Stage:
+        """
+        Returns `Stage` that behaves like `soft` in partial mode and like
+        `hard` otherwise.
+        """
+        return Stage(
+            primer=lambda partial=False, **kwargs:
+                (soft if partial else hard).primer(**kwargs),
+            status=lambda partial=False, **kwargs:
+                (soft if partial else hard).status(**kwargs),
+            message=lambda partial=False, **kwargs:
+                (soft if partial else hard).message(**kwargs)
+        )
+
     @staticmethod
     def _set_default(k):
+        # defaults are not applied in partial mode
         return Stage(
             requires={
                 f"{k.name}[exists]": Responses().MISSING_OPTIONAL.status
             },
-            primer=k.default
+            primer=(
+                lambda partial=False, **kwargs:
+                    None if partial else k.default(**kwargs)
+            )
                 if callable(k.default)
                 else lambda **kwargs: k.default,
-            export=lambda primer, **kwargs:
-                {
+            export=lambda primer, partial=False, **kwargs:
+                {} if partial else {
                     "EXPORT_options": {
                         "default": PipelineOutput(
                             [], {}, Output(kwargs={k.name: primer})
@@ -1,8 +1,10 @@
 from typing import Optional, Callable, Any
 
-from data_plumber import Pipeline, Stage
+from data_plumber import Stage
 
 from data_plumber_http.output import Output
+from data_plumber_http.execution import Pipeline
+from data_plumber_http.instrumentation import Instrumentation
 from data_plumber_http.settings import Responses
 from .conditional_key import _ConditionalKey
 
@@ -120,12 +122,7 @@ class OneOf(_ConditionalKey):
                 EXPORT_options[EXPORT_matches[0]].data.kwargs if EXPORT_matches
                 else {},
             action=lambda out, primer, **kwargs:
-                [
-                    out.update({"kwargs": {}})
-                    if "kwargs" not in out
-                    else None,
-                    out.kwargs.update(primer)
-                ],
+                out.kwargs.update(primer),
             status=lambda **kwargs: Responses().GOOD.status,
             message=lambda **kwargs: Responses().GOOD.msg
         )
@@ -137,41 +134,35 @@ class OneOf(_ConditionalKey):
         )
         _loc = loc or "."
 
+        def append(id_, stage):
+            p.append(
+                id_,
+                **{id_: Instrumentation().stage(stage, _loc, self.name, id_)}
+            )
+
         # run options
-        p.append(
-            f"{self.name}[options]",
-            **{f"{self.name}[options]": self._run_options(value, _loc)}
-        )
+        append(f"{self.name}[options]", self._run_options(value, _loc))
 
         # evaluate options
         # validate existence
         if self.required and self.default is None:
-            p.append(
+            append(
                 f"{self.name}[exists]",
-                **{
-                    f"{self.name}[exists]":
-                        self._arg_exists_hard(_loc, self.get_origins(value))
-                }
+                self._soft_if_partial(
+                    self._arg_exists_hard(_loc, self.get_origins(value)),
+                    self._arg_exists_soft()
+                )
             )
         else:
-            p.append(
-                f"{self.name}[exists]",
-                **{
-                    f"{self.name}[exists]":
-                        self._arg_exists_soft()
-                }
-            )
+            append(f"{self.name}[exists]", self._arg_exists_soft())
 
         # validate exclusiveness
         if self.exclusive:
-            p.append(
+            append(
                 f"{self.name}[exclusive]",
-                **{
-                    f"{self.name}[exclusive]":
-                        self._exclusive_match(
-                            self.name, _loc, self.get_origins(value)
-                        )
-                }
+                self._exclusive_match(
+                    self.name, _loc, self.get_origins(value)
+                )
             )
 
         # stop here if requested
@@ -180,15 +171,9 @@ class OneOf(_ConditionalKey):
 
         # set default
         if self.default is not None:
-            p.append(
-                f"{self.name}[default]",
-                **{f"{self.name}[default]": self._set_default(self)}
-            )
+            append(f"{self.name}[default]", self._set_default(self))
 
         # output
-        p.append(
-            f"{self.name}[output]",
-            **{f"{self.name}[output]": self._output()}
-        )
+        append(f"{self.name}[output]", self._output())
 
         return p
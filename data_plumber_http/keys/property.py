@@ -1,9 +1,13 @@
 from typing import Optional, Callable, Any
 
-from data_plumber import Pipeline, Stage
+from data_plumber import Stage
+from data_plumber.output import StageRecord
 
 from data_plumber_http.output import Output
+from data_plumber_http.execution import Pipeline
+from data_plumber_http.instrumentation import Instrumentation
 from data_plumber_http.settings import Responses
+from data_plumber_http.coercion import coerce as _coerce
 from . import DPKey
 
 
@@ -60,13 +64,16 @@ class Property(DPKey):
 
     @staticmethod
     def _arg_exists_hard(k, loc):
+        # in partial mode, required properties are treated as optional
         return Stage(
             primer=lambda json, **kwargs: k.origin in json,
-            status=lambda primer, **kwargs:
+            status=lambda primer, partial=False, **kwargs:
                 Responses().GOOD.status if primer
+                else Responses().MISSING_OPTIONAL.status if partial
                 else Responses().MISSING_REQUIRED.status,
-            message=lambda primer, **kwargs:
+            message=lambda primer, partial=False, **kwargs:
                 Responses().GOOD.msg if primer
+                else Responses().MISSING_OPTIONAL.msg if partial
                 else Responses().MISSING_REQUIRED.msg.format(
                     loc=loc,
                     origin=k.origin
@@ -87,13 +94,19 @@ class Property(DPKey):
 
     @staticmethod
     def _arg_has_type(k, v, loc):
+        # with coercion, the (coerced) value is exported as
+        # f"COERCED_{k.name}"
         return Stage(
             requires={k.name: Responses().GOOD.status},
-            primer=lambda json, **kwargs: isinstance(json[k.origin], v.TYPE),
+            primer=lambda json, coerce=False, **kwargs:
+                _coerce(json, k.origin, v) if coerce else json[k.origin],
+            export=lambda primer, coerce=False, **kwargs:
+                {f"COERCED_{k.name}": primer} if coerce else {},
             status=lambda primer, **kwargs:
-                Responses().GOOD.status if primer else Responses().BAD_TYPE.status,
+                Responses().GOOD.status if isinstance(primer, v.TYPE)
+                else Responses().BAD_TYPE.status,
             message=lambda primer, json, **kwargs:
-                Responses().GOOD.msg if primer
+                Responses().GOOD.msg if isinstance(primer, v.TYPE)
                 else Responses().BAD_TYPE.msg.format(
                     origin=k.origin,
                     loc=loc,
@@ -104,10 +117,19 @@ class Property(DPKey):
 
     @staticmethod
     def _make_instance(k, v, loc):
+        # pylint: disable=import-outside-toplevel
+        from data_plumber_http.types import Object, Ref
+        # in partial mode, nested Objects are validated partially as well
+        partial_make = isinstance(v, (Object, Ref))
+
+        def primer(json, partial=False, coerce=False, **kwargs):
+            value = kwargs[f"COERCED_{k.name}"] if coerce else json[k.origin]
+            if partial and partial_make:
+                return v.make(value, loc, partial=True)
+            return v.make(value, loc)
         return Stage(
             requires={k.name: Responses().GOOD.status},
-            primer=lambda json, **kwargs:
-                v.make(json[k.origin], loc),
+            primer=primer,
             export=lambda primer, **kwargs:
                 {f"EXPORT_{k.name}": primer[0]}
                 if primer[2] == Responses().GOOD.status
@@ -118,13 +140,17 @@ class Property(DPKey):
 
     @staticmethod
     def _set_default(k):
+        # defaults are not applied in partial mode
         return Stage(
             requires={k.name: Responses().MISSING_OPTIONAL.status},
-            primer=k.default
+            primer=(
+                lambda partial=False, **kwargs:
+                    None if partial else k.default(**kwargs)
+            )
                 if callable(k.default)
                 else lambda **kwargs: k.default,
-            export=lambda primer, **kwargs:
-                {f"EXPORT_{k.name}": primer},
+            export=lambda primer, partial=False, **kwargs:
+                {} if partial else {f"EXPORT_{k.name}": primer},
             status=lambda **kwargs: Responses().GOOD.status,
             message=lambda **kwargs: Responses().GOOD.msg
         )
@@ -135,23 +161,154 @@ class Property(DPKey):
             primer=lambda **kwargs:
                 f"EXPORT_{k.name}" in kwargs,
             action=lambda out, primer, **kwargs:
-                [
-                    out.update({"kwargs": {}})
-                    if "kwargs" not in out
-                    else None,
-                    out.kwargs.update(
-                        {k.name: kwargs.get(f"EXPORT_{k.name}")}
-                        if primer
-                        else {}
-                    )
-                ],
+                out.kwargs.update(
+                    {k.name: kwargs.get(f"EXPORT_{k.name}")}
+                )
+                if primer
+                else None,
             status=lambda **kwargs: Responses().GOOD.status,
             message=lambda **kwargs: Responses().GOOD.msg
         )
 
+    @staticmethod
+    def _fused(k, v, loc, nested_loc):
+        """
+        Returns a single `Stage` that combines the steps existence,
+        type, make, default, and output (see `assemble`). The `primer`
+        returns a tuple of status, message, exports, and (if requested
+        via `expand_records`) the list of steps as tuples of identifier,
+        message, and status.
+        """
+        # pylint: disable=import-outside-toplevel
+        from data_plumber_http.types import Object, Ref
+        partial_make = isinstance(v, (Object, Ref))
+        hard = k.required and k.default is None
+        default = None if k.validation_only else k.default
+        ids = (
+            k.name, f"{k.name}[type]", f"{k.name}[dptype]",
+            f"{k.name}[default]", f"{k.name}[output]"
+        )
+        export = f"EXPORT_{k.name}"
+
+        def primer(partial=False, expand_records=False, **kwargs):
+            json = kwargs["json"]
+            good = Responses().GOOD
+            steps = [] if expand_records else None
+            exports = {}
+            # existence
+            if k.origin not in json:
+                if hard and not partial:
+                    msg = Responses().MISSING_REQUIRED.msg.format(
+                        loc=loc, origin=k.origin
+                    )
+                    status = Responses().MISSING_REQUIRED.status
+                    if steps is not None:
+                        steps.append((ids[0], msg, status))
+                    return status, msg, exports, steps
+                msg = Responses().MISSING_OPTIONAL.msg
+                status = Responses().MISSING_OPTIONAL.status
+                if steps is not None:
+                    steps.append((ids[0], msg, status))
+                if default is not None:
+                    # defaults are not applied in partial mode
+                    if not partial:
+                        exports[export] = default(**kwargs) \
+                            if callable(default) else default
+                    if steps is not None:
+                        steps.append((ids[3], good.msg, good.status))
+            else:
+                if steps is not None:
+                    steps.append((ids[0], good.msg, good.status))
+                # type
+                if kwargs.get("coerce", False):
+                    value = _coerce(json, k.origin, v)
+                else:
+                    value = json[k.origin]
+                if not isinstance(value, v.TYPE):
+                    msg = Responses().BAD_TYPE.msg.format(
+                        origin=k.origin,
+                        loc=loc,
+                        xp_type=v.__name__,
+                        fnd_type=type(json[k.origin]).__name__
+                    )
+                    status = Responses().BAD_TYPE.status
+                    if steps is not None:
+                        steps.append((ids[1], msg, status))
+                    return status, msg, exports, steps
+                if steps is not None:
+                    steps.append((ids[1], good.msg, good.status))
+                # make
+                if partial and partial_make:
+                    result = v.make(value, nested_loc, partial=True)
+                else:
+                    result = v.make(value, nested_loc)
+                _, msg, status = result
+                if steps is not None:
+                    steps.append((ids[2], msg, status))
+                if status == good.status:
+                    exports[export] = result[0]
+                elif status >= 400:
+                    return status, msg, exports, steps
+            if k.validation_only:
+                return status, msg, exports, steps
+            if steps is not None:
+                steps.append((ids[4], good.msg, good.status))
+            return good.status, good.msg, exports, steps
+
+        return Stage(
+            primer=primer,
+            action=(lambda out, primer, **kwargs: None)
+                if k.validation_only
+                else lambda out, primer, **kwargs:
+                    out.kwargs.update({k.name: primer[2][export]})
+                    if export in primer[2]
+                    else None,
+            export=lambda primer, **kwargs:
+                primer[2] if primer[3] is None
+                else primer[2] | {f"RECORDS_{k.name}": primer[3]},
+            status=lambda primer, **kwargs: primer[0],
+            message=lambda primer, **kwargs: primer[1]
+        )
+
+    @staticmethod
+    def expand_records(records: list[StageRecord], kwargs: dict) -> None:
+        """
+        Replaces the `StageRecord`s of fused `Property`-`Stage`s in
+        `records` by synthetic records for the individual steps (see
+        `assemble`).
+
+        Keyword arguments:
+        records -- `StageRecord`s of a `Pipeline.run`
+        kwargs -- (exported) kwargs of that `Pipeline.run`
+        """
+        records[:] = [
+            StageRecord(r.index, *step)
+            for r in records
+            for step in kwargs.get(
+                f"RECORDS_{r.id_}", [(r.id_, r.message, r.status)]
+            )
+        ]
+
     def assemble(self, value, loc):
-        def finalizer(data, records, **kwargs):
-            if records[-1].status == Responses().GOOD.status:
+        """
+        Returns `Pipeline` that processes the given `value` for this
+        `Property`.
+
+        The steps (existence, type, make, default, and output) are
+        fused into a single `Stage` that reads the value from the `json`
+        only once. If `Pipeline.run` is called with the additional
+        keyword argument `expand_records=True`, the record of that
+        `Stage` is replaced by synthetic records for the individual
+        steps (`name`, `name[type]`, `name[dptype]`, `name[default]`,
+        and `name[output]`). If `Instrumentation` is enabled, the steps
+        are assembled as individual `Stage`s instead.
+        """
+        def finalizer(
+            data, records, last_status, expand_records=False, **kwargs
+        ):
+            if expand_records:
+                self.expand_records(records, kwargs)
+            if last_status == Responses().GOOD.status:
                 data.value = kwargs.get(f"EXPORT_{self.name}")
         p = Pipeline(
             exit_on_status=lambda status: status >= 400,
@@ -159,26 +316,36 @@ class Property(DPKey):
             finalize_output=finalizer
         )
         _loc = loc or "."
-        # k.name: validate existence
-        if self.required and self.default is None:
+
+        def append(id_, stage):
+            p.append(
+                id_,
+                **{id_: Instrumentation().stage(stage, _loc, self.name, id_)}
+            )
+
+        if not Instrumentation().enabled:
             p.append(
                 self.name,
-                **{self.name: self._arg_exists_hard(self, _loc)}
+                **{
+                    self.name: self._fused(
+                        self, value, _loc, (loc or "") + "." + self.origin
+                    )
+                }
             )
+            return p
+
+        # k.name: validate existence
+        if self.required and self.default is None:
+            append(self.name, self._arg_exists_hard(self, _loc))
         else:
-            p.append(self.name, **{self.name: self._arg_exists_soft(self)})
+            append(self.name, self._arg_exists_soft(self))
         # {k.name}[type]: validate type
-        p.append(
-            f"{self.name}[type]",
-            **{f"{self.name}[type]": self._arg_has_type(self, value, _loc)}
-        )
+        append(f"{self.name}[type]", self._arg_has_type(self, value, _loc))
         # {k.name}[dptype]: validate, make, and export instance as
         #                   f"EXPORT_{k.name}" (if valid)
-        p.append(
+        append(
             f"{self.name}[dptype]",
-            **{f"{self.name}[dptype]": self._make_instance(
-                self, value, (loc or "") + "." + self.origin
-            )}
+            self._make_instance(self, value, (loc or "") + "." + self.origin)
         )
         if self.validation_only:
             return p
@@ -186,13 +353,7 @@ class Property(DPKey):
         #   if property has fill_with_none set) and export as
         #   f"EXPORT_{k.name}"
         if self.default is not None:
-            p.append(
-                f"{self.name}[default]",
-                **{f"{self.name}[default]": self._set_default(self)}
-            )
+            append(f"{self.name}[default]", self._set_default(self))
         # {k.name}[output]: output to data
-        p.append(
-            f"{self.name}[output]",
-            **{f"{self.name}[output]": self._output(self)}
-        )
+        append(f"{self.name}[output]", self._output(self))
         return p
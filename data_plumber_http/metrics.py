@@ -0,0 +1,201 @@
+from typing import Optional, Iterable
+from bisect import bisect_left
+import abc
+import threading
+
+
+# default histogram-buckets
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0
+)
+SIZE_BUCKETS = (
+    64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216
+)
+
+
+class MetricsCollector(metaclass=abc.ABCMeta):
+    """
+    Interface for collectors of validation-metrics that can be passed to
+    `flask_handler` (`metrics`-argument).
+    """
+
+    @abc.abstractmethod
+    def observe(
+        self,
+        endpoint: str,
+        duration: float,
+        status: int,
+        size: Optional[int]
+    ) -> None:
+        """
+        Record a single validation.
+
+        Keyword arguments:
+        endpoint -- name of the endpoint
+        duration -- time spent on validation in seconds
+        status -- resulting status (`Responses().GOOD.status` if valid)
+        size -- payload size in bytes (`None` if unknown)
+        """
+        raise NotImplementedError(
+            "Method 'observe' needs to be defined when using abstract base 'MetricsCollector'."
+        )
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets.
+
+    Keyword arguments:
+    buckets -- upper bounds (inclusive) of buckets
+    """
+
+    def __init__(self, buckets: Iterable[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # last entry counts values that exceed all buckets
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add `value` to histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """
+        Returns list of pairs of upper bound and cumulative count (the
+        last bound is `float("inf")`).
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class EndpointMetrics:
+    """
+    Metrics of a single endpoint as recorded by `ValidationMetrics`.
+
+    Its properties are
+    latency -- `Histogram` of validation durations in seconds
+    size -- `Histogram` of payload sizes in bytes
+    status -- mapping of status to number of occurrences
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Iterable[float],
+        size_buckets: Iterable[float]
+    ) -> None:
+        self.latency = Histogram(latency_buckets)
+        self.size = Histogram(size_buckets)
+        self.status: dict[int, int] = {}
+
+
+class ValidationMetrics(MetricsCollector):
+    """
+    Thread-safe in-memory `MetricsCollector` that records a latency- and
+    a payload size-histogram as well as counts per status for every
+    endpoint. The results can be rendered in the Prometheus text format
+    via `render_prometheus`.
+
+    Keyword arguments:
+    latency_buckets -- upper bounds of latency-buckets in seconds
+                       (default `LATENCY_BUCKETS`)
+    size_buckets -- upper bounds of payload size-buckets in bytes
+                    (default `SIZE_BUCKETS`)
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Iterable[float] = LATENCY_BUCKETS,
+        size_buckets: Iterable[float] = SIZE_BUCKETS
+    ) -> None:
+        self._latency_buckets = tuple(latency_buckets)
+        self._size_buckets = tuple(size_buckets)
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def observe(self, endpoint, duration, status, size):
+        with self._lock:
+            if (metrics := self._endpoints.get(endpoint)) is None:
+                metrics = self._endpoints[endpoint] = EndpointMetrics(
+                    self._latency_buckets, self._size_buckets
+                )
+            metrics.latency.observe(duration)
+            if size is not None:
+                metrics.size.observe(size)
+            metrics.status[status] = metrics.status.get(status, 0) + 1
+
+    @property
+    def endpoints(self) -> dict[str, EndpointMetrics]:
+        """Returns (shallow) copy of recorded metrics per endpoint."""
+        with self._lock:
+            return self._endpoints.copy()
+
+    def clear(self) -> None:
+        """Reset all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _render_histogram(name: str, help_: str, histograms) -> list[str]:
+    lines = [f"# HELP {name} {help_}", f"# TYPE {name} histogram"]
+    for endpoint, histogram in histograms:
+        label = f'endpoint="{_escape(endpoint)}"'
+        for bound, count in histogram.cumulative():
+            lines.append(
+                f'{name}_bucket{{{label},le="{_format_bound(bound)}"}} {count}'
+            )
+        lines.append(f"{name}_sum{{{label}}} {histogram.sum}")
+        lines.append(f"{name}_count{{{label}}} {histogram.count}")
+    return lines
+
+
+def render_prometheus(
+    metrics: ValidationMetrics, prefix: str = "data_plumber_http"
+) -> str:
+    """
+    Returns metrics recorded in `metrics` in the Prometheus text-based
+    exposition format.
+
+    Keyword arguments:
+    metrics -- `ValidationMetrics` to be rendered
+    prefix -- prefix for metric names
+              (default "data_plumber_http")
+    """
+    endpoints = sorted(metrics.endpoints.items())
+    lines = _render_histogram(
+        f"{prefix}_validation_duration_seconds",
+        "Time spent on request validation.",
+        ((e, m.latency) for e, m in endpoints)
+    )
+    lines += _render_histogram(
+        f"{prefix}_payload_size_bytes",
+        "Size of validated request payloads.",
+        ((e, m.size) for e, m in endpoints)
+    )
+    name = f"{prefix}_validations_total"
+    lines += [
+        f"# HELP {name} Number of request validations by resulting status.",
+        f"# TYPE {name} counter",
+    ]
+    for endpoint, m in endpoints:
+        for status, count in sorted(m.status.items()):
+            lines.append(
+                f'{name}{{endpoint="{_escape(endpoint)}",status="{status}"}} '
+                + f"{count}"
+            )
+    return "\n".join(lines) + "\n"
@@ -1,28 +1,76 @@
-from typing import Any
+from typing import Any, Optional, Iterator
 
 
-class Output(dict):
+class Output:
     """
     Type of the data-object in `Pipeline` generated from
     `Object.assemble`.
 
-    Inherits from `dict` but provides the two properties
+    Compact (slotted) record with the two properties
     kwargs -- `kwargs`-dictionary which has been generated by the
               `Object.assemble`-`Pipeline`
     value -- `Object.model`-object instantiated using `kwargs`
+
+    For compatibility with the previous `dict`-based implementation,
+    both properties can also be accessed like the items of a mapping
+    (e.g. `output["kwargs"]` or `output.get("value")`). Unlike before,
+    both items always exist (`"value" in output` is `True` even if no
+    value has been set; it then defaults to `None`).
     """
-    @property
-    def value(self) -> Any:
-        return self.get("value", None)
+    __slots__ = ("value", "kwargs")
+    _KEYS = ("value", "kwargs")
+
+    def __init__(
+        self, value: Any = None, kwargs: Optional[dict] = None
+    ) -> None:
+        self.value = value
+        self.kwargs = {} if kwargs is None else kwargs
+
+    def __repr__(self) -> str:
+        return f"Output(value={self.value!r}, kwargs={self.kwargs!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Output):
+            return self.value == other.value and self.kwargs == other.kwargs
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    # mapping-interface
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns item `key` or `default` if `key` does not exist."""
+        return getattr(self, key) if key in self._KEYS else default
 
-    @value.setter
-    def value(self, value):
-        self["value"] = value
+    def keys(self) -> tuple[str, ...]:
+        """Returns item keys."""
+        return self._KEYS
 
-    @property
-    def kwargs(self) -> dict:
-        return self.get("kwargs", {})
+    def items(self) -> list[tuple[str, Any]]:
+        """Returns list of key-value pairs."""
+        return [(k, getattr(self, k)) for k in self._KEYS]
 
-    @kwargs.setter
-    def kwargs(self, kwargs):
-        self["kwargs"] = kwargs
+    def update(self, other: Optional[dict] = None, **kwargs) -> None:
+        """Set items from `other` and `kwargs`."""
+        for key, value in (other or {}).items():
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
@@ -0,0 +1,240 @@
+from typing import Callable, Optional, Any
+from pathlib import Path
+from functools import cache
+import os
+import re
+import sys
+import time
+import threading
+import cProfile
+import pstats
+
+
+# environment variables used by `SamplingProfiler.from_env`
+ENV_RATE = "DATA_PLUMBER_HTTP_PROFILE_RATE"
+ENV_DIRECTORY = "DATA_PLUMBER_HTTP_PROFILE_DIR"
+ENV_INTERVAL = "DATA_PLUMBER_HTTP_PROFILE_INTERVAL"
+
+
+class _MonitoringProfile:
+    """
+    Deterministic profiler for the current thread based on
+    `sys.monitoring` (Python 3.12+). Provides the interface of
+    `cProfile.Profile` that is required by `pstats.Stats` (only Python
+    functions are recorded and no caller-information is collected).
+    """
+    TOOL_ID = 2  # sys.monitoring.PROFILER_ID
+
+    def __init__(self) -> None:
+        self._thread = threading.get_ident()
+        # code -> [primitive calls, calls, tottime, cumtime, active calls]
+        self._data: dict[Any, list] = {}
+        # frames: code, start, time spent in nested calls
+        self._stack: list[list] = []
+        self.stats: dict = {}
+
+    def _start(self, code, offset):
+        if threading.get_ident() != self._thread:
+            return
+        self._stack.append([code, time.perf_counter(), 0.0])
+        entry = self._data.setdefault(code, [0, 0, 0.0, 0.0, 0])
+        entry[4] += 1
+
+    def _stop(self, code, offset, *args):
+        if threading.get_ident() != self._thread or not self._stack:
+            return
+        if self._stack[-1][0] is not code:
+            return
+        _, start, nested = self._stack.pop()
+        duration = time.perf_counter() - start
+        entry = self._data[code]
+        entry[1] += 1
+        entry[2] += duration - nested
+        entry[4] -= 1
+        if entry[4] == 0:  # only count outermost call of recursions
+            entry[0] += 1
+            entry[3] += duration
+        if self._stack:
+            self._stack[-1][2] += duration
+
+    def enable(self) -> None:
+        """
+        Start recording; raises `ValueError` if the tool-id is already
+        in use.
+        """
+        monitoring = sys.monitoring  # type: ignore[attr-defined]
+        monitoring.use_tool_id(self.TOOL_ID, "data-plumber-http")
+        events = monitoring.events
+        for event, callback in (
+            (events.PY_START, self._start),
+            (events.PY_RESUME, self._start),
+            (events.PY_RETURN, self._stop),
+            (events.PY_YIELD, self._stop),
+            (events.PY_UNWIND, self._stop),
+        ):
+            monitoring.register_callback(self.TOOL_ID, event, callback)
+        monitoring.set_events(
+            self.TOOL_ID,
+            events.PY_START | events.PY_RESUME | events.PY_RETURN
+            | events.PY_YIELD | events.PY_UNWIND
+        )
+
+    def disable(self) -> None:
+        """Stop recording."""
+        monitoring = sys.monitoring  # type: ignore[attr-defined]
+        monitoring.set_events(self.TOOL_ID, 0)
+        for event in (
+            monitoring.events.PY_START, monitoring.events.PY_RESUME,
+            monitoring.events.PY_RETURN, monitoring.events.PY_YIELD,
+            monitoring.events.PY_UNWIND,
+        ):
+            monitoring.register_callback(self.TOOL_ID, event, None)
+        monitoring.free_tool_id(self.TOOL_ID)
+
+    def create_stats(self) -> None:
+        """Generate `stats` in the format used by `pstats`."""
+        self.stats = {
+            (code.co_filename, code.co_firstlineno, code.co_name):
+                (v[0], v[1], v[2], v[3], {})
+            for code, v in self._data.items()
+            if v[1] > 0
+        }
+
+
+class SamplingProfiler:
+    """
+    Profiler that records every `rate`-th call of `profile` and
+    aggregates the results per endpoint. The aggregated statistics are
+    written periodically (at most once every `interval` seconds) into
+    `directory` as `<endpoint>.prof` (format of `pstats`).
+
+    On Python 3.12+ profiling is based on `sys.monitoring`, otherwise
+    `cProfile` is used.
+
+    Keyword arguments:
+    rate -- profile one in `rate` calls
+    directory -- output directory
+    interval -- minimum time in seconds between writing results
+                (default 60)
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        directory: str | Path,
+        interval: float = 60
+    ) -> None:
+        if rate < 1:
+            raise ValueError(
+                f"Bad value for 'rate' of 'SamplingProfiler' ({rate})."
+            )
+        self.rate = rate
+        self.directory = Path(directory)
+        self.interval = interval
+        self._lock = threading.Lock()
+        # only one call is profiled at a time
+        self._active = threading.Lock()
+        self._count = 0
+        self._stats: dict[str, pstats.Stats] = {}
+        self._last_write = time.monotonic()
+
+    @classmethod
+    def from_env(cls) -> Optional["SamplingProfiler"]:
+        """
+        Returns `SamplingProfiler` configured via the environment
+        variables `DATA_PLUMBER_HTTP_PROFILE_RATE`,
+        `DATA_PLUMBER_HTTP_PROFILE_DIR` (default "profiles"), and
+        `DATA_PLUMBER_HTTP_PROFILE_INTERVAL` (default 60) or `None` if
+        no rate is set.
+        """
+        if not (rate := os.environ.get(ENV_RATE)):
+            return None
+        return cls(
+            int(rate),
+            os.environ.get(ENV_DIRECTORY, "profiles"),
+            float(os.environ.get(ENV_INTERVAL, 60))
+        )
+
+    @staticmethod
+    def _create_profile():
+        if sys.version_info >= (3, 12):
+            profile = _MonitoringProfile()
+            try:
+                profile.enable()
+                return profile
+            except ValueError:  # tool-id in use
+                pass
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler is active
+            return None
+        return profile
+
+    def profile(
+        self, endpoint: str, function: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """
+        Returns result of `function(*args, **kwargs)`; the call is
+        profiled if it is sampled.
+
+        Keyword arguments:
+        endpoint -- name of the endpoint used for aggregation
+        function -- callable to be executed
+        args, kwargs -- arguments passed to `function`
+        """
+        with self._lock:
+            self._count += 1
+            sampled = self._count % self.rate == 0
+        if not sampled or not self._active.acquire(blocking=False):
+            return function(*args, **kwargs)
+        try:
+            if (profile := self._create_profile()) is None:
+                return function(*args, **kwargs)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profile.disable()
+                self._add(endpoint, profile)
+        finally:
+            self._active.release()
+
+    def _add(self, endpoint: str, profile) -> None:
+        with self._lock:
+            try:
+                if endpoint in self._stats:
+                    self._stats[endpoint].add(profile)
+                else:
+                    self._stats[endpoint] = pstats.Stats(profile)
+            except TypeError:  # nothing has been recorded
+                pass
+            write = time.monotonic() - self._last_write >= self.interval
+        if write:
+            self.write()
+
+    @property
+    def stats(self) -> dict[str, pstats.Stats]:
+        """Returns (shallow) copy of aggregated statistics per endpoint."""
+        with self._lock:
+            return self._stats.copy()
+
+    def write(self) -> None:
+        """Write aggregated statistics into `directory`."""
+        with self._lock:
+            self._last_write = time.monotonic()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for endpoint, stats in self._stats.items():
+                stats.dump_stats(
+                    self.directory
+                    / (re.sub(r"[^A-Za-z0-9_.-]", "_", endpoint) + ".prof")
+                )
+
+
+@cache
+def default_profiler() -> Optional[SamplingProfiler]:
+    """
+    Returns `SamplingProfiler` that is shared by all `flask_handler`s
+    without explicit `profiler` (configured via environment, see
+    `SamplingProfiler.from_env`).
+    """
+    return SamplingProfiler.from_env()
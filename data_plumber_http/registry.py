@@ -0,0 +1,174 @@
+from typing import Optional, Any, Mapping
+from dataclasses import dataclass, field
+from time import perf_counter
+import gc
+import threading
+import weakref
+
+
+@dataclass
+class WarmUpReport:
+    """
+    Result of `SchemaRegistry.warm_up`.
+
+    Keyword arguments:
+    duration -- time spent on warm-up in seconds
+    pipelines -- number of `Pipeline`s that have been assembled
+    handlers -- number of handlers that have been exercised
+    frozen -- number of objects moved to the permanent generation by
+              `gc.freeze` (`None` if not frozen)
+    failures -- pairs of handler and the exception that has been raised
+                while exercising it
+                (default `[]`)
+    """
+    duration: float
+    pipelines: int
+    handlers: int
+    frozen: Optional[int]
+    failures: list[tuple[Any, Exception]] = field(default_factory=list)
+
+
+class SchemaRegistry:
+    """
+    Registry-singleton for `Object`-schemas and `flask_handler`-
+    handlers.
+
+    Every `Object` that is assembled as top-level schema (i.e.
+    `Object.assemble()` without location; internal and temporary
+    `Object`s are assembled with `register=False`) and every handler of
+    a `flask_handler` is registered automatically. A call to `warm_up`
+    assembles the `Pipeline`s of all nested `Object`s (which are
+    otherwise assembled on every validation) and exercises all handlers
+    once. This allows to prepare all schemas before forking worker
+    processes such that they are shared copy-on-write.
+
+    Note that the `Pipeline`s built during `warm_up` are a snapshot of
+    the schemas (including `Instrumentation`-hooks); use `clear` to
+    discard them.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance._roots = weakref.WeakSet()
+            cls._instance._handlers = weakref.WeakSet()
+            cls._instance._pipelines = {}
+        return cls._instance
+
+    def register(self, object_) -> None:
+        """
+        Register top-level `Object` `object_`.
+
+        Keyword arguments:
+        object_ -- schema to be registered
+        """
+        self._roots.add(object_)  # type: ignore[attr-defined]
+
+    def register_handler(self, handler) -> None:
+        """
+        Register handler (`Pipeline` or `CompiledValidator`) to be
+        exercised during `warm_up`.
+
+        Keyword arguments:
+        handler -- object with method `run`
+        """
+        self._handlers.add(handler)  # type: ignore[attr-defined]
+
+    def pipeline(self, object_, loc: Optional[str]):
+        """
+        Returns `Pipeline` of `object_` at `loc` that has been built
+        during `warm_up` or a newly assembled one.
+
+        Keyword arguments:
+        object_ -- `Object` to be assembled
+        loc -- location of `object_`
+        """
+        try:
+            return self._pipelines[(object_, loc)]  # type: ignore[attr-defined]
+        except KeyError:
+            return object_.assemble(loc, register=False)
+
+    @property
+    def pipelines(self) -> int:
+        """Number of `Pipeline`s built during `warm_up`."""
+        return len(self._pipelines)  # type: ignore[attr-defined]
+
+    def clear(self) -> None:
+        """Discard all `Pipeline`s built during `warm_up`."""
+        with self._lock:  # type: ignore[attr-defined]
+            self._pipelines.clear()  # type: ignore[attr-defined]
+
+    def _nested(self, dptype: Any, loc: Optional[str]):
+        """
+        Generates pairs of `Object`s and their locations within
+        `dptype` (at `loc`).
+        """
+        # pylint: disable=import-outside-toplevel
+        from data_plumber_http.types import Object, Array
+        from data_plumber_http.keys import Property
+        if isinstance(dptype, Object):
+            yield dptype, loc
+            stack = [dptype.properties]
+            while stack:
+                for key, value in stack.pop().items():
+                    if isinstance(key, Property):
+                        yield from self._nested(
+                            value, (loc or "") + "." + key.origin
+                        )
+                    elif isinstance(value, Mapping):  # OneOf/AllOf
+                        stack.append(value)
+        elif isinstance(dptype, Array):
+            yield from self._nested(dptype._items, loc)
+        elif hasattr(dptype, "_TYPES"):  # union type
+            for option in dptype._TYPES:
+                yield from self._nested(option, loc)
+
+    def warm_up(self, freeze: bool = False) -> WarmUpReport:
+        """
+        Assemble the `Pipeline`s of all nested `Object`s in registered
+        schemas, exercise all registered handlers (with empty input),
+        and optionally call `gc.freeze`.
+
+        Exceptions raised by handlers are not propagated but collected
+        in `WarmUpReport.failures`.
+
+        Keyword arguments:
+        freeze -- if `True`, move all objects into the permanent
+                  generation of the garbage collector afterwards
+                  (call right before forking workers)
+                  (default `False`)
+        """
+        start = perf_counter()
+        built = 0
+        with self._lock:  # type: ignore[attr-defined]
+            pipelines = self._pipelines  # type: ignore[attr-defined]
+            for root in list(self._roots):  # type: ignore[attr-defined]
+                for object_, loc in self._nested(root, None):
+                    # top-level Pipelines are held by the application
+                    if loc is None or (object_, loc) in pipelines:
+                        continue
+                    pipelines[(object_, loc)] = \
+                        object_.assemble(loc, register=False)
+                    built += 1
+        handlers = list(self._handlers)  # type: ignore[attr-defined]
+        failures = []
+        for handler in handlers:
+            try:
+                handler.run(json={})
+            except Exception as exc_info:  # pylint: disable=broad-except
+                failures.append((handler, exc_info))
+        frozen = None
+        if freeze:
+            gc.collect()
+            gc.freeze()
+            frozen = gc.get_freeze_count()
+        return WarmUpReport(
+            perf_counter() - start, built, len(handlers), frozen, failures
+        )
+
+
+# finalize initialization of singleton
+SchemaRegistry()
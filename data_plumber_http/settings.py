@@ -72,6 +72,10 @@ class Responses:
         "{child}",  # filled with child's message
         2  # gets overridden by child's status
     )
+    PAYLOAD_TOO_LARGE = ProblemInfo(
+        "Request body too large ({size} bytes, at most {max_size} accepted).",
+        413
+    )
 
     def __new__(cls):
         if cls._instance is None:
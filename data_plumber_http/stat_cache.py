@@ -0,0 +1,313 @@
+from typing import Optional
+from collections import OrderedDict
+from pathlib import Path
+import os
+import sys
+import time
+import struct
+import select
+import threading
+import warnings
+
+
+def stat_mode(path: str | Path) -> Optional[int]:
+    """
+    Returns `st_mode` of `path` (following symlinks) or `None` if
+    `path` does not exist or is not accessible.
+    """
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+class _Inotify:
+    """
+    Minimal `ctypes`-based wrapper for the Linux inotify-API. Watches
+    directories and calls `callback` with the affected directory and
+    entry name (`None` if the entire directory is affected) for every
+    change that is reported.
+
+    Keyword arguments:
+    callback -- called as `callback(directory, name)` from a background
+                thread
+    """
+    IN_ATTRIB = 0x00000004
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE \
+        | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, callback) -> None:
+        import ctypes
+        import ctypes.util
+        self._libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._callback = callback
+        self._watches: dict[int, str] = {}
+        self._wakeup = os.pipe()
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    def add_watch(self, directory: str) -> Optional[int]:
+        """
+        Returns watch descriptor for `directory` or `None` if it cannot
+        be watched.
+        """
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), self.MASK
+        )
+        if wd < 0:
+            return None
+        self._watches[wd] = directory
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """Remove watch associated with `wd`."""
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _read(self) -> None:
+        while True:
+            ready, _, _ = select.select([self._fd, self._wakeup[0]], [], [])
+            if self._wakeup[0] in ready:
+                break
+            try:
+                buffer = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = self._EVENT.unpack_from(buffer, offset)
+                offset += self._EVENT.size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & self.IN_Q_OVERFLOW:
+                    self._callback(None, None)
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & self.IN_IGNORED:
+                    self._watches.pop(wd, None)
+                if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF | self.IN_IGNORED) \
+                        or not name:
+                    self._callback(directory, None)
+                else:
+                    self._callback(directory, os.fsdecode(name))
+
+    def close(self) -> None:
+        """Stop background thread and release file descriptors."""
+        os.write(self._wakeup[1], b"\0")
+        self._thread.join()
+        for fd in (self._fd, *self._wakeup):
+            os.close(fd)
+
+
+class StatCache:
+    """
+    Thread-safe cache for results of `os.stat` that can be passed to
+    `FileSystemObject`s (`stat_cache`-argument). Entries expire after
+    `ttl` seconds; if the cache is full, the least recently used entry
+    is dropped.
+
+    If `inotify` is set, the parent directories of all cached paths are
+    watched (Linux only) and entries are invalidated as soon as the
+    corresponding directory entry changes. Note that changes to the
+    target of a symbolic link are not detected this way (these are only
+    covered by `ttl`).
+
+    Keyword arguments:
+    ttl -- time in seconds after which an entry expires; `None` means no
+           expiration
+           (default 1.0)
+    max_size -- maximum number of cached paths
+                (default 4096)
+    inotify -- if `True`, invalidate entries based on inotify-events;
+               falls back to `ttl` only (with a warning) if inotify is
+               not available
+               (default `False`)
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 1.0,
+        max_size: int = 4096,
+        inotify: bool = False
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(
+                f"Bad value for 'max_size' of 'StatCache' ({max_size})."
+            )
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # path -> (expiration time, st_mode)
+        self._entries: OrderedDict[str, tuple[float, Optional[int]]] = \
+            OrderedDict()
+        # directory -> [watch descriptor, number of cached entries]
+        self._directories: dict[str, list] = {}
+        # incremented for every inotify-event
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._inotify: Optional[_Inotify] = None
+        if inotify:
+            if sys.platform.startswith("linux"):
+                try:
+                    self._inotify = _Inotify(self._on_change)
+                except (OSError, AttributeError) as exc_info:
+                    warnings.warn(
+                        f"Unable to use inotify in 'StatCache' ({exc_info})."
+                    )
+            else:
+                warnings.warn(
+                    "inotify is not supported on platform "
+                    + f"'{sys.platform}', 'StatCache' uses only 'ttl'."
+                )
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that required a call to `os.stat`."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def reset_counters(self) -> None:
+        """Reset `hits` and `misses`."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, path: str) -> None:
+        """Remove entry for `path`; requires lock."""
+        if self._entries.pop(path, None) is not None:
+            self._unwatch(path)
+
+    def _unwatch(self, path: str) -> None:
+        """
+        Unregister entry for `path` from the watch of its parent
+        directory; requires lock.
+        """
+        if self._inotify is None:
+            return
+        directory = os.path.dirname(path)
+        if (watch := self._directories.get(directory)) is None:
+            return
+        watch[1] -= 1
+        if watch[1] <= 0:
+            del self._directories[directory]
+            self._inotify.rm_watch(watch[0])
+
+    def _watch(self, path: str) -> bool:
+        """
+        Register entry for `path` with the watch of its parent
+        directory; requires lock. Returns `False` if the directory
+        cannot be watched.
+        """
+        if self._inotify is None:
+            return True
+        directory = os.path.dirname(path)
+        if (watch := self._directories.get(directory)) is None:
+            if (wd := self._inotify.add_watch(directory)) is None:
+                return False
+            watch = self._directories[directory] = [wd, 0]
+        watch[1] += 1
+        return True
+
+    def _on_change(
+        self, directory: Optional[str], name: Optional[str]
+    ) -> None:
+        with self._lock:
+            self._generation += 1
+        if directory is None:
+            self.invalidate()
+            return
+        with self._lock:
+            if name is not None:
+                self._drop(os.path.join(directory, name))
+                return
+            for path in [
+                p for p in self._entries if os.path.dirname(p) == directory
+            ]:
+                self._drop(path)
+
+    def invalidate(self, path: Optional[str | Path] = None) -> None:
+        """
+        Invalidate entry for `path` or the entire cache if `path` is
+        `None`.
+        """
+        with self._lock:
+            if path is not None:
+                self._drop(os.path.abspath(path))
+                return
+            for _path in list(self._entries):
+                self._drop(_path)
+
+    def stat(self, path: str | Path) -> Optional[int]:
+        """
+        Returns (cached) `st_mode` of `path` or `None` if `path` does not
+        exist (see `stat_mode`).
+        """
+        _path = os.path.abspath(path)
+        now = time.monotonic()
+        with self._lock:
+            if (entry := self._entries.get(_path)) is not None:
+                if entry[0] > now:
+                    self._hits += 1
+                    self._entries.move_to_end(_path)
+                    return entry[1]
+                self._drop(_path)
+            self._misses += 1
+            # register watch before stat-call to not miss any event
+            watched = self._watch(_path)
+            generation = self._generation
+        mode = stat_mode(_path)
+        if not watched:  # paths that cannot be watched are not cached
+            return mode
+        with self._lock:
+            if generation != self._generation:
+                # possibly outdated by concurrent change
+                self._unwatch(_path)
+                return mode
+            if _path in self._entries:  # concurrent lookup
+                self._drop(_path)
+            self._entries[_path] = (
+                now + self._ttl if self._ttl is not None else float("inf"),
+                mode
+            )
+            while len(self._entries) > self._max_size:
+                self._drop(next(iter(self._entries)))
+        return mode
+
+    def close(self) -> None:
+        """Stop inotify-watches (if any) and clear cache."""
+        self.invalidate()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
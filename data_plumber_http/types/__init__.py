@@ -1,5 +1,7 @@
-from typing import Any
+from importlib.util import find_spec
+import typing
 import abc
+import importlib
 
 from data_plumber_http.settings import Responses
 
@@ -13,11 +15,67 @@ class DPType(metaclass=abc.ABCMeta):
         )
 
     @abc.abstractmethod
-    def make(self, json, loc: str) -> tuple[Any, str, int]:
+    def make(self, json, loc: str) -> tuple[typing.Any, str, int]:
         raise NotImplementedError(
             "Method 'make' needs to be defined when using abstract base 'DPType'."
         )
 
+    def make_many(self, json: list, loc: str) -> tuple[typing.Any, str, int]:
+        """
+        Validate and instantiate every element of `json` (used by
+        `Array`). Types that can share work between elements may
+        override this method.
+
+        Returns with a tuple of
+        * list of objects if valid or None,
+        * problem description if invalid,
+        * status code (`Responses().GOOD` if valid)
+
+        Keyword arguments:
+        json -- list of elements to generate objects from
+        loc -- current location in validation process for generating
+               informative messages
+        """
+        array = []
+        for element in json:
+            if not isinstance(element, self.TYPE):
+                return (
+                    None,
+                    f"Element in '{loc}' has bad type. Expected "
+                    + f"'{self.__name__}' but found "
+                    + f"'{type(element).__name__}'.",
+                    Responses().BAD_TYPE.status
+                )
+            child = self.make(element, loc)
+            if child[2] != Responses().GOOD.status:
+                return (None, child[1], child[2])
+            array.append(child[0])
+        return (
+            array,
+            Responses().GOOD.msg,
+            Responses().GOOD.status
+        )
+
+    def max_json_size(self) -> typing.Optional[int]:
+        """
+        Returns an upper bound for the size (in bytes) of the
+        JSON-representation of a valid value of this type or `None` if
+        there is no such bound.
+
+        The bound covers any escaping of strings but assumes a compact
+        encoding (as with `json.dumps(..., separators=(",", ":"))`),
+        i.e. no insignificant whitespace, duplicate keys, or numbers
+        with superfluous digits.
+        """
+        return None
+
+    def is_identity(self) -> bool:
+        """
+        Returns `True` if `make` returns valid input unchanged (or an
+        equal value), i.e. the output of a validation equals its input.
+        """
+        return False
+
     @property
     def __name__(self):
         return self.TYPE.__name__
@@ -27,7 +85,25 @@ class DPType(metaclass=abc.ABCMeta):
             _TYPES = [self, other]
             TYPE = self.TYPE | other.TYPE
             __name__ = f"{self.__name__} | {other.__name__}"
-            def make(self, json, loc: str) -> tuple[Any, str, int]:
+            def max_json_size(self) -> typing.Optional[int]:
+                sizes = [_type.max_json_size() for _type in self._TYPES]
+                if None in sizes:
+                    return None
+                return max(sizes)  # type: ignore[type-var]
+
+            def is_identity(self) -> bool:
+                # pylint: disable=import-outside-toplevel
+                from .integer import Integer
+                # an `Integer` only converts booleans, which may already
+                # be accepted by a preceding option
+                booleans = False
+                for _type in self._TYPES:
+                    if not _type.is_identity() \
+                            and (type(_type) is not Integer or not booleans):
+                        return False
+                    booleans = booleans or isinstance(True, _type.TYPE)
+                return True
+            def make(self, json, loc: str) -> tuple[typing.Any, str, int]:
                 # iterate all possible make-methods in _TYPES
                 last = None
                 for _type in self._TYPES:
@@ -56,23 +132,62 @@ class DPType(metaclass=abc.ABCMeta):
         return _()
 
 
-from .array import Array
-from .boolean import Boolean
-from .float import Float
-from .integer import Integer
-from .null import Null
-from .object import Object
-from .string import String
-from .uri import Uri
-from .url import Url
-from .file_system_object import FileSystemObject
-# import last due to dependence on base-types
-from .number import Number
-from .any import Any
+# static re-exports for type checkers (see `__getattr__`)
+if typing.TYPE_CHECKING:
+    from .array import Array
+    from .boolean import Boolean
+    from .float import Float
+    from .integer import Integer
+    from .null import Null
+    from .object import Object
+    from .string import String
+    from .uri import Uri
+    from .url import Url
+    from .file_system_object import FileSystemObject
+    from .number import Number
+    from .any import Any
+    from .ref import Ref
+    from .file_upload import FileUpload
+
+
+# concrete types are loaded lazily on first access (PEP 562)
+_TYPES = {
+    "Array": ".array",
+    "Boolean": ".boolean",
+    "Float": ".float",
+    "Integer": ".integer",
+    "Null": ".null",
+    "Object": ".object",
+    "String": ".string",
+    "Uri": ".uri",
+    "Url": ".url",
+    "FileSystemObject": ".file_system_object",
+    "Number": ".number",
+    "Any": ".any",
+    "Ref": ".ref",
+    "FileUpload": ".file_upload",
+}
+
+
+def __getattr__(name: str):
+    if name not in _TYPES:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'"
+        )
+    value = getattr(importlib.import_module(_TYPES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
     "DPType",
     "Any", "Array", "Boolean", "Float", "Integer", "Null", "Number", "Object",
-    "String", "Uri", "Url", "FileSystemObject",
+    "String", "Uri", "Url", "FileSystemObject", "Ref",
 ]
+# `FileUpload` requires werkzeug
+if find_spec("werkzeug") is not None:
+    __all__.append("FileUpload")
@@ -23,22 +23,7 @@ class Array(DPType):
                 Responses().GOOD.msg,
                 Responses().GOOD.status
             )
-        array = []
-        for element in json:
-            if not isinstance(element, self._items.TYPE):
-                return (
-                    None,
-                    f"Element in '{loc}' has bad type. Expected "
-                    + f"'{self._items.__name__}' but found "
-                    + f"'{type(element).__name__}'.",
-                    Responses().BAD_TYPE.status
-                )
-            child = self._items.make(element, loc)
-            if child[2] != Responses().GOOD.status:
-                return (None, child[1], child[2])
-            array.append(child[0])
-        return (
-            array,
-            Responses().GOOD.msg,
-            Responses().GOOD.status
-        )
+        return self._items.make_many(json, loc)
+
+    def is_identity(self) -> bool:
+        return self._items is None or self._items.is_identity()
@@ -9,6 +9,12 @@ class Boolean(DPType):
     """
     TYPE = bool
 
+    def max_json_size(self) -> int:
+        return len("false")
+
+    def is_identity(self) -> bool:
+        return True
+
     def make(self, json, loc: str) -> tuple[Any, str, int]:
         return (
             self.TYPE(json),
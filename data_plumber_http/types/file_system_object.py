@@ -1,9 +1,24 @@
 from typing import Any, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import os
+import stat
 
+from data_plumber_http.stat_cache import StatCache, stat_mode
 from . import DPType, Responses
 
 
+# predicates evaluated on the `st_mode` of an existing path
+_PREDICATES = {
+    "exists": lambda mode: True,
+    "is_file": stat.S_ISREG,
+    "is_dir": stat.S_ISDIR,
+    "is_fifo": stat.S_ISFIFO,
+}
+# placeholder for st_mode that has not been determined yet
+_UNKNOWN = object()
+
+
 class FileSystemObject(DPType):
     """
     A `FileSystemObject` corresponds to a `pathlib.Path` that is given
@@ -18,7 +33,21 @@ class FileSystemObject(DPType):
     cwd -- override the process's cwd; the input is appended to this
            `Path` before validation
            (default `None`)
-    Validation steps (leave as `None` to skip test):
+    stat_cache -- `StatCache` that is used to look up the results of
+                  `os.stat`-calls; can be shared between
+                  `FileSystemObject`s
+                  (default `None`)
+    batch -- if `True`, the items of an `Array(items=FileSystemObject(..))`
+             are validated as batch: paths sharing a parent directory are
+             looked up with a single `os.scandir`-call (if there are at
+             least `SCANDIR_THRESHOLD` paths in that directory) and the
+             remaining paths are checked concurrently
+             (default `False`)
+    max_workers -- maximum number of threads used for concurrent checks
+                   in batch-mode
+                   (default 8)
+    Validation steps (leave as `None` to skip test; all steps are
+    evaluated based on a single call to `os.stat`):
     exists -- if `True`, check for `pathlib.Path.exists` during
               validation
               (default `None`)
@@ -33,6 +62,7 @@ class FileSystemObject(DPType):
                (default `None`)
     """
     TYPE = str
+    SCANDIR_THRESHOLD = 8
 
     def __init__(
         self,
@@ -42,17 +72,39 @@ class FileSystemObject(DPType):
         is_file: Optional[bool] = None,
         is_dir: Optional[bool] = None,
         is_fifo: Optional[bool] = None,
+        stat_cache: Optional[StatCache] = None,
+        batch: bool = False,
+        max_workers: int = 8,
     ):
         self._relative_to = relative_to
         self._cwd = cwd
+        self._stat_cache = stat_cache
+        self._batch = batch
+        self._max_workers = max_workers
         self._validation_map = {
             "exists": exists,
             "is_file": is_file,
             "is_dir": is_dir,
             "is_fifo": is_fifo
         }
+        self._validate = any(
+            req is not None for req in self._validation_map.values()
+        )
 
-    def make(self, json, loc: str) -> tuple[Any, str, int]:
+    def _stat(self, path: Path) -> Optional[int]:
+        """
+        Returns `st_mode` of `path` (following symlinks) or `None` if
+        `path` does not exist or is not accessible.
+        """
+        if self._stat_cache is not None:
+            return self._stat_cache.stat(path)
+        return stat_mode(path)
+
+    def _resolve(self, json, loc: str) -> Path | tuple[Any, str, int]:
+        """
+        Returns `Path` that is to be validated for input `json` or
+        problem-tuple (see `make`).
+        """
         path = Path(json)
         if self._relative_to is not None:
             try:
@@ -69,12 +121,21 @@ class FileSystemObject(DPType):
                 )
         if self._cwd is not None:
             path = self._cwd / path
+        return path
+
+    def _check(
+        self, json, path: Path, mode: Optional[int], loc: str
+    ) -> tuple[Any, str, int]:
+        """
+        Returns result of validation steps for `path` based on its
+        `st_mode` (see `make`).
+        """
         for step, req in self._validation_map.items():
             if req is None:
                 continue
-            if getattr(path, step)() != req:
+            if (mode is not None and _PREDICATES[step](mode)) != req:
                 if req:
-                    if path.exists():
+                    if mode is not None:
                         return (
                             None,
                             Responses().BAD_RESOURCE.msg.format(
@@ -99,3 +160,102 @@ class FileSystemObject(DPType):
             Responses().GOOD.msg,
             Responses().GOOD.status
         )
+
+    def make(self, json, loc: str) -> tuple[Any, str, int]:
+        path = self._resolve(json, loc)
+        if not isinstance(path, Path):
+            return path
+        # a single stat-call answers all validation steps
+        return self._check(
+            json, path, self._stat(path) if self._validate else None, loc
+        )
+
+    @staticmethod
+    def _scandir(directory: Path, paths: list[Path]) -> list:
+        """
+        Returns list of `st_mode`s for `paths` (all located in
+        `directory`) based on a single `os.scandir`-call. Entries which
+        cannot be determined this way (e.g. symbolic links) are
+        `_UNKNOWN`.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return [None] * len(paths)
+        except (OSError, ValueError):
+            return [_UNKNOWN] * len(paths)
+        modes: list = []
+        for path in paths:
+            entry = entries.get(path.name)
+            # entries that are missing in the listing are checked again
+            # (e.g. case-insensitive file systems)
+            if entry is None or entry.is_symlink():
+                modes.append(_UNKNOWN)
+            elif entry.is_dir(follow_symlinks=False):
+                modes.append(stat.S_IFDIR)
+            elif entry.is_file(follow_symlinks=False):
+                modes.append(stat.S_IFREG)
+            else:
+                modes.append(_UNKNOWN)
+        return modes
+
+    def make_many(self, json: list, loc: str) -> tuple[Any, str, int]:
+        if not self._batch or not self._validate:
+            return super().make_many(json, loc)
+        # resolve paths
+        paths: list = []
+        for element in json:
+            if not isinstance(element, self.TYPE):
+                return (
+                    None,
+                    f"Element in '{loc}' has bad type. Expected "
+                    + f"'{self.__name__}' but found "
+                    + f"'{type(element).__name__}'.",
+                    Responses().BAD_TYPE.status
+                )
+            paths.append(self._resolve(element, loc))
+        # group by parent directory and answer large groups by scandir
+        groups: dict[Path, list[int]] = {}
+        for index, path in enumerate(paths):
+            if isinstance(path, Path) and path.name not in ("", ".", ".."):
+                groups.setdefault(path.parent, []).append(index)
+        modes: list = [_UNKNOWN] * len(paths)
+        for directory, indices in groups.items():
+            if len(indices) < self.SCANDIR_THRESHOLD:
+                continue
+            for index, mode in zip(
+                indices, self._scandir(directory, [paths[i] for i in indices])
+            ):
+                modes[index] = mode
+        # check remaining paths concurrently
+        remaining = [
+            index for index, path in enumerate(paths)
+            if isinstance(path, Path) and modes[index] is _UNKNOWN
+        ]
+        if len(remaining) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(remaining))
+            ) as executor:
+                for index, mode in zip(
+                    remaining,
+                    executor.map(self._stat, (paths[i] for i in remaining))
+                ):
+                    modes[index] = mode
+        else:
+            for index in remaining:
+                modes[index] = self._stat(paths[index])
+        # evaluate in original order
+        array = []
+        for element, path, mode in zip(json, paths, modes):
+            if not isinstance(path, Path):
+                return path
+            child = self._check(element, path, mode, loc)
+            if child[2] != Responses().GOOD.status:
+                return (None, child[1], child[2])
+            array.append(child[0])
+        return (
+            array,
+            Responses().GOOD.msg,
+            Responses().GOOD.status
+        )
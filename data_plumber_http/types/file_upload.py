@@ -0,0 +1,104 @@
+from typing import Any, Optional
+import os
+
+from werkzeug.datastructures import FileStorage
+
+from . import DPType, Responses
+
+
+class FileUpload(DPType):
+    """
+    A `FileUpload` corresponds to an uploaded file in multipart form
+    data (e.g. `flask_files`). The output is the
+    `werkzeug.datastructures.FileStorage`-object.
+
+    The file content is never read as a whole: the size is determined
+    by seeking to the end of the stream and only the first bytes are
+    read to check the signature. Afterwards, the stream is rewound to
+    its original position.
+
+    Keyword arguments:
+    max_size -- maximum file size in bytes
+                (default `None`)
+    content_types -- list of allowed content types (as declared by the
+                     client) like 'image/png' or 'image/*'
+                     (default `None`)
+    signatures -- list of allowed magic-byte signatures; the content
+                  has to start with one of these
+                  (default `None`)
+    """
+    TYPE = FileStorage
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        content_types: Optional[list[str]] = None,
+        signatures: Optional[list[bytes]] = None
+    ):
+        self._max_size = max_size
+        self._content_types = content_types
+        self._signatures = signatures
+        self._head = max(map(len, signatures)) if signatures else 0
+
+    def _inspect(self, stream) -> tuple[bytes, int]:
+        """
+        Returns the first bytes (as many as needed for the signatures)
+        and the size of the remaining content of `stream`. The stream is
+        rewound afterwards.
+        """
+        start = stream.tell()
+        try:
+            head = stream.read(self._head) if self._head else b""
+            size = stream.seek(0, os.SEEK_END) - start
+        finally:
+            stream.seek(start)
+        return head, size
+
+    @staticmethod
+    def _problem(json, loc: str, expected: str) -> tuple[Any, str, int]:
+        return (
+            None,
+            Responses().BAD_VALUE.msg.format(
+                origin=json.filename, loc=loc, expected=expected
+            ),
+            Responses().BAD_VALUE.status
+        )
+
+    def _accepts_content_type(self, mimetype: str) -> bool:
+        return any(
+            mimetype == c
+            or (c.endswith("/*") and mimetype.startswith(c[:-1]))
+            for c in self._content_types  # type: ignore[union-attr]
+        )
+
+    def make(self, json, loc: str) -> tuple[Any, str, int]:
+        # validate content type (no need to touch the stream)
+        if self._content_types is not None \
+                and not self._accepts_content_type(json.mimetype):
+            return self._problem(
+                json, loc,
+                "content type one of "
+                + ", ".join(f"'{c}'" for c in self._content_types)
+            )
+        if self._max_size is None and self._signatures is None:
+            return (json, Responses().GOOD.msg, Responses().GOOD.status)
+        # reject based on size declared in the part's headers (if any)
+        if self._max_size is not None \
+                and json.content_length > self._max_size:
+            return self._problem(json, loc, f"at most {self._max_size} bytes")
+        try:
+            head, size = self._inspect(json.stream)
+        except (OSError, ValueError):
+            return self._problem(json, loc, "a seekable file stream")
+        # validate signature
+        if self._signatures is not None \
+                and not any(head.startswith(s) for s in self._signatures):
+            return self._problem(json, loc, "a known file signature")
+        # validate size
+        if self._max_size is not None and size > self._max_size:
+            return self._problem(json, loc, f"at most {self._max_size} bytes")
+        return (
+            json,
+            Responses().GOOD.msg,
+            Responses().GOOD.status
+        )
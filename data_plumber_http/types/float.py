@@ -3,6 +3,11 @@ from typing import Any, Optional
 from . import DPType, Responses
 
 
+# length of the longest shortest round-trip representation of a float
+# (e.g. '-2.2250738585072014e-308')
+_MAX_FLOAT_LENGTH = 24
+
+
 class Float(DPType):
     """
     A `Float` represents a floating point number.
@@ -96,3 +101,13 @@ class Float(DPType):
             Responses().GOOD.msg,
             Responses().GOOD.status
         )
+
+    def max_json_size(self) -> int:
+        if self._values is not None:
+            return max(
+                (len(repr(float(v))) for v in self._values), default=0
+            )
+        return _MAX_FLOAT_LENGTH
+
+    def is_identity(self) -> bool:
+        return True
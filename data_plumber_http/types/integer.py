@@ -1,4 +1,5 @@
 from typing import Any, Optional
+import math
 
 from . import DPType, Responses
 
@@ -96,3 +97,22 @@ class Integer(DPType):
             Responses().GOOD.msg,
             Responses().GOOD.status
         )
+
+    def max_json_size(self) -> Optional[int]:
+        # booleans pass the type check of an Integer
+        if self._values is not None:
+            return max([len("false"), *(len(str(v)) for v in self._values)])
+        low = self._min_value_inclusive if self._min_value_inclusive \
+            is not None else self._min_value
+        high = self._max_value_inclusive if self._max_value_inclusive \
+            is not None else self._max_value
+        if low is None or high is None:
+            return None
+        return max(
+            len("false"),
+            *(len(str(math.ceil(abs(b)))) + (b < 0) for b in (low, high))
+        )
+
+    def is_identity(self) -> bool:
+        # booleans (which pass the type check) are converted into int
+        return False
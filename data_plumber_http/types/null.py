@@ -10,6 +10,12 @@ class Null(DPType):
     """
     TYPE = NoneType
 
+    def max_json_size(self) -> int:
+        return len("null")
+
+    def is_identity(self) -> bool:
+        return True
+
     def make(self, json, loc: str) -> tuple[Any, str, int]:
         return (
             None,
@@ -1,11 +1,19 @@
 from typing import TypeAlias, Mapping, Optional, Callable, Any
+from time import perf_counter
+from types import MappingProxyType
+import dataclasses
+import inspect
 
-from data_plumber import Pipeline, Stage
+from data_plumber import Stage
 from data_plumber.output import StageRecord
 
 from data_plumber_http.output import Output
+from data_plumber_http.execution import Pipeline
+from data_plumber_http.instrumentation import Instrumentation
+from data_plumber_http.registry import SchemaRegistry
 from data_plumber_http.keys import DPKey, Property
 from . import DPType, Responses
+from .string import max_json_string_size
 
 
 Properties: TypeAlias = Mapping[DPKey, "DPType | Properties"]
@@ -17,7 +25,14 @@ class Object(DPType):
 
     Keyword arguments:
     model -- data model or factory for this `Object` (gets passed the
-             entire output of a validation-run as kwargs)
+             entire output of a validation-run as kwargs; dataclasses,
+             namedtuples, and classes that declare their field order via
+             `__match_args__` are constructed from positional arguments
+             if the output contains exactly the positional parameters of
+             their constructor in that order);
+             the values "record" and "frozen_record" generate a slotted
+             (and frozen) dataclass with the property names as fields
+             (missing fields default to `None`) to be used as model
              (default `None`; corresponds to dictionary)
     properties -- mapping for explicitly expected contents of this
                   `Object`
@@ -41,18 +56,24 @@ class Object(DPType):
     free_form -- if `True`, accept and use any content that has not been
                  defined explicitly via `properties`
                  (default `False`)
+
+    passthrough -- if `True`, the output of a validation is a read-only
+                   view (`types.MappingProxyType`) of the input instead
+                   of a copy; requires an `Object` that does not
+                   transform its input (see `is_identity`)
+                   (default `False`)
     """
     TYPE = dict
 
     def __init__(
         self,
-        model: Optional[type | Callable[..., Any]] = None,
+        model: Optional[type | Callable[..., Any] | str] = None,
         properties: Optional[Properties] = None,
         additional_properties: Optional[bool | DPType] = None,
         accept_only: Optional[list[str]] = None,
-        free_form: bool = False
+        free_form: bool = False,
+        passthrough: bool = False
     ) -> None:
-        self._model = model or dict
         self.properties = properties or {}
 
         if properties is not None:
@@ -105,6 +126,115 @@ class Object(DPType):
             self._additional_properties = True
             self._additional_properties_typespec = additional_properties
 
+        self._model: Callable[..., Any]
+        if isinstance(model, str):
+            self._model = self._make_record(model)
+        else:
+            self._model = model or dict
+        self._fields = self._field_order(self._model)
+
+        if passthrough and not self.is_identity():
+            raise ValueError(
+                "Unable to use 'passthrough' for an 'Object' that transforms "
+                + "its input (requires default 'model', 'Property'-keys "
+                + "without 'name', 'default', or 'validation_only', "
+                + "identity-types as values, and no ignored properties)."
+            )
+        self._passthrough = passthrough
+        # properties of a passthrough-Object are only validated
+        self._validation_properties = {
+            Property(k.origin, required=k.required, validation_only=True): v
+            for k, v in self.properties.items()
+            if isinstance(k, Property)  # only Property-keys (see above)
+        } if passthrough else None
+
+    @staticmethod
+    def _property_names(properties: Properties) -> list[str]:
+        """
+        Returns names of all `Property`s in `properties` (including
+        those nested in `OneOf`/`AllOf`).
+        """
+        names = []
+        for k, v in properties.items():
+            if isinstance(k, Property):
+                names.append(k.name)
+            elif isinstance(v, Mapping):
+                names.extend(
+                    n for n in Object._property_names(v) if n not in names
+                )
+            else:
+                raise ValueError(
+                    f"Unable to determine output names of key '{k}'."
+                )
+        return names
+
+    def _make_record(self, model: str) -> type:
+        """
+        Returns slotted record-class (dataclass) for this `Object`.
+
+        Keyword arguments:
+        model -- either "record" or "frozen_record"
+        """
+        if model not in ("record", "frozen_record"):
+            raise ValueError(f"Bad value for 'model' of 'Object' ('{model}').")
+        if self._free_form or self._additional_properties_typespec:
+            raise ValueError(
+                f"Value of 'model' ('{model}') conflicts with "
+                + "'free_form' and 'additional_properties' as type."
+            )
+        try:
+            return dataclasses.make_dataclass(
+                "Record",
+                [
+                    (name, Any, dataclasses.field(default=None))
+                    for name in self._property_names(self.properties)
+                ],
+                slots=True,
+                frozen=model == "frozen_record"
+            )
+        except TypeError as exc_info:  # bad identifier
+            raise ValueError(
+                f"Unable to generate record for 'Object': {exc_info}"
+            ) from exc_info
+
+    @staticmethod
+    def _field_order(model) -> Optional[tuple[str, ...]]:
+        """
+        Returns order of positional constructor-arguments for `model`
+        or `None` if it cannot be determined.
+
+        Only dataclasses, namedtuples, and classes with `__match_args__`
+        are considered. The order is taken from the signature of the
+        constructor (such that, e.g., `InitVar`s or fields with
+        `init=False` are taken into account correctly).
+        """
+        if not isinstance(model, type):
+            return None
+        namedtuple = issubclass(model, tuple) and hasattr(model, "_fields")
+        match_args = getattr(model, "__match_args__", None)
+        if not dataclasses.is_dataclass(model) and not namedtuple \
+                and not isinstance(match_args, tuple):
+            return None
+        try:
+            parameters = inspect.signature(model).parameters.values()
+        except (TypeError, ValueError):  # signature not available
+            return None
+        fields = tuple(
+            p.name for p in parameters
+            if p.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD
+            )
+        )
+        return fields or None
+
+    def _construct(self, kwargs: dict) -> Any:
+        """Returns instance of `model` generated from `kwargs`."""
+        # positional arguments if kwargs have been collected in field order
+        if self._fields is not None and tuple(kwargs) == self._fields:
+            return self._model(*kwargs.values())
+        return self._model(**kwargs)
+
     @staticmethod
     def _reject_unknown_args(accepted, loc):
         return Stage(
@@ -140,23 +270,22 @@ class Object(DPType):
         loc -- position in original `json`
         """
         return Stage(
-            primer=lambda json, **kwargs: Object(
+            primer=lambda json, partial=False, coerce=False, **kwargs: Object(
                     properties={
                         Property(k): dptype for k in additional
                     }
-                ).assemble(loc).run(json=json)
+                ).assemble(loc, register=False).run(
+                    json=json,
+                    **({"partial": True} if partial else {}),
+                    **({"coerce": True} if coerce else {})
+                )
                 if len(
                     additional := [k for k in json.keys() if k not in keys]
                 ) > 0
                 else None,  # return None if Object is empty > simply return with
                             # Responses().GOOD
             action=lambda out, primer, **kwargs:
-                [
-                    out.update({"kwargs": {}})
-                    if "kwargs" not in out
-                    else None,
-                    out.kwargs.update(primer.data.get("kwargs", {}))
-                ]
+                out.kwargs.update(primer.data.kwargs)
                 if primer and primer.last_status == Responses().GOOD.status
                 else None,
             status=lambda primer, **kwargs:
@@ -165,6 +294,17 @@ class Object(DPType):
                 primer.last_message if primer else Responses().GOOD.msg,
         )
 
+    @staticmethod
+    def _complete():
+        """
+        Defines a `Stage` that completes the validation of a
+        `passthrough`-`Object` with `Responses().GOOD`.
+        """
+        return Stage(
+            status=lambda **kwargs: Responses().GOOD.status,
+            message=lambda **kwargs: Responses().GOOD.msg,
+        )
+
     @staticmethod
     def _process_free_form(keys):
         """
@@ -179,17 +319,14 @@ class Object(DPType):
             primer=lambda json, **kwargs:
                 {k: v for k, v in json.items() if k not in keys},
             action=lambda out, primer, **kwargs:
-                [
-                    out.update({"kwargs": {}})
-                    if "kwargs" not in out
-                    else None,
-                    out.kwargs.update(primer)
-                ],
+                out.kwargs.update(primer),
             status=lambda **kwargs: Responses().GOOD.status,
             message=lambda **kwargs: Responses().GOOD.msg,
         )
 
-    def make(self, json, loc: str) -> tuple[Any, str, int]:
+    def make(
+        self, json, loc: str, partial: bool = False
+    ) -> tuple[Any, str, int]:
         """
         Validate and instantiate type based on `json`.
 
@@ -202,8 +339,14 @@ class Object(DPType):
         json -- data to generate object from
         loc -- current location in validation process for generating
                informative messages
+        partial -- if `True`, validate in partial mode (see `assemble`)
+                   (default `False`)
         """
-        output = self.assemble(loc).run(json=json)
+        pipeline = SchemaRegistry().pipeline(self, loc)
+        if partial:
+            output = pipeline.run(json=json, partial=True)
+        else:
+            output = pipeline.run(json=json)
         return (
             (
                 output.data.value
@@ -214,65 +357,200 @@ class Object(DPType):
             output.last_status or Responses().GOOD.status
         )
 
-    def assemble(self, _loc: Optional[str] = None) -> Pipeline:
+    def is_identity(self) -> bool:
+        """
+        Returns `True` if the output of a validation equals its input,
+        i.e. if this `Object` uses the default `model`, all keys are
+        `Property`s without `name`, `default`, or `validation_only`, all
+        values are identity-types, and there are no properties that are
+        ignored (unknown properties are either rejected via
+        `accept_only`/`additional_properties=False` or kept via
+        `free_form`/`additional_properties` as identity-type).
         """
-        Returns `Pipeline` that processes a `json`-input.
+        if self._model is not dict:
+            return False
+        origins = set()
+        for k, v in self.properties.items():
+            if type(k) is not Property or k.name != k.origin \
+                    or k.default is not None or k.validation_only \
+                    or not isinstance(v, DPType) or not v.is_identity():
+                return False
+            origins.add(k.origin)
+        if self._free_form:
+            return True
+        if self._additional_properties_typespec is not None:
+            return self._additional_properties_typespec.is_identity()
+        return self._accept_only is not None \
+            and set(self._accept_only) <= origins
+
+    def max_json_size(self) -> Optional[int]:
+        """
+        Returns an upper bound for the size (in bytes) of the
+        JSON-representation of a valid value of this `Object` or `None`
+        if there is no such bound (see `DPType.max_json_size`).
+
+        Only `Object`s that reject unknown properties (`accept_only` or
+        `additional_properties=False`) and whose accepted properties are
+        all bounded have a bound. The bound only applies to the compact
+        encoding; request bodies with insignificant whitespace can be
+        larger (see `flask_handler(max_content_length=..)`).
+        """
+        if self._accept_only is None:
+            return None
+        accepted = set(self._accept_only)
+        sizes: dict[str, int] = {}
+        stack = [self.properties]
+        while stack:
+            for key, value in stack.pop().items():
+                if not isinstance(value, DPType):  # OneOf/AllOf
+                    stack.append(value)
+                    continue
+                if not isinstance(key, Property) \
+                        or key.origin not in accepted:
+                    continue
+                if (size := value.max_json_size()) is None:
+                    return None
+                sizes[key.origin] = max(sizes.get(key.origin, 0), size)
+        # accepted keys without Property can have any value
+        if len(sizes) < len(accepted):
+            return None
+        return len("{}") + max(len(sizes) - 1, 0) + sum(
+            max_json_string_size(len(k)) + len(":") + size
+            for k, size in sizes.items()
+        )
+
+    def assemble(
+        self, _loc: Optional[str] = None, register: bool = True
+    ) -> Pipeline:
+        """
+        Returns `Pipeline` that processes a `json`-input. Top-level
+        `Object`s (without `_loc`) are registered with the
+        `SchemaRegistry` (unless `register` is `False`).
+
+        If `Pipeline.run` is called with the additional keyword argument
+        `timings` (a dictionary), the time spent on constructing the
+        model is stored as `timings["model"]` (in seconds).
+
+        If `Pipeline.run` is called with the additional keyword argument
+        `partial=True` (e.g. for PATCH-requests), the `json` is validated
+        in partial mode: required properties may be missing, defaults are
+        not applied, and nested `Object`s are validated in partial mode
+        as well. The output then only contains the given properties as a
+        dictionary (instead of an instance of `model`).
+
+        If `Pipeline.run` is called with the additional keyword argument
+        `coerce=True` (e.g. for query-string or form data), string values
+        are converted into the expected scalar type and repeated keys are
+        collected for `Array`s (see `data_plumber_http.coercion.coerce`).
+
+        If `Pipeline.run` is called with the additional keyword argument
+        `expand_records=True`, the records of the (fused) `Property`-
+        `Stage`s are expanded into records of their individual steps
+        (see `Property.assemble`).
+
+        For `passthrough`-`Object`s, the properties are only validated
+        (no output is collected) and the output is a read-only view of
+        the input (a new dictionary in coerce-mode).
+
+        Keyword arguments:
+        _loc -- location of this `Object` within the `json`
+                (default `None`; top-level)
+        register -- if `False`, do not register a top-level `Object`
+                    with the `SchemaRegistry` (for internal or temporary
+                    `Object`s)
+                    (default `True`)
         """
-        def finalizer(data, records, **kwargs):
-            try:
-                if records[-1].status == Responses().GOOD.status:
-                    data.value = self._model(**data.kwargs)
-            except IndexError:  # empty Object
+        def finalizer(
+            data, records, last_status, timings=None, partial=False,
+            coerce=False, expand_records=False, **kwargs
+        ):
+            if expand_records:
+                Property.expand_records(records, kwargs)
+            if timings is not None:
+                start = perf_counter()
+            # the status of the last Stage is provided by the Pipeline
+            # (independent of the records; see `ExecutionMode`)
+            if last_status is None:  # empty Object
                 records.append(StageRecord(
                     0, "finalizer", Responses().GOOD.msg, Responses().GOOD.status
                 ))
-                data.value = self._model()
+                data.value = {} if partial else self._model()
+            elif last_status == Responses().GOOD.status:
+                if self._passthrough:
+                    data.value = self._passthrough_output(
+                        data, coerce, **kwargs
+                    )
+                else:
+                    data.value = dict(data.kwargs) if partial \
+                        else self._construct(data.kwargs)
+            if timings is not None:
+                timings["model"] = perf_counter() - start
         p = Pipeline(
             exit_on_status=lambda status: status >= 400,
             initialize_output=Output,
             finalize_output=finalizer
         )
         __loc = _loc or "."
-        if self._accept_only is not None:
+        if _loc is None and register:
+            SchemaRegistry().register(self)
+
+        def append(id_, stage):
             p.append(
-                __loc,
-                **{__loc: self._reject_unknown_args(self._accept_only, __loc)}
+                id_, **{id_: Instrumentation().stage(stage, __loc, "", id_)}
+            )
+
+        if self._accept_only is not None:
+            append(
+                __loc, self._reject_unknown_args(self._accept_only, __loc)
             )
         if self._additional_properties_typespec is not None:
             # additional properties
-            p.append(
+            append(
                 f"{__loc}[additionalProperties]",
-                **{
-                    f"{__loc}[additionalProperties]":
-                        self._process_additional_properties(
-                            list(set().union(
-                                *[
-                                    k.get_origins(v)
-                                    for k, v in self.properties.items()
-                                ]
-                            )),
-                            self._additional_properties_typespec,
-                            _loc
-                        )
-                }
+                self._process_additional_properties(
+                    list(set().union(
+                        *[
+                            k.get_origins(v)
+                            for k, v in self.properties.items()
+                        ]
+                    )),
+                    self._additional_properties_typespec,
+                    _loc
+                )
             )
-        if self._free_form:
+        if self._free_form and not self._passthrough:
             # free-form
-            p.append(
+            append(
                 f"{__loc}[freeForm]",
-                **{
-                    f"{__loc}[freeForm]":
-                        self._process_free_form(
-                            list(set().union(
-                                *[
-                                    k.get_origins(v)
-                                    for k, v in self.properties.items()
-                                ]
-                            ))
-                        )
-                }
+                self._process_free_form(
+                    list(set().union(
+                        *[
+                            k.get_origins(v)
+                            for k, v in self.properties.items()
+                        ]
+                    ))
+                )
             )
-        for k, v in self.properties.items():
+        for k, v in (self._validation_properties or self.properties).items():
             p.append(k.assemble(v, _loc))
+        if self._passthrough:
+            # validation-only properties may end on MISSING_OPTIONAL
+            append(f"{__loc}[passthrough]", self._complete())
 
         return p
+
+    def _passthrough_output(self, data, coerce: bool, json, **kwargs):
+        """
+        Returns output of a `passthrough`-`Object` for `json`. In
+        coerce-mode, the (coerced) values are collected from the exports
+        of the properties and `data.kwargs` (additional properties).
+        """
+        if not coerce:
+            return MappingProxyType(json)
+        value = dict(json.items())
+        value.update(data.kwargs)
+        for k in self.properties:
+            if isinstance(k, Property) \
+                    and (export := f"EXPORT_{k.origin}") in kwargs:
+                value[k.origin] = kwargs[export]
+        return value
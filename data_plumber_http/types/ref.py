@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from . import DPType
+
+if TYPE_CHECKING:
+    from data_plumber_http.engine import IterativeValidator
+
+
+class Ref(DPType):
+    """
+    A `Ref` is a lazy reference to another `DPType`. It can be used to
+    define recursive schemas, e.g. an `Object` that contains an `Array`
+    of the same `Object`:
+
+     >>> Node = Object(properties={
+     ...     Property("children"): Array(items=Ref(lambda: Node))
+     ... })
+
+    The target is resolved on first use. `Object`-targets are validated
+    by a single `IterativeValidator` that is shared by all levels of
+    recursion (instead of assembling a `Pipeline` per level).
+
+    Keyword arguments:
+    target -- either the referenced `DPType` or a callable without
+              arguments that returns the referenced `DPType`
+    """
+
+    def __init__(self, target: DPType | Callable[[], DPType]) -> None:
+        self._target = target
+        self._resolved: Optional[DPType] = None
+        self._validator: Optional["IterativeValidator | DPType"] = None
+
+    @property
+    def target(self) -> DPType:
+        """Referenced `DPType` (resolved on first access)."""
+        if self._resolved is None:
+            target = self._target
+            if not isinstance(target, DPType) and callable(target):
+                target = target()
+            if not isinstance(target, DPType):
+                raise ValueError(
+                    f"Bad target for 'Ref' ({target!r}), expected 'DPType'."
+                )
+            self._resolved = target
+        return self._resolved
+
+    @property
+    def TYPE(self):
+        return self.target.TYPE
+
+    @property
+    def __name__(self):
+        return self.target.__name__
+
+    def make(
+        self, json, loc: str, partial: bool = False
+    ) -> tuple[Any, str, int]:
+        if self._validator is None:
+            # pylint: disable=import-outside-toplevel
+            from data_plumber_http.engine import IterativeValidator
+            from .object import Object
+            target = self.target
+            self._validator = IterativeValidator(target) \
+                if type(target) is Object else target
+        # only Object-targets (shared validator) support partial mode
+        if partial and not isinstance(self._validator, DPType):
+            return self._validator.make(json, loc, partial=True)
+        return self._validator.make(json, loc)
@@ -1,9 +1,25 @@
 from typing import Any, Optional
+import sys
 import re
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+    from re._constants import MAXREPEAT  # type: ignore[import-not-found]
+else:  # pragma: no cover
+    import sre_parse
+    from sre_constants import MAXREPEAT
 
 from . import DPType, Responses
 
 
+def max_json_string_size(length: int) -> int:
+    """
+    Returns upper bound for the size (in bytes) of a JSON-string with
+    `length` characters (including quotes; every character may be
+    escaped as surrogate pair like '\\ud83d\\ude00').
+    """
+    return 2 + 12 * length
+
+
 class String(DPType):
     """
     A `String` corresponds to the JSON-type 'string'.
@@ -52,3 +68,22 @@ class String(DPType):
             Responses().GOOD.msg,
             Responses().GOOD.status
         )
+
+    def max_json_size(self) -> Optional[int]:
+        if self._enum is not None:
+            return max(
+                (max_json_string_size(len(v)) for v in self._enum),
+                default=0
+            )
+        if self._pattern is not None:
+            try:
+                width = sre_parse.parse(self._pattern).getwidth()[1]
+            except re.error:
+                return None
+            if width >= MAXREPEAT:
+                return None
+            return max_json_string_size(width)
+        return None
+
+    def is_identity(self) -> bool:
+        return True
@@ -1,10 +1,9 @@
-from typing import Any, Optional
-from urllib.parse import urlparse
+from typing import Optional
 
-from . import DPType, Responses
+from .url_base import _UrlBase
 
 
-class Uri(DPType):
+class Uri(_UrlBase):
     """
     A `Uri` essentially is a `String` which has to match a uri-format of
     `<scheme>://<authority>/<path>?<query>#<fragment>`. The output
@@ -19,45 +18,24 @@ class Uri(DPType):
     return_parsed -- if `True`, returns a named tuple as generated by
                      `urllib.parse.urlparse` instead of string
                      (default `False`)
+    allowed_hosts -- list of accepted hosts; the leftmost label of an
+                     entry can be a wildcard like in `*.example.com`
+                     to accept any subdomain
+                     (default `None` (accept any))
+    denied_hosts -- list of rejected hosts (same format as
+                    `allowed_hosts`)
+                    (default `None`)
     """
-    TYPE = str
+    _NETLOC = "authority"
 
     def __init__(
         self,
         schemes: Optional[list[str]] = None,
         require_authority: bool = False,
-        return_parsed: bool = False
+        return_parsed: bool = False,
+        allowed_hosts: Optional[list[str]] = None,
+        denied_hosts: Optional[list[str]] = None
     ):
-        self._schemes = schemes
-        self._require_authority = require_authority
-        self._return_parsed = return_parsed
-
-    def make(self, json, loc: str) -> tuple[Any, str, int]:
-        uri = urlparse(json)
-        if self._schemes is not None and uri.scheme not in self._schemes:
-            return (
-                None,
-                Responses().BAD_VALUE.msg.format(
-                    origin=json,
-                    loc=loc,
-                    expected="scheme to be "
-                    + ("one of " if len(self._schemes) > 1 else "")
-                    + ", ".join(f"'{v}'" for v in self._schemes)
-                ),
-                Responses().BAD_VALUE.status
-            )
-        if self._require_authority and uri.netloc == "":
-            return (
-                None,
-                Responses().BAD_VALUE.msg.format(
-                    origin=json,
-                    loc=loc,
-                    expected="non-empty authority"
-                ),
-                Responses().BAD_VALUE.status
-            )
-        return (
-            uri if self._return_parsed else json,
-            Responses().GOOD.msg,
-            Responses().GOOD.status
+        super().__init__(
+            schemes, require_authority, return_parsed, allowed_hosts, denied_hosts
         )
@@ -0,0 +1,214 @@
+from typing import Any, Optional
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from . import DPType, Responses
+
+
+# number of parse results kept in memory for repeated inputs
+PARSE_CACHE_SIZE = 1024
+# characters that are removed/stripped by `urlparse` before the scheme
+# is determined; inputs containing these skip the scheme-prefilter
+_UNSAFE_CHARACTERS = ("\t", "\r", "\n")
+
+
+class _HostTrie:
+    """
+    Set of host-patterns that is stored as a trie of reversed domain
+    labels. A pattern is either a plain hostname (`example.com`) or a
+    wildcard (`*.example.com`) that matches any subdomain (but not the
+    domain itself). A lookup requires at most one step per label of the
+    given hostname.
+
+    Keyword arguments:
+    patterns -- list of host-patterns
+    """
+    _EXACT = 0  # marker-keys; labels are always strings
+    _WILDCARD = 1
+
+    def __init__(self, patterns: list[str]) -> None:
+        self._root: dict = {}
+        for pattern in patterns:
+            labels = pattern.lower().rstrip(".").split(".")
+            wildcard = labels[0] == "*"
+            if wildcard:
+                labels = labels[1:]
+            if any(label in ("", "*") for label in labels):
+                raise ValueError(
+                    f"Bad host-pattern '{pattern}' (wildcards are only "
+                    + "allowed as leftmost label like in '*.example.com')."
+                )
+            node = self._root
+            for label in reversed(labels):
+                node = node.setdefault(label, {})
+            node[self._WILDCARD if wildcard else self._EXACT] = True
+
+    def __contains__(self, host: str) -> bool:
+        labels = host.rstrip(".").split(".")
+        node = self._root
+        for index in range(len(labels) - 1, -1, -1):
+            if self._WILDCARD in node:
+                return True
+            child = node.get(labels[index])
+            if child is None:
+                return False
+            node = child
+        return self._EXACT in node
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _urlparse(url: str):
+    """Memoized version of `urllib.parse.urlparse`."""
+    return urlparse(url)
+
+
+class _UrlBase(DPType):
+    """
+    Common base for the url-like types `Url` and `Uri`.
+
+    Before a value is parsed, its scheme is checked against `schemes`
+    by simple prefix-matching. Only inputs that pass this check are
+    parsed (results are memoized).
+
+    Keyword arguments:
+    schemes -- list of strings that are accepted as schemes
+    require_netloc -- if `True`, only values with non-empty netloc are
+                      accepted
+    return_parsed -- if `True`, returns a named tuple as generated by
+                     `urllib.parse.urlparse` instead of string
+    allowed_hosts -- list of host-patterns that are accepted
+    denied_hosts -- list of host-patterns that are rejected
+    """
+    TYPE = str
+    _NETLOC = "netloc"  # name of netloc-section used in messages
+
+    def __init__(
+        self,
+        schemes: Optional[list[str]],
+        require_netloc: bool,
+        return_parsed: bool,
+        allowed_hosts: Optional[list[str]] = None,
+        denied_hosts: Optional[list[str]] = None
+    ):
+        self._schemes = schemes
+        self._require_netloc = require_netloc
+        self._return_parsed = return_parsed
+        # an empty scheme cannot be checked by prefix
+        if schemes is not None and "" not in schemes:
+            self._scheme_prefixes: Optional[tuple[str, ...]] = tuple(
+                s.lower() + ":" for s in schemes
+            )
+            self._scheme_prefix_length = max(
+                map(len, self._scheme_prefixes), default=0
+            )
+        else:
+            self._scheme_prefixes = None
+            self._scheme_prefix_length = 0
+        self._allowed_hosts = \
+            _HostTrie(allowed_hosts) if allowed_hosts is not None else None
+        self._denied_hosts = \
+            _HostTrie(denied_hosts) if denied_hosts is not None else None
+
+    def _bad_scheme(self, json, loc: str) -> tuple[Any, str, int]:
+        return (
+            None,
+            Responses().BAD_VALUE.msg.format(
+                origin=json,
+                loc=loc,
+                expected="scheme to be "
+                + ("one of " if len(self._schemes) > 1 else "")  # type: ignore[arg-type]
+                + ", ".join(f"'{v}'" for v in self._schemes)  # type: ignore[union-attr]
+            ),
+            Responses().BAD_VALUE.status
+        )
+
+    def _rejected_by_prefix(self, json: str) -> bool:
+        """
+        Returns `True` if `json` can be rejected based on its scheme
+        without parsing.
+        """
+        if self._scheme_prefixes is None:
+            return False
+        # leading whitespace/control characters or characters that are
+        # removed by urlparse require a full parse
+        if json[:1] <= " " or any(c in json for c in _UNSAFE_CHARACTERS):
+            return False
+        return not json[:self._scheme_prefix_length].lower().startswith(
+            self._scheme_prefixes
+        )
+
+    def make(self, json, loc: str) -> tuple[Any, str, int]:
+        if self._rejected_by_prefix(json):
+            return self._bad_scheme(json, loc)
+        url = _urlparse(json)
+        if self._schemes is not None and url.scheme not in self._schemes:
+            return self._bad_scheme(json, loc)
+        if self._require_netloc and url.netloc == "":
+            return (
+                None,
+                Responses().BAD_VALUE.msg.format(
+                    origin=json,
+                    loc=loc,
+                    expected=f"non-empty {self._NETLOC}"
+                ),
+                Responses().BAD_VALUE.status
+            )
+        if self._allowed_hosts is not None or self._denied_hosts is not None:
+            try:
+                host = url.hostname
+            except ValueError:  # malformed netloc
+                host = None
+            if self._denied_hosts is not None and host is not None \
+                    and host in self._denied_hosts:
+                return (
+                    None,
+                    Responses().BAD_VALUE.msg.format(
+                        origin=json,
+                        loc=loc,
+                        expected=f"host other than '{host}'"
+                    ),
+                    Responses().BAD_VALUE.status
+                )
+            if self._allowed_hosts is not None \
+                    and (host is None or host not in self._allowed_hosts):
+                return (
+                    None,
+                    Responses().BAD_VALUE.msg.format(
+                        origin=json,
+                        loc=loc,
+                        expected="host from list of allowed hosts"
+                    ),
+                    Responses().BAD_VALUE.status
+                )
+        return (
+            url if self._return_parsed else json,
+            Responses().GOOD.msg,
+            Responses().GOOD.status
+        )
+
+    def is_identity(self) -> bool:
+        return not self._return_parsed
+
+    def make_many(self, json: list, loc: str) -> tuple[Any, str, int]:
+        # repeated elements share a single result
+        results: dict[str, tuple[Any, str, int]] = {}
+        array = []
+        for element in json:
+            if not isinstance(element, self.TYPE):
+                return (
+                    None,
+                    f"Element in '{loc}' has bad type. Expected "
+                    + f"'{self.__name__}' but found "
+                    + f"'{type(element).__name__}'.",
+                    Responses().BAD_TYPE.status
+                )
+            if (child := results.get(element)) is None:
+                child = results[element] = self.make(element, loc)
+            if child[2] != Responses().GOOD.status:
+                return (None, child[1], child[2])
+            array.append(child[0])
+        return (
+            array,
+            Responses().GOOD.msg,
+            Responses().GOOD.status
+        )
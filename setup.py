@@ -49,6 +49,11 @@ setup(
         ],
     },
     include_package_data=True,
+    entry_points={
+        "console_scripts": [
+            "data-plumber-http-compile = data_plumber_http.compiler:main",
+        ],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -0,0 +1,218 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.coercion
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.engine
+"""
+
+from typing import Optional
+
+import pytest
+from flask import Flask, Response
+from werkzeug.datastructures import (
+    MultiDict, ImmutableMultiDict, CombinedMultiDict
+)
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import (
+    Object, Array, Boolean, Float, Integer, Null, Number, String
+)
+from data_plumber_http.settings import Responses
+from data_plumber_http.engine import IterativeValidator
+from data_plumber_http.compiler import CompiledValidator
+from data_plumber_http.coercion import coerce_value, coerce, MAX_LENGTH
+from data_plumber_http.decorators import (
+    flask_handler, flask_args, flask_form, flask_values
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "type_", "expected"),
+    [
+        ("1", int, 1),
+        ("-12", int, -12),
+        ("+3", int, "+3"),
+        ("01", int, "01"),
+        ("-0", int, 0),
+        ("1.5", int, "1.5"),
+        ("1e3", int, "1e3"),
+        (" 1", int, " 1"),
+        ("1_000", int, "1_000"),
+        ("1.5", float, 1.5),
+        ("1", float, 1.0),
+        ("-0.5e-2", float, -0.005),
+        ("-.5e-2", float, "-.5e-2"),
+        ("1.", float, "1."),
+        (".5", float, ".5"),
+        ("+1", float, "+1"),
+        ("1E+2", float, 100.0),
+        ("nan", float, "nan"),
+        ("inf", float, "inf"),
+        ("1", int | float, 1),
+        ("1.0", int | float, 1.0),
+        ("true", bool, True),
+        ("false", bool, False),
+        ("False", bool, "False"),
+        ("TRUE", bool, "TRUE"),
+        ("1", bool, "1"),
+        ("null", type(None), None),
+        ("", int, ""),
+        ("a", str, "a"),
+        (1, float, 1),
+    ]
+)
+def test_coerce_value(value, type_, expected):
+    """Test function `coerce_value`."""
+    result = coerce_value(value, type_)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_coerce_value_max_length():
+    """Test that long strings are not passed to `int`."""
+    assert coerce_value("1" * MAX_LENGTH, int) == int("1" * MAX_LENGTH)
+    assert coerce_value("1" * (MAX_LENGTH + 1), int) \
+        == "1" * (MAX_LENGTH + 1)
+    assert coerce_value("1" * 10**6, int) == "1" * 10**6
+
+
+def test_coerce_getlist_no_copy():
+    """Test that lists of `MultiDict`s are not copied."""
+    json = ImmutableMultiDict([("a", "x"), ("a", "y"), ("b", "1")])
+    values = coerce(json, "a", Array(items=String()))
+    assert values == ["x", "y"]
+    assert values is coerce(json, "a", Array())
+    assert coerce(json, "b", Array(items=Integer())) == [1]
+    assert coerce({"a": ["1"]}, "a", Array(items=Integer())) == ["1"]
+
+
+def test_coerce_getlist_combined():
+    """Test collecting lists from a `CombinedMultiDict`."""
+    json = CombinedMultiDict([
+        MultiDict([("a", "1"), ("a", "2")]), MultiDict([("a", "3")])
+    ])
+    assert coerce(json, "a", Array(items=Integer())) == [1, 2, 3]
+    assert coerce(json, "a", Array()) == ["1", "2", "3"]
+
+
+SCHEMA = Object(
+    properties={
+        Property("i"): Integer(),
+        Property("f"): Float(),
+        Property("n"): Number(),
+        Property("b"): Boolean(),
+        Property("z"): Null() | Integer(),
+        Property("s"): String(),
+        Property("a"): Array(items=Integer()),
+        Property("c"): Integer(min_value=0),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    ("json", "status", "value"),
+    [
+        ({"i": "1", "f": "1.5", "n": "2", "b": "true"},
+         Responses().GOOD.status,
+         {"i": 1, "f": 1.5, "n": 2, "b": True}),
+        ({"z": "null", "s": "1"}, Responses().GOOD.status,
+         {"z": None, "s": "1"}),
+        ({"z": "3"}, Responses().GOOD.status, {"z": 3}),
+        ({"a": "1"}, Responses().GOOD.status, {"a": [1]}),
+        ([("a", "1"), ("a", "2")], Responses().GOOD.status, {"a": [1, 2]}),
+        ([("a", "1"), ("a", "x")], Responses().BAD_TYPE.status, None),
+        ({"i": "x"}, Responses().BAD_TYPE.status, None),
+        ({"i": "1" * 10**5}, Responses().BAD_TYPE.status, None),
+        ({"b": "yes"}, Responses().BAD_TYPE.status, None),
+        ({"c": "-1"}, Responses().BAD_VALUE.status, None),
+    ]
+)
+def test_coerce_pipeline(json, status, value):
+    """Test coercion in `Pipeline`s and the `IterativeValidator`."""
+    json = MultiDict(json)
+    for handler in (SCHEMA.assemble(), IterativeValidator(SCHEMA)):
+        output = handler.run(json=json, coerce=True)
+        assert output.last_status == status
+        if value is not None:
+            assert output.data.value == value
+
+
+def test_coerce_off():
+    """Test that values are not coerced by default."""
+    output = SCHEMA.assemble().run(json=MultiDict({"i": "1"}))
+    assert output.last_status == Responses().BAD_TYPE.status
+    assert "'str'" in output.last_message
+
+
+def test_coerce_keys():
+    """Test coercion in `OneOf` and additional properties."""
+    output = Object(
+        properties={
+            OneOf("x", exclusive=False): {
+                Property("a"): Integer(), Property("b"): Boolean()
+            }
+        },
+        additional_properties=Integer()
+    ).assemble().run(
+        json=MultiDict({"a": "1", "c": "2"}), coerce=True
+    )
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {"a": 1, "c": 2}
+
+
+def test_coerce_compiled():
+    """Test that compiled validators reject coercion."""
+    validator = CompiledValidator(lambda json, loc: (None, "", 0, {}))
+    with pytest.raises(ValueError):
+        validator.run(json={}, coerce=True)
+
+
+@pytest.mark.parametrize("source", ["args", "form", "values"])
+def test_coerce_flask_handler(source):
+    """Test argument `coerce` of `flask_handler`."""
+    app = Flask(__name__)
+    app.config.update({"TESTING": True})
+
+    @app.route("/", methods=["GET", "POST"])
+    @flask_handler(
+        handler=Object(
+            properties={
+                Property("page", default=1): Integer(min_value=0),
+                Property("tag"): Array(items=String()),
+                Property("flag"): Boolean(),
+            }
+        ).assemble(),
+        json={
+            "args": flask_args, "form": flask_form, "values": flask_values
+        }[source],
+        coerce=True
+    )
+    def main(page: int, tag: Optional[list] = None, flag: bool = False):
+        return Response(
+            f"{page!r} {tag!r} {flag!r}", status=Responses().GOOD.status
+        )
+
+    client = app.test_client()
+    if source == "args":
+        response = client.get("/?page=2&tag=a&tag=b&flag=true")
+    elif source == "values":
+        response = client.post(
+            "/?page=2&tag=a", data={"tag": "b", "flag": "true"}
+        )
+    else:
+        response = client.post(
+            "/", data={"page": "2", "tag": ["a", "b"], "flag": "true"}
+        )
+    assert response.status_code == Responses().GOOD.status
+    assert response.data.decode() == "2 ['a', 'b'] True"
+
+    if source in ("args", "values"):
+        response = client.get("/?page=x")
+    else:
+        response = client.post("/", data={"page": "x"})
+    assert response.status_code == Responses().BAD_TYPE.status
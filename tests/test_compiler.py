@@ -0,0 +1,231 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+import sys
+import random
+import importlib
+from pathlib import Path
+
+import pytest
+
+from data_plumber_http.settings import Responses
+from data_plumber_http.compiler import main, compile_schemas, \
+    CompiledValidator
+
+
+SCHEMAS = '''
+from dataclasses import dataclass
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import Object, Array, String, Integer, Float, \\
+    Boolean, Null, Number, Any, Url
+
+
+@dataclass
+class Tag:
+    id: int
+    name: str = None
+
+
+Types = Object(properties={
+    Property("s", required=True): String(pattern="[a-z]+", enum=["ab", "abc"]),
+    Property("i"): Integer(values=[1, 2, 50], min_value_inclusive=1, max_value=10),
+    Property("f", name="ff", default=1.5): Float(min_value=0.0),
+    Property("b", validation_only=True): Boolean(),
+    Property("n"): Null(),
+    Property("num"): Number(max_value_inclusive=100),
+    Property("any"): Any(),
+    Property("tags"): Array(
+        items=Object(
+            model=Tag,
+            properties={
+                Property("id", required=True): Integer(),
+                Property("name"): String(),
+            }
+        )
+    ),
+    Property("array"): Array(),
+    Property("url"): Url(schemes=["https"]),
+    Property("nested", default={"x": 1}): Object(
+        properties={Property("x", validation_only=True): Integer()}
+    ),
+})
+Strict = Object(
+    additional_properties=False,
+    properties={Property("a"): String(), Property("b"): Integer()}
+)
+Additional = Object(
+    additional_properties=Integer(min_value=0),
+    properties={Property("a", required=True, default="x"): String()}
+)
+FreeForm = Object(
+    free_form=True,
+    properties={Property("a"): Array(items=Integer() | String())}
+)
+Conditional = Object(
+    properties={
+        OneOf("one"): {Property("a"): String(), Property("b"): Integer()},
+    }
+)
+Callable = Object(
+    properties={Property("a", default=lambda **kwargs: "default"): String()}
+)
+Record = Object(
+    model="record",
+    properties={Property("a"): String(), Property("b"): Integer()}
+)
+Nested = Object(properties={
+    Property("a"): String(),
+    Property("n"): Object(
+        model="record",
+        properties={
+            Property("u"): Url(schemes=["https"]),
+            Property("d", default=Tag(0)): Any(),
+        }
+    ),
+})
+Empty = Object()
+'''
+VALUES = [
+    None, True, False, 0, 1, 2, 5, 50, 101, -1, 1.5, -0.5, "ab", "abc", "x",
+    "", "AB", [], [1, "a"], [{"id": 1}], [{"id": "a"}], [{"name": "x"}],
+    [{"id": 1, "name": "n"}, {"id": 2}], {}, {"x": 1}, {"x": "a"},
+    "https://a.b", "ftp://a.b", {"u": "https://a.b"},
+    {"u": "javascript:alert(1)"}, {"u": "https://a.b", "d": "x"},
+]
+KEYS = {
+    "Types": [
+        "s", "i", "f", "b", "n", "num", "any", "tags", "array", "url",
+        "nested", "unknown"
+    ],
+    "Strict": ["a", "b", "c"],
+    "Additional": ["a", "x", "y", ""],
+    "FreeForm": ["a", "b"],
+    "Conditional": ["a", "b"],
+    "Callable": ["a", "b"],
+    "Record": ["a", "b"],
+    "Nested": ["a", "n"],
+    "Empty": ["a"],
+}
+
+
+@pytest.fixture(name="schemas")
+def _schemas(tmp_path, monkeypatch):
+    (tmp_path / "compiler_schemas.py").write_text(SCHEMAS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("compiler_schemas")
+    for module in ("compiler_schemas", "compiler_validators"):
+        sys.modules.pop(module, None)
+
+
+@pytest.fixture(name="validators")
+def _validators(schemas, tmp_path):
+    main(["compiler_schemas", "-o", str(tmp_path / "compiler_validators.py")])
+    return importlib.import_module("compiler_validators")
+
+
+def _result(output):
+    value = output.data.value
+    if hasattr(value, "__dataclass_fields__"):
+        value = (
+            type(value),
+            [getattr(value, f) for f in value.__dataclass_fields__]
+        )
+    return (
+        value, output.last_message, output.last_status,
+        output.data.kwargs if output.last_status == Responses().GOOD.status
+        else None
+    )
+
+
+def _run(pipeline, json):
+    try:
+        return _result(pipeline.run(json=json))
+    except ValueError as exc_info:
+        return str(exc_info)
+
+
+def test_compiler_cli(validators, tmp_path):
+    """Test output of compiler-CLI."""
+    assert sorted(validators.__all__) == sorted(KEYS)
+    assert isinstance(validators.Types, CompiledValidator)
+    assert list((tmp_path / "__pycache__").glob("compiler_validators.*.pyc"))
+
+
+@pytest.mark.parametrize("name", list(KEYS))
+def test_compiler_equivalence(name, schemas, validators):
+    """
+    Test that compiled validators are equivalent to the `Pipeline`s
+    generated by `Object.assemble`.
+    """
+    pipeline = getattr(schemas, name).assemble()
+    validator = getattr(validators, name)
+    rng = random.Random(0)
+    for _ in range(500):
+        keys = KEYS[name]
+        json = {
+            k: rng.choice(VALUES)
+            for k in rng.sample(keys, rng.randint(0, len(keys)))
+        }
+        assert _run(validator, json) == _run(pipeline, json), json
+
+
+def test_compiler_make(schemas, validators):
+    """Test `CompiledValidator.make`."""
+    assert validators.Strict.make({"a": "x"}, ".field") \
+        == schemas.Strict.make({"a": "x"}, ".field")
+    assert validators.Strict.make({"a": 0}, ".field") \
+        == schemas.Strict.make({"a": 0}, ".field")
+
+
+def test_compiler_names(schemas):
+    """Test compiling selected schemas."""
+    source = compile_schemas("compiler_schemas", ["Strict"])
+    assert "Strict = CompiledValidator(" in source
+    assert "Types = " not in source
+    with pytest.raises(ValueError):
+        compile_schemas("compiler_schemas", ["Tag"])
+
+
+def test_compiler_reproducible(schemas):
+    """Test that generated source is deterministic."""
+    assert compile_schemas("compiler_schemas") \
+        == compile_schemas("compiler_schemas")
+
+
+def test_compiler_generated_module_is_plain_python(validators):
+    """Test that compiled schemas do not use `Pipeline`s."""
+    source = Path(validators.__file__).read_text(encoding="utf-8")
+    # only schemas with OneOf or callable defaults fall back to Pipelines
+    assert source.count(".assemble(loc, register=False).run(json=json)") == 2
+
+
+def test_compiler_flask_handler(validators):
+    """Test compiled validator as handler in `flask_handler`."""
+    from flask import Flask
+    from data_plumber_http.decorators import flask_handler, flask_json
+
+    app = Flask(__name__)
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=validators.Strict, json=flask_json, server_timing=True
+    )
+    def main_(a=None, b=None):
+        return {"a": a, "b": b}, 200
+
+    client = app.test_client()
+    response = client.post("/", json={"a": "x", "b": 1})
+    assert response.status_code == 200
+    assert response.json == {"a": "x", "b": 1}
+    assert "validate;dur=" in response.headers["Server-Timing"]
+    response = client.post("/", json={"a": 1})
+    assert response.status_code == Responses().BAD_TYPE.status
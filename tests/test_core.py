@@ -9,12 +9,17 @@ pytest -v -s
   --cov=data_plumber_http.settings
 """
 
+from typing import NamedTuple
+from dataclasses import dataclass, field, FrozenInstanceError, InitVar
+import tracemalloc
+
 import pytest
 from data_plumber import Pipeline
 
-from data_plumber_http.keys import Property
-from data_plumber_http.types import Object, String
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import Object, String, Integer
 from data_plumber_http.settings import Responses
+from data_plumber_http.output import Output
 
 
 def test_property_empty_name():
@@ -289,6 +294,156 @@ def test_object_model_as_factory():
     assert output.data.value.number == 5
 
 
+@dataclass
+class _DataclassModel:
+    a: str
+    b: int = 0
+
+
+class _NamedTupleModel(NamedTuple):
+    a: str
+    b: int = 0
+
+
+class _MatchArgsModel:
+    __match_args__ = ("a", "b")
+
+    def __init__(self, a, b=0):
+        self.a = a
+        self.b = b
+
+
+@pytest.mark.parametrize(
+    "model",
+    [_DataclassModel, _NamedTupleModel, _MatchArgsModel],
+    ids=["dataclass", "namedtuple", "match_args"]
+)
+@pytest.mark.parametrize(
+    ("properties", "json", "b"),
+    [
+        ((("a", String()), ("b", Integer())), {"a": "x", "b": 1}, 1),
+        ((("b", Integer()), ("a", String())), {"a": "x", "b": 1}, 1),
+        ((("a", String()), ("b", Integer())), {"a": "x"}, 0),
+    ],
+    ids=["field-order", "other-order", "missing-optional"]
+)
+def test_object_model_positional(model, properties, json, b):
+    """Test positional construction of `model` in `Object`."""
+    assert Object(model=model)._fields == ("a", "b")
+    output = Object(
+        model=model,
+        properties={Property(k): v for k, v in properties}
+    ).assemble().run(json=json)
+
+    assert output.last_status == Responses().GOOD.status
+    assert isinstance(output.data.value, model)
+    assert output.data.value.a == "x"
+    assert output.data.value.b == b
+
+
+def test_object_model_positional_unsupported():
+    """Test models that are not constructed from positional arguments."""
+    @dataclass(kw_only=True)
+    class KwOnlyModel:
+        a: str
+
+    assert Object()._fields is None
+    assert Object(model=lambda a: a)._fields is None
+    assert Object(model=KwOnlyModel)._fields is None
+
+    output = Object(
+        model=KwOnlyModel, properties={Property("a"): String()}
+    ).assemble().run(json={"a": "x"})
+    assert output.data.value == KwOnlyModel(a="x")
+
+
+@dataclass
+class _InitVarModel:
+    a: str
+    b: InitVar[int] = 0
+    c: int = 0
+    d: int = field(default=0, init=False)
+
+    def __post_init__(self, b):
+        self.d = b
+
+
+class _ReorderedMatchArgsModel:
+    __match_args__ = ("a", "b")
+
+    def __init__(self, b=0, a=""):
+        self.a = a
+        self.b = b
+
+
+def test_object_model_positional_signature():
+    """
+    Test that the order of positional arguments is taken from the
+    constructor's signature.
+    """
+    assert Object(model=_InitVarModel)._fields == ("a", "b", "c")
+    output = Object(
+        model=_InitVarModel,
+        properties={Property("a"): String(), Property("c"): Integer()}
+    ).assemble().run(json={"a": "x", "c": 1})
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value.c == 1
+    assert output.data.value.d == 0
+
+    assert Object(model=_ReorderedMatchArgsModel)._fields == ("b", "a")
+    output = Object(
+        model=_ReorderedMatchArgsModel,
+        properties={Property("a"): String(), Property("b"): Integer()}
+    ).assemble().run(json={"a": "x", "b": 1})
+    assert output.data.value.a == "x"
+    assert output.data.value.b == 1
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_object_model_record(frozen):
+    """Test generated record-model of `Object`."""
+    object_ = Object(
+        model="frozen_record" if frozen else "record",
+        properties={
+            Property("a"): String(),
+            OneOf("b|c"): {
+                Property("b"): Integer(),
+                Property("c"): String(),
+            },
+        }
+    )
+    output = object_.assemble().run(json={"a": "x", "c": "y"})
+
+    assert output.last_status == Responses().GOOD.status
+    record = output.data.value
+    assert (record.a, record.b, record.c) == ("x", None, "y")
+    assert not hasattr(record, "__dict__")
+    assert object_._fields == ("a", "b", "c")
+    assert Object(model="record")._model is not object_._model
+    if frozen:
+        with pytest.raises(FrozenInstanceError):
+            record.a = "z"
+    else:
+        record.a = "z"
+        assert record.a == "z"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"model": "unknown"},
+        {"model": "record", "free_form": True},
+        {"model": "record", "additional_properties": String()},
+        {"model": "record", "properties": {Property("a-b"): String()}},
+    ],
+    ids=["unknown", "free-form", "additional-properties", "bad-identifier"]
+)
+def test_object_model_record_bad_config(kwargs):
+    """Test bad configurations of generated record-model of `Object`."""
+    with pytest.raises(ValueError):
+        Object(**kwargs)
+
+
 def test_object_model_missing_arg():
     """
     Test argument `model` of `Object` where model-object cannot be
@@ -512,3 +667,94 @@ def test_object_constructed_from_other_object():
     ).assemble().run(json=json)
     assert output.last_status == Responses().GOOD.status
     assert output.data.value == json
+
+
+def test_output_slotted():
+    """Test compact `Output` and its mapping-interface."""
+    output = Object(
+        properties={Property("field"): String()}
+    ).assemble().run(json={"field": "a"}).data
+
+    assert isinstance(output, Output)
+    assert not hasattr(output, "__dict__")
+    assert output.kwargs == {"field": "a"}
+    assert output["kwargs"] is output.kwargs
+    assert output.get("value") == {"field": "a"}
+    assert output.get("unknown", 0) == 0
+    assert "kwargs" in output
+    assert output == {"value": {"field": "a"}, "kwargs": {"field": "a"}}
+
+    output["value"] = 1
+    output.update(kwargs={})
+    assert output == Output(1, {})
+    with pytest.raises(KeyError):
+        output["unknown"] = 0
+
+
+def test_output_empty():
+    """Test default values of `Output`."""
+    output = Output()
+    assert output.value is None
+    assert output.kwargs == {}
+    assert output.kwargs is not Output().kwargs
+
+
+class _DictOutput(dict):
+    """Previous `dict`-based implementation of `Output` (reference)."""
+    @property
+    def value(self):
+        return self.get("value", None)
+
+    @value.setter
+    def value(self, value):
+        self["value"] = value
+
+    @property
+    def kwargs(self):
+        return self.get("kwargs", {})
+
+    @kwargs.setter
+    def kwargs(self, kwargs):
+        self["kwargs"] = kwargs
+
+
+def _allocated(factory, n=1000) -> int:
+    """Returns bytes allocated for `n` filled outputs from `factory`."""
+    tracemalloc.start()
+    try:
+        outputs = []
+        for i in range(n):
+            output = factory()
+            output.kwargs = {"field": i}
+            output.value = i
+            outputs.append(output)
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_output_footprint():
+    """
+    Benchmark memory footprint of `Output` against the previous
+    `dict`-based implementation (run with `-s` to print results).
+    """
+    slotted = _allocated(Output)
+    legacy = _allocated(_DictOutput)
+    print(
+        f"\nOutput: {slotted / 1000:.0f} bytes, "
+        + f"dict-based: {legacy / 1000:.0f} bytes (per instance)"
+    )
+    assert slotted < legacy
+
+
+def test_output_contains():
+    """
+    Test that both items of an `Output` always exist (unlike in the
+    previous `dict`-based implementation).
+    """
+    output = Output()
+    assert "value" in output and "kwargs" in output
+    assert "unknown" not in output
+    assert output["value"] is None
+    assert output["kwargs"] == {}
+    assert dict(output.items()) == {"value": None, "kwargs": {}}
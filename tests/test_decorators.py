@@ -17,6 +17,8 @@ from flask import Flask, Response
 from data_plumber_http.keys import Property
 from data_plumber_http.types import Object, String, Integer
 from data_plumber_http.settings import Responses
+from data_plumber_http.metrics import ValidationMetrics
+from data_plumber_http.profiling import SamplingProfiler
 from data_plumber_http.decorators \
      import flask_handler, flask_args, flask_json
 
@@ -159,3 +161,123 @@ def test_flask_json_missing_required(base_app, required):
     else:
         assert response.status_code == Responses().MISSING_REQUIRED.status
         print(response.data.decode())
+
+
+def test_flask_handler_metrics(base_app):
+    """Test input handler with metrics-collector."""
+    metrics = ValidationMetrics()
+
+    @base_app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(
+            properties={
+                Property("string", required=True): String(),
+            }
+        ).assemble(),
+        json=flask_json,
+        metrics=metrics
+    )
+    def main(string: str):
+        return Response("OK", status=200)
+
+    client = base_app.test_client()
+
+    for json in ({"string": "string1"}, {"string": "string2"}, {}):
+        client.post("/", json=json)
+
+    assert list(metrics.endpoints) == ["main"]
+    endpoint = metrics.endpoints["main"]
+    assert endpoint.status == {
+        Responses().GOOD.status: 2, Responses().MISSING_REQUIRED.status: 1
+    }
+    assert endpoint.latency.count == 3
+    assert endpoint.size.count == 3
+    assert endpoint.size.sum == len(b'{"string": "string1"}') * 2 + len(b"{}")
+
+
+@pytest.mark.parametrize(
+    ("json", "status"),
+    [
+        ({"string": "string1"}, 200),
+        ({}, Responses().MISSING_REQUIRED.status),
+    ]
+)
+@pytest.mark.parametrize(
+    "server_timing", [True, lambda: True], ids=["bool", "callable"]
+)
+def test_flask_handler_server_timing(base_app, json, status, server_timing):
+    """Test input handler with `Server-Timing`-header."""
+
+    @base_app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(
+            properties={
+                Property("string", required=True): String(),
+            }
+        ).assemble(),
+        json=flask_json,
+        server_timing=server_timing
+    )
+    def main(string: str):
+        return "OK", 200
+
+    client = base_app.test_client()
+
+    response = client.post("/", json=json)
+
+    assert response.status_code == status
+    timings = [
+        t.split(";")[0]
+        for t in response.headers["Server-Timing"].split(", ")
+    ]
+    assert timings == ["decode", "validate", "model"]
+
+
+def test_flask_handler_server_timing_disabled(base_app):
+    """Test input handler without `Server-Timing`-header."""
+
+    @base_app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(
+            properties={
+                Property("string"): String(),
+            }
+        ).assemble(),
+        json=flask_json,
+        server_timing=lambda: False
+    )
+    def main(string: Optional[str] = None):
+        return "OK", 200
+
+    client = base_app.test_client()
+
+    response = client.post("/", json={})
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+def test_flask_handler_profiler(base_app, tmp_path):
+    """Test input handler with `SamplingProfiler`."""
+    profiler = SamplingProfiler(2, tmp_path, interval=0)
+
+    @base_app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(
+            properties={
+                Property("string"): String(),
+            }
+        ).assemble(),
+        json=flask_json,
+        profiler=profiler
+    )
+    def main(string: Optional[str] = None):
+        return "OK", 200
+
+    client = base_app.test_client()
+
+    for _ in range(4):
+        assert client.post("/", json={"string": "a"}).status_code == 200
+
+    assert list(profiler.stats) == ["main"]
+    assert [p.name for p in tmp_path.iterdir()] == ["main.prof"]
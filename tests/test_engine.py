@@ -0,0 +1,250 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.engine
+"""
+
+from dataclasses import dataclass
+import sys
+import random
+
+import pytest
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import Object, Array, String, Integer, Float, \
+    Boolean, Null, Any, Url
+from data_plumber_http.settings import Responses
+from data_plumber_http.engine import IterativeValidator
+
+
+@dataclass
+class Tag:
+    id: int
+    name: str = None
+
+
+Item = Object(
+    model=Tag,
+    properties={
+        Property("id", required=True): Integer(),
+        Property("name"): String(),
+    }
+)
+SCHEMAS = {
+    "Types": Object(properties={
+        Property("s", required=True): String(enum=["ab", "abc"]),
+        Property("i"): Integer(min_value_inclusive=1, max_value=10),
+        Property("f", name="ff", default=1.5): Float(min_value=0.0),
+        Property("b", validation_only=True): Boolean(),
+        Property("n"): Null(),
+        Property("any"): Any(),
+        Property("tags"): Array(items=Item),
+        Property("array"): Array(),
+        Property("url"): Url(schemes=["https"]),
+        Property("nested", default={"x": 1}): Object(
+            properties={Property("x", validation_only=True): Integer()}
+        ),
+        Property("union"): Item | Array(items=Item | Integer()) | String(),
+    }),
+    "Strict": Object(
+        additional_properties=False,
+        properties={Property("a"): String(), Property("b"): Item}
+    ),
+    "Additional": Object(
+        additional_properties=Item | Integer(min_value=0),
+        properties={Property("a", required=True, default="x"): String()}
+    ),
+    "FreeForm": Object(
+        free_form=True,
+        properties={Property("a"): Array(items=Integer() | String())}
+    ),
+    "Conditional": Object(
+        properties={
+            OneOf("one"): {Property("a"): String(), Property("b"): Item},
+            Property("c"): Item,
+        }
+    ),
+    "Callable": Object(
+        properties={
+            Property("a", default=lambda **kwargs: "default"): String(),
+            Property("b"): Item,
+        }
+    ),
+    "NestedFallback": Object(
+        properties={
+            Property("a"): Object(
+                properties={
+                    OneOf("one"): {
+                        Property("x"): Integer(), Property("id"): String()
+                    },
+                }
+            ),
+            Property("b"): Array(
+                items=Object(
+                    properties={
+                        Property(
+                            "x", default=lambda **kwargs: 0
+                        ): Integer()
+                    }
+                )
+            ),
+        }
+    ),
+    "Record": Object(
+        model="record",
+        properties={Property("a"): String(), Property("b"): Item}
+    ),
+    "Empty": Object(),
+}
+VALUES = [
+    None, True, 0, 1, 5, 50, -1, 1.5, "ab", "x", "", "https://a.b",
+    [], [1, "a"], [{"id": 1}], [{"id": "a"}], [{"name": "x"}], [1, {"id": 2}],
+    {}, {"x": 1}, {"x": "a"}, {"id": 1}, {"id": 1, "name": 0},
+]
+KEYS = {
+    "Types": [
+        "s", "i", "f", "b", "n", "any", "tags", "array", "url", "nested",
+        "union", "unknown"
+    ],
+    "Strict": ["a", "b", "c"],
+    "Additional": ["a", "x", "y", ""],
+    "FreeForm": ["a", "b"],
+    "Conditional": ["a", "b", "c"],
+    "Callable": ["a", "b"],
+    "NestedFallback": ["a", "b"],
+    "Record": ["a", "b"],
+    "Empty": ["a"],
+}
+
+
+def _result(output):
+    value = output.data.value
+    if hasattr(value, "__dataclass_fields__"):
+        value = (
+            type(value),
+            [getattr(value, f) for f in value.__dataclass_fields__]
+        )
+    return (
+        value, output.last_message, output.last_status,
+        output.data.kwargs if output.last_status == Responses().GOOD.status
+        else None
+    )
+
+
+def _run(pipeline, json):
+    try:
+        return _result(pipeline.run(json=json))
+    except ValueError as exc_info:
+        return str(exc_info)
+
+
+@pytest.mark.parametrize("name", list(KEYS))
+def test_iterative_equivalence(name):
+    """
+    Test that `IterativeValidator` is equivalent to the `Pipeline`
+    generated by `Object.assemble`.
+    """
+    pipeline = SCHEMAS[name].assemble()
+    validator = IterativeValidator(SCHEMAS[name])
+    rng = random.Random(0)
+    for _ in range(500):
+        keys = KEYS[name]
+        json = {
+            k: rng.choice(VALUES)
+            for k in rng.sample(keys, rng.randint(0, len(keys)))
+        }
+        assert _run(validator, json) == _run(pipeline, json), json
+
+
+def test_iterative_make():
+    """Test `IterativeValidator.make`."""
+    validator = IterativeValidator(SCHEMAS["Strict"])
+    for json in ({"a": "x"}, {"a": 0}, {"b": {"id": "0"}}, {"c": 0}):
+        assert validator.make(json, ".field") \
+            == SCHEMAS["Strict"].make(json, ".field")
+
+
+def _nested_schema(depth):
+    schema = Object(properties={Property("value"): Integer()})
+    for _ in range(depth):
+        schema = Object(
+            properties={
+                Property("value"): Integer(),
+                Property("child"): schema,
+                Property("children"): Array(items=schema),
+            }
+        )
+    return schema
+
+
+def _nested_document(depth, leaf):
+    document = {"value": leaf}
+    for index in range(depth):
+        document = {"value": index, "child": document}
+    return document
+
+
+def test_iterative_deep_document():
+    """
+    Test that documents nested deeper than the recursion limit can be
+    validated.
+    """
+    depth = sys.getrecursionlimit() + 100
+    schema = _nested_schema(depth)
+    validator = IterativeValidator(schema)
+
+    output = validator.run(json=_nested_document(depth, 0))
+    assert output.last_status == Responses().GOOD.status
+    value = output.data.value
+    for index in reversed(range(depth)):
+        assert value["value"] == index
+        value = value["child"]
+    assert value == {"value": 0}
+
+    output = validator.run(json=_nested_document(depth, "0"))
+    assert output.last_status == Responses().BAD_TYPE.status
+    assert ".child" * depth in output.last_message
+
+    with pytest.raises(RecursionError):
+        schema.assemble().run(json=_nested_document(depth, 0))
+
+
+def test_iterative_deep_document_equivalence():
+    """Test equivalence for moderately nested documents."""
+    schema = _nested_schema(20)
+    pipeline = schema.assemble()
+    validator = IterativeValidator(schema)
+    for json in (
+        _nested_document(20, 0),
+        _nested_document(20, "0"),
+        _nested_document(10, 0) | {"children": [_nested_document(5, 0)]},
+        {"children": [{"children": [{"value": 1}, {"value": None}]}]},
+        {"children": [{"children": [0]}]},
+    ):
+        assert _run(validator, json) == _run(pipeline, json), json
+
+
+def test_iterative_flask_handler():
+    """Test `IterativeValidator` as handler in `flask_handler`."""
+    from flask import Flask
+    from data_plumber_http.decorators import flask_handler, flask_json
+
+    app = Flask(__name__)
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=IterativeValidator(_nested_schema(300)), json=flask_json
+    )
+    def main_(**kwargs):
+        return {"value": kwargs["value"]}, 200
+
+    client = app.test_client()
+    response = client.post("/", json=_nested_document(300, 1))
+    assert response.status_code == 200
+    assert response.json == {"value": 299}
+    response = client.post("/", json=_nested_document(300, "1"))
+    assert response.status_code == Responses().BAD_TYPE.status
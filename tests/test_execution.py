@@ -0,0 +1,235 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.execution
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+"""
+
+import random
+
+import pytest
+from flask import Flask, Response
+from data_plumber import Stage
+from data_plumber.error import PipelineError
+
+from data_plumber_http.keys import Property, OneOf, AllOf
+from data_plumber_http.types import Object, Array, Integer, String
+from data_plumber_http.settings import Responses
+from data_plumber_http import execution
+from data_plumber_http.execution import ExecutionMode, Pipeline
+from data_plumber_http.decorators import flask_handler, flask_json
+
+
+@pytest.fixture(name="records_off")
+def _records_off():
+    ExecutionMode().keep_records = False
+    yield
+    ExecutionMode().keep_records = True
+
+
+SCHEMA = Object(
+    properties={
+        Property("a", required=True): Integer(min_value=0),
+        Property("b", default="x"): String(),
+        Property("c"): Array(items=Object(
+            properties={Property("d", required=True): Integer()}
+        )),
+        OneOf("e|f", exclusive=True): {
+            Property("e"): String(), Property("f"): Integer()
+        },
+        AllOf("g&h"): {
+            Property("g"): Integer(), Property("h", required=True): String()
+        },
+        Property("v", validation_only=True): String(),
+    },
+    additional_properties=False
+)
+KEYS = ["a", "b", "c", "e", "f", "g", "h", "v", "x"]
+VALUES = [None, "s", -1, 0, 1, [], [{"d": 1}], [{"d": "s"}], [{}]]
+
+
+def _result(output):
+    return (
+        output.last_status, output.last_message, output.data.value,
+        output.data.kwargs
+    )
+
+
+def test_execution_mode_singleton():
+    """Test `ExecutionMode`-defaults."""
+    assert ExecutionMode() is ExecutionMode()
+    assert ExecutionMode().keep_records
+    assert ExecutionMode().current
+    assert isinstance(SCHEMA.assemble(), Pipeline)
+
+
+@pytest.mark.parametrize("partial", [False, True])
+def test_records_off_equivalence(partial):
+    """Test that records-off mode does not change the result."""
+    pipeline = SCHEMA.assemble()
+    rng = random.Random(0)
+    for _ in range(500):
+        json = {
+            k: rng.choice(VALUES)
+            for k in rng.sample(KEYS, rng.randint(0, len(KEYS)))
+        }
+        kwargs = {"partial": True} if partial else {}
+        expected = pipeline.run(json=json, **kwargs)
+        output = pipeline.run(json=json, keep_records=False, **kwargs)
+        assert len(output.records) == 1
+        assert output.records[-1] == expected.records[-1]
+        assert _result(output) == _result(expected), json
+
+
+def test_records_off_empty_object():
+    """Test records-off mode for `Object`s without `Stage`s."""
+    output = Object().assemble().run(json={}, keep_records=False)
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {}
+
+
+def test_records_off_global(records_off):
+    """Test records-off mode via `ExecutionMode`."""
+    pipeline = SCHEMA.assemble()
+    json = {"a": 1, "h": "s"}
+    assert len(pipeline.run(json=json).records) == 1
+    assert len(pipeline.run(json=json, keep_records=True).records) > 1
+
+
+def test_records_off_nested():
+    """Test that nested runs inherit the mode of the enclosing run."""
+    modes = []
+
+    def default(**kwargs):
+        modes.append(ExecutionMode().current)
+        return 0
+
+    pipeline = Object(
+        properties={
+            Property("a"): Object(
+                properties={Property("b", default=default): Integer()}
+            )
+        }
+    ).assemble()
+    pipeline.run(json={"a": {}})
+    pipeline.run(json={"a": {}}, keep_records=False)
+    assert modes == [True, False]
+    assert ExecutionMode().current
+
+
+def test_records_off_fallback():
+    """Test that unsupported `Pipeline`s are executed regularly."""
+    pipeline = Pipeline(
+        Stage(), Stage(requires={-1: 0}), exit_on_status=400
+    )
+    assert len(pipeline.run(keep_records=False).records) == 2
+
+
+def test_records_off_requirements():
+    """Test requirements in records-off mode."""
+    pipeline = Pipeline(
+        "a", "b", "c",
+        a=Stage(status=lambda **kwargs: 1),
+        b=Stage(requires={"a": 1}, status=lambda **kwargs: 2),
+        c=Stage(requires={"b": lambda status: status > 2}),
+    )
+    output = pipeline.run(keep_records=False)
+    assert [r.id_ for r in output.records] == ["b"]
+    assert [r.id_ for r in pipeline.run().records] == ["a", "b"]
+
+    pipeline = Pipeline("a", "b", b=Stage(requires={"a": 0}), a=Stage())
+    pipeline.insert(0, "b")
+    with pytest.raises(PipelineError):
+        pipeline.run(keep_records=False)
+    with pytest.raises(PipelineError):
+        pipeline.run()
+
+
+def test_records_off_plan_invalidation():
+    """Test that changes to a `Pipeline` invalidate its plan."""
+    pipeline = Pipeline(
+        "a", "b",
+        a=Stage(status=lambda **kwargs: 1),
+        b=Stage(requires={"a": 1}, status=lambda **kwargs: 2),
+    )
+    assert [r.id_ for r in pipeline.run(keep_records=False).records] \
+        == ["b"]
+    # replace Stage under the same identifier (with other requirements)
+    pipeline.append(
+        Pipeline(b=Stage(requires={"a": 0}, status=lambda **kwargs: 2))
+    )
+    assert pipeline.run(keep_records=False).records == \
+        pipeline.run().records[-1:]
+    assert [r.id_ for r in pipeline.run(keep_records=False).records] \
+        == ["a"]
+
+
+def test_records_off_incompatible(monkeypatch):
+    """
+    Test that `Pipeline`s are executed regularly if `data_plumber` does
+    not provide the required internals.
+    """
+    monkeypatch.setattr(
+        execution, "_INTERNALS", execution._INTERNALS + ("_unknown",)
+    )
+    pipeline = Pipeline("a", "b", a=Stage(), b=Stage())
+    assert len(pipeline.run(keep_records=False).records) == 2
+
+
+@pytest.mark.parametrize("keep_records", [True, False])
+def test_finalizer_last_status(keep_records):
+    """
+    Test that the finalizer receives the status and message of the last
+    `Stage` independent of the records.
+    """
+    calls = []
+
+    def finalizer(data, records, last_status, last_message, **kwargs):
+        calls.append((last_status, last_message))
+        records.clear()
+
+    pipeline = Pipeline(
+        "a", "b",
+        a=Stage(status=lambda **kwargs: 1, message=lambda **kwargs: "a"),
+        b=Stage(
+            requires={"a": 1},
+            status=lambda **kwargs: 2, message=lambda **kwargs: "b"
+        ),
+        finalize_output=finalizer
+    )
+    pipeline.run(keep_records=keep_records)
+    Pipeline(finalize_output=finalizer).run(keep_records=keep_records)
+    pipeline.run(
+        keep_records=keep_records,
+        finalize_output=lambda last_status, **kwargs:
+            calls.append(last_status)
+    )
+    assert calls == [(2, "b"), (None, None), 2]
+
+
+def test_records_off_flask_handler():
+    """Test argument `keep_records` of `flask_handler`."""
+    app = Flask(__name__)
+    app.config.update({"TESTING": True})
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(
+            properties={Property("a", required=True): Integer()}
+        ).assemble(),
+        json=flask_json,
+        keep_records=False
+    )
+    def main(a):
+        return Response(str(a), status=Responses().GOOD.status)
+
+    client = app.test_client()
+    response = client.post("/", json={"a": 1})
+    assert response.status_code == Responses().GOOD.status
+    assert response.data == b"1"
+    response = client.post("/", json={"a": "1"})
+    assert response.status_code == Responses().BAD_TYPE.status
@@ -0,0 +1,183 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+"""
+
+from io import BytesIO
+
+import pytest
+from flask import Flask, Response
+from werkzeug.datastructures import FileStorage
+
+from data_plumber_http.keys import Property
+from data_plumber_http.types import Object, Array, FileUpload
+from data_plumber_http.settings import Responses
+from data_plumber_http.decorators import flask_handler, flask_files
+
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+class CountingStream(BytesIO):
+    """`BytesIO` that records the number of bytes read."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _file(content: bytes, content_type="image/png", **kwargs):
+    return FileStorage(
+        stream=CountingStream(content),
+        filename="file.png",
+        content_type=content_type,
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    ("dptype", "file", "status"),
+    [
+        (FileUpload(), _file(b""), Responses().GOOD.status),
+        (FileUpload(max_size=10), _file(b"0" * 10), Responses().GOOD.status),
+        (FileUpload(max_size=10), _file(b"0" * 11),
+         Responses().BAD_VALUE.status),
+        (FileUpload(content_types=["image/png"]), _file(b""),
+         Responses().GOOD.status),
+        (FileUpload(content_types=["image/*"]), _file(b""),
+         Responses().GOOD.status),
+        (FileUpload(content_types=["image/*"]), _file(b"", "text/plain"),
+         Responses().BAD_VALUE.status),
+        (FileUpload(content_types=["image/png"]),
+         _file(b"", "image/png; charset=x"), Responses().GOOD.status),
+        (FileUpload(signatures=[PNG]), _file(PNG + b"data"),
+         Responses().GOOD.status),
+        (FileUpload(signatures=[b"GIF8", PNG]), _file(PNG),
+         Responses().GOOD.status),
+        (FileUpload(signatures=[PNG]), _file(b"GIF89a"),
+         Responses().BAD_VALUE.status),
+        (FileUpload(signatures=[PNG]), _file(b""),
+         Responses().BAD_VALUE.status),
+    ]
+)
+def test_file_upload(dptype, file, status):
+    """Test `FileUpload`-validation."""
+    output = Object(
+        properties={Property("file"): dptype}
+    ).assemble().run(json={"file": file})
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value["file"] is file
+
+
+def test_file_upload_bad_type():
+    """Test `FileUpload` with non-file input."""
+    output = Object(
+        properties={Property("file"): FileUpload()}
+    ).assemble().run(json={"file": "file.png"})
+    assert output.last_status == Responses().BAD_TYPE.status
+
+
+def test_file_upload_bounded_reads():
+    """Test that only the signature is read and the stream is rewound."""
+    file = _file(PNG + b"0" * 10**7)
+    file.stream.seek(2)
+    result = FileUpload(
+        max_size=100, signatures=[PNG[2:]]
+    ).make(file, "file")
+    assert result[2] == Responses().BAD_VALUE.status
+    assert "at most 100 bytes" in result[1]
+    assert file.stream.bytes_read == len(PNG) - 2
+    assert file.stream.tell() == 2
+
+
+def test_file_upload_content_length():
+    """Test that declared content length is rejected without reading."""
+    file = _file(b"0", content_length=1000)
+    assert FileUpload(max_size=10).make(file, "file")[2] \
+        == Responses().BAD_VALUE.status
+    assert file.stream.bytes_read == 0
+
+
+def test_file_upload_non_seekable():
+    """Test `FileUpload` with a stream that does not support seeking."""
+    stream = CountingStream(PNG)
+    stream.seekable = lambda: False
+
+    def seek(*args):
+        raise OSError("not seekable")
+    stream.seek = seek
+    stream.tell = lambda: 0
+    result = FileUpload(signatures=[PNG]).make(
+        FileStorage(stream=stream, filename="file.png"), "file"
+    )
+    assert result[2] == Responses().BAD_VALUE.status
+    assert "seekable" in result[1]
+    assert FileUpload().make(
+        FileStorage(stream=stream, filename="file.png"), "file"
+    )[2] == Responses().GOOD.status
+
+
+def test_file_upload_flask_handler():
+    """Test `FileUpload` with `flask_files`."""
+    app = Flask(__name__)
+    app.config.update({"TESTING": True})
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(
+            properties={
+                Property("image", required=True): FileUpload(
+                    max_size=1024, content_types=["image/png"],
+                    signatures=[PNG]
+                ),
+                Property("attachments"): Array(
+                    items=FileUpload(max_size=1024)
+                ),
+            }
+        ).assemble(),
+        json=flask_files,
+        coerce=True
+    )
+    def main(image, attachments=None):
+        return Response(
+            f"{len(image.read())} {len(attachments or [])}",
+            status=Responses().GOOD.status
+        )
+
+    client = app.test_client()
+
+    response = client.post(
+        "/",
+        data={
+            "image": (BytesIO(PNG + b"data"), "image.png", "image/png"),
+            "attachments": [
+                (BytesIO(b"a"), "a.txt"), (BytesIO(b"b"), "b.txt")
+            ],
+        }
+    )
+    assert response.status_code == Responses().GOOD.status
+    assert response.data.decode() == f"{len(PNG) + 4} 2"
+
+    response = client.post(
+        "/",
+        data={"image": (BytesIO(b"GIF89a"), "image.png", "image/png")}
+    )
+    assert response.status_code == Responses().BAD_VALUE.status
+
+    response = client.post(
+        "/",
+        data={
+            "image": (BytesIO(PNG), "image.png", "image/png"),
+            "attachments": (BytesIO(b"0" * 1025), "a.txt"),
+        }
+    )
+    assert response.status_code == Responses().BAD_VALUE.status
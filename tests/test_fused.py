@@ -0,0 +1,134 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+"""
+
+import random
+
+import pytest
+from data_plumber import Pipeline
+from werkzeug.datastructures import MultiDict
+
+from data_plumber_http.keys import Property
+from data_plumber_http.types import Object, Array, Integer, String
+from data_plumber_http.settings import Responses
+from data_plumber_http.instrumentation import Instrumentation
+
+
+def _unfused(key, value):
+    """Returns `Pipeline` with individual `Stage`s for `key`."""
+    def hook(report):
+        pass
+    Instrumentation().register(hook)
+    try:
+        return key.assemble(value, None)
+    finally:
+        Instrumentation().unregister(hook)
+
+
+def _unfused_object(properties):
+    """Returns `Object`-`Pipeline` with individual `Stage`s."""
+    def hook(report):
+        pass
+    Instrumentation().register(hook)
+    try:
+        return Object(properties=properties).assemble()
+    finally:
+        Instrumentation().unregister(hook)
+
+
+def _records(output):
+    return [(r.id_, r.message, r.status) for r in output.records]
+
+
+def test_fused_stage_count():
+    """Test that a `Property` is assembled into a single `Stage`."""
+    pipeline = Property("a", default=1).assemble(Integer(), None)
+    assert isinstance(pipeline, Pipeline)
+    assert pipeline.stages == ["a"]
+    assert len(_unfused(Property("a", default=1), Integer())) == 5
+
+
+KEYS = [
+    Property("a"),
+    Property("a", name="b"),
+    Property("a", required=True),
+    Property("a", default=2),
+    Property("a", default=lambda json, **kwargs: len(json)),
+    Property("a", required=True, default=3),
+    Property("a", validation_only=True),
+    Property("a", required=True, validation_only=True),
+]
+VALUES = [
+    Integer(min_value=0),
+    Array(items=Integer()),
+    Object(properties={Property("x", required=True): String()}),
+]
+INPUTS = [
+    None, "a", "1", 1, -1, 1.5, [], [1], ["a"], {}, {"x": "a"}, {"x": 1},
+]
+
+
+@pytest.mark.parametrize("key", KEYS)
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("partial", [False, True])
+def test_fused_equivalence(key, value, partial):
+    """
+    Test that fused `Property`-`Stage`s produce the same output and
+    (expanded) records as individual `Stage`s.
+    """
+    fused = key.assemble(value, None)
+    unfused = _unfused(key, value)
+    for json in [{}] + [{"a": i} for i in INPUTS]:
+        kwargs = {"partial": True} if partial else {}
+        expected = unfused.run(json=json, **kwargs)
+        output = fused.run(json=json, expand_records=True, **kwargs)
+        assert _records(output) == _records(expected), json
+        assert output.data == expected.data, json
+
+
+def test_fused_equivalence_object():
+    """Test fused `Stage`s in an `Object` (including coercion)."""
+    properties = {
+        Property("i", required=True): Integer(),
+        Property("s", default="x"): String(),
+        Property("a"): Array(items=Integer()),
+        Property("v", validation_only=True): Integer(),
+    }
+    fused = Object(properties=properties).assemble()
+    unfused = _unfused_object(properties)
+    rng = random.Random(0)
+    for _ in range(200):
+        json = MultiDict([
+            (k, rng.choice(["1", "x", "-2"]))
+            for k in rng.sample(["i", "s", "a", "a", "v"], rng.randint(0, 5))
+        ])
+        for kwargs in ({}, {"coerce": True}):
+            expected = unfused.run(json=json, **kwargs)
+            output = fused.run(json=json, expand_records=True, **kwargs)
+            assert _records(output) == _records(expected)
+            assert output.data == expected.data
+
+
+def test_fused_records():
+    """Test records of fused `Stage`s with and without expansion."""
+    pipeline = Object(
+        properties={
+            Property("a"): Integer(), Property("b", default=0): Integer()
+        }
+    ).assemble()
+    output = pipeline.run(json={"a": 1})
+    assert [r.id_ for r in output.records] == ["a", "b"]
+    assert output.data.value == {"a": 1, "b": 0}
+    output = pipeline.run(json={"a": 1}, expand_records=True)
+    assert [(r.index, r.id_) for r in output.records] == [
+        (0, "a"), (0, "a[type]"), (0, "a[dptype]"), (0, "a[output]"),
+        (1, "b"), (1, "b[default]"), (1, "b[output]"),
+    ]
+    output = pipeline.run(json={"a": "1"}, expand_records=True)
+    assert [r.id_ for r in output.records] == ["a", "a[type]"]
+    assert output.last_status == Responses().BAD_TYPE.status
@@ -0,0 +1,132 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+import sys
+import ast
+import inspect
+import subprocess
+
+import pytest
+
+import data_plumber_http
+from data_plumber_http import types, keys, decorators
+
+
+# budget for the cumulative import time of the top-level package in
+# microseconds (as reported by `python -X importtime`)
+IMPORT_BUDGET = 20000
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True, text=True, check=True
+    )
+
+
+def _loaded_after(import_: str) -> set[str]:
+    return set(
+        _run(
+            "import sys\n"
+            + "before = set(sys.modules)\n"
+            + f"{import_}\n"
+            + "print('\\n'.join(set(sys.modules) - before))"
+        ).stdout.split()
+    )
+
+
+def test_import_lazy():
+    """Test that importing the package does not load submodules."""
+    loaded = _loaded_after("import data_plumber_http")
+    assert loaded & {
+        "data_plumber", "data_plumber_http.keys", "data_plumber_http.types",
+        "urllib.parse", "pathlib", "flask",
+    } == set()
+
+
+def test_import_lazy_types():
+    """Test that only required types are loaded."""
+    loaded = _loaded_after("from data_plumber_http.types import String")
+    assert "data_plumber_http.types.string" in loaded
+    assert loaded & {
+        "data_plumber", "data_plumber_http.types.object",
+        "data_plumber_http.types.url_base", "urllib.parse", "pathlib",
+    } == set()
+
+
+def test_import_lazy_decorators():
+    """Test that flask is only loaded with the decorators."""
+    assert "flask" not in _loaded_after(
+        "import data_plumber_http.decorators"
+    )
+    assert "flask" in _loaded_after(
+        "from data_plumber_http.decorators import flask_handler"
+    )
+
+
+def test_import_attributes():
+    """Test lazily loaded attributes."""
+    assert data_plumber_http.Object is types.Object
+    assert data_plumber_http.Property is keys.Property
+    assert data_plumber_http.settings.Responses is not None
+    assert set(data_plumber_http.__all__) <= set(dir(data_plumber_http))
+    assert set(types.__all__) <= set(dir(types))
+    with pytest.raises(AttributeError):
+        data_plumber_http.Unknown  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        types.Unknown  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        keys.Unknown  # pylint: disable=pointless-statement
+
+
+def _static_names(module) -> set[str]:
+    """
+    Returns names that are defined in `module` or imported in its
+    `if TYPE_CHECKING:`-blocks.
+    """
+    names = set()
+    for node in ast.parse(inspect.getsource(module)).body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.If) \
+                and "TYPE_CHECKING" in ast.unparse(node.test):
+            for statement in node.body:
+                if isinstance(statement, ast.ImportFrom):
+                    names |= {a.asname or a.name for a in statement.names}
+    return names
+
+
+@pytest.mark.parametrize(
+    "module", [data_plumber_http, types, keys, decorators],
+    ids=lambda module: module.__name__
+)
+def test_import_static_exports(module):
+    """
+    Test that all lazily loaded names in `__all__` are visible to static
+    type checkers.
+    """
+    assert set(module.__all__) <= _static_names(module)
+
+
+def test_import_time():
+    """Test import time of the package against `IMPORT_BUDGET`."""
+    def cumulative():
+        for line in _run(
+            "import data_plumber_http", "-X", "importtime"
+        ).stderr.splitlines():
+            if line.split("|")[-1].strip() == "data_plumber_http":
+                return int(line.split("|")[1])
+        raise ValueError("Missing import time for 'data_plumber_http'.")
+
+    # best of three runs
+    result = min(cumulative() for _ in range(3))
+    assert result < IMPORT_BUDGET, \
+        f"Import time of {result}us exceeds budget of {IMPORT_BUDGET}us."
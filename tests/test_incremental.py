@@ -0,0 +1,272 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.incremental
+"""
+
+import copy
+import random
+
+import pytest
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import Object, Array, String, Integer, Ref
+from data_plumber_http.settings import Responses
+from data_plumber_http.incremental import IncrementalValidator, apply_patch
+
+
+@pytest.mark.parametrize(
+    ("document", "patch", "expected"),
+    [
+        # examples from RFC 6902, appendix A
+        (
+            {"foo": "bar"}, [{"op": "add", "path": "/baz", "value": "qux"}],
+            {"baz": "qux", "foo": "bar"}
+        ),
+        (
+            {"foo": ["bar", "baz"]},
+            [{"op": "add", "path": "/foo/1", "value": "qux"}],
+            {"foo": ["bar", "qux", "baz"]}
+        ),
+        (
+            {"baz": "qux", "foo": "bar"}, [{"op": "remove", "path": "/baz"}],
+            {"foo": "bar"}
+        ),
+        (
+            {"foo": ["bar", "qux", "baz"]},
+            [{"op": "remove", "path": "/foo/1"}],
+            {"foo": ["bar", "baz"]}
+        ),
+        (
+            {"baz": "qux", "foo": "bar"},
+            [{"op": "replace", "path": "/baz", "value": "boo"}],
+            {"baz": "boo", "foo": "bar"}
+        ),
+        (
+            {
+                "foo": {"bar": "baz", "waldo": "fred"},
+                "qux": {"corge": "grault"}
+            },
+            [{"op": "move", "from": "/foo/waldo", "path": "/qux/thud"}],
+            {
+                "foo": {"bar": "baz"},
+                "qux": {"corge": "grault", "thud": "fred"}
+            }
+        ),
+        (
+            {"foo": ["all", "grass", "cows", "eat"]},
+            [{"op": "move", "from": "/foo/1", "path": "/foo/3"}],
+            {"foo": ["all", "cows", "eat", "grass"]}
+        ),
+        (
+            {"baz": "qux", "foo": ["a", 2, "c"]},
+            [
+                {"op": "test", "path": "/baz", "value": "qux"},
+                {"op": "test", "path": "/foo/1", "value": 2},
+            ],
+            {"baz": "qux", "foo": ["a", 2, "c"]}
+        ),
+        (
+            {"foo": "bar"},
+            [{"op": "add", "path": "/child", "value": {"grandchild": {}}}],
+            {"foo": "bar", "child": {"grandchild": {}}}
+        ),
+        (
+            {"foo": ["bar"]},
+            [{"op": "add", "path": "/foo/-", "value": ["abc", "def"]}],
+            {"foo": ["bar", ["abc", "def"]]}
+        ),
+        (
+            {"/": 0, "~": 1},
+            [
+                {"op": "replace", "path": "/~1", "value": 2},
+                {"op": "copy", "from": "/~0", "path": "/a"},
+            ],
+            {"/": 2, "~": 1, "a": 1}
+        ),
+        ({"foo": 0}, [{"op": "replace", "path": "", "value": []}], []),
+    ]
+)
+def test_apply_patch(document, patch, expected):
+    """Test function `apply_patch`."""
+    original = copy.deepcopy(document)
+    assert apply_patch(document, patch) == expected
+    assert document == original
+
+
+@pytest.mark.parametrize(
+    ("document", "patch"),
+    [
+        # examples from RFC 6902, appendix A
+        ({"foo": "bar"}, [{"op": "add", "path": "/baz/bat", "value": "qux"}]),
+        ({"baz": "qux"}, [{"op": "test", "path": "/baz", "value": "bar"}]),
+        ({"foo": 1}, [{"op": "test", "path": "/foo", "value": True}]),
+        ({"foo": []}, [{"op": "add", "path": "/foo/1", "value": 0}]),
+        ({"foo": [0]}, [{"op": "remove", "path": "/foo/01"}]),
+        ({"foo": [0]}, [{"op": "replace", "path": "/foo/-", "value": 1}]),
+        ({"foo": 0}, [{"op": "remove", "path": "/bar"}]),
+        ({"foo": 0}, [{"op": "remove", "path": ""}]),
+        ({"foo": 0}, [{"op": "add", "path": "foo", "value": 0}]),
+        ({"foo": 0}, [{"op": "add", "path": "/foo"}]),
+        ({"foo": 0}, [{"op": "copy", "path": "/bar"}]),
+        ({"foo": 0}, [{"op": "unknown", "path": "/foo"}]),
+        ({"foo": {}}, [{"op": "move", "from": "/foo", "path": "/foo/a"}]),
+        ({"foo": "bar"}, [{"op": "add", "path": "/foo/0", "value": 0}]),
+        ({"foo": 0}, [{"path": "/foo"}]),
+    ]
+)
+def test_apply_patch_error(document, patch):
+    """Test function `apply_patch` with bad patches."""
+    with pytest.raises(ValueError):
+        apply_patch(document, patch)
+
+
+def test_apply_patch_structural_sharing():
+    """Test that `apply_patch` only copies the changed path."""
+    document = {"a": {"b": [{"c": 0}, {"d": 1}]}, "e": {"f": 2}}
+    result = apply_patch(
+        document, [{"op": "replace", "path": "/a/b/0/c", "value": 1}]
+    )
+    assert result["e"] is document["e"]
+    assert result["a"]["b"][1] is document["a"]["b"][1]
+    assert result["a"] is not document["a"]
+    assert document["a"]["b"][0] == {"c": 0}
+
+
+Item = Object(
+    properties={
+        Property("id", required=True): Integer(),
+        Property("tags"): Array(items=String()),
+        Property("children"): Array(items=Ref(lambda: Item)),
+    }
+)
+Document = Object(
+    properties={
+        Property("title"): String(),
+        Property("items", default=[]): Array(items=Item),
+        Property("meta"): Object(
+            properties={OneOf("one"): {Property("a"): String()}}
+        ),
+    }
+)
+
+
+def _document(size):
+    return {
+        "title": "t",
+        "items": [
+            {"id": i, "tags": ["a", "b"], "children": [{"id": -i}]}
+            for i in range(size)
+        ],
+        "meta": {"a": "x"},
+    }
+
+
+def _expected(json):
+    output = Document.assemble().run(json=json)
+    return (
+        output.last_status, output.last_message,
+        output.data.value
+        if output.last_status == Responses().GOOD.status else None
+    )
+
+
+def _actual(result):
+    return (
+        result.output.last_status, result.output.last_message,
+        result.output.data.value
+        if result.output.last_status == Responses().GOOD.status else None
+    )
+
+
+def test_incremental_revalidate():
+    """Test that revalidation only validates changed paths."""
+    validator = IncrementalValidator(Document)
+    result = validator.validate(_document(100))
+    assert result.output.last_status == Responses().GOOD.status
+    assert result.validated == 1 + 1 + 1 + 100 * 4
+
+    patched = validator.revalidate(
+        result, [{"op": "replace", "path": "/items/5/id", "value": 500}]
+    )
+    assert _actual(patched) == _expected(patched.json)
+    # document, items, items/5
+    assert patched.validated == 3
+    assert patched.output.data.value["items"][5]["id"] == 500
+    # models of unchanged parts are shared
+    assert patched.output.data.value["items"][6] \
+        is result.output.data.value["items"][6]
+    # previous result is unchanged
+    assert result.output.data.value["items"][5]["id"] == 5
+
+    # insert at the beginning of an array
+    inserted = validator.revalidate(
+        patched, [{"op": "add", "path": "/items/0", "value": {"id": 1}}]
+    )
+    assert _actual(inserted) == _expected(inserted.json)
+    assert inserted.validated == 3
+
+    # invalid change
+    invalid = validator.revalidate(
+        inserted,
+        [{"op": "add", "path": "/items/3/children/0/tags", "value": [0]}]
+    )
+    assert invalid.output.last_status == Responses().BAD_TYPE.status
+    assert _actual(invalid) == _expected(invalid.json)
+
+    # reverting the change after an invalid state
+    reverted = validator.revalidate(
+        invalid, [{"op": "remove", "path": "/items/3/children/0/tags/0"}]
+    )
+    assert _actual(reverted) == _expected(reverted.json)
+    # validation stopped at the error, the remainder has not been cached
+    assert 3 < reverted.validated < result.validated
+
+
+def test_incremental_equivalence():
+    """Test revalidation against full validation for random patches."""
+    rng = random.Random(0)
+    validator = IncrementalValidator(Document)
+    result = validator.validate(_document(10))
+    values = [0, "a", [], {}, {"id": 1}, [{"id": 2}], {"a": "y"}, {"a": 0}]
+    checked = 0
+    paths = [
+        "/title", "/items/0", "/items/-", "/items/3/id", "/items/2/tags/-",
+        "/items/1/children/0/id", "/items/4/children/-", "/meta",
+        "/meta/a",
+    ]
+    for _ in range(300):
+        patch = [{
+            "op": rng.choice(["add", "replace", "remove"]),
+            "path": rng.choice(paths),
+            "value": rng.choice(values),
+        }]
+        try:
+            candidate = validator.revalidate(result, patch)
+        except ValueError:
+            continue
+        checked += 1
+        assert _actual(candidate) == _expected(candidate.json), patch
+        # continue from valid documents with the expected structure
+        if candidate.output.last_status == Responses().GOOD.status \
+                and len(candidate.json.get("items", [])) >= 5 \
+                and all(
+                    item.get("children") for item in candidate.json["items"]
+                ):
+            result = candidate
+    assert checked > 100
+
+
+def test_incremental_validate_previous():
+    """Test `IncrementalValidator.validate` with explicit `previous`."""
+    validator = IncrementalValidator(Document)
+    result = validator.validate(_document(10))
+    unchanged = validator.validate(result.json, result)
+    assert unchanged.validated == 0
+    assert unchanged.output.data.value == result.output.data.value
+    fresh = validator.validate(_document(10), result)
+    assert fresh.validated == result.validated
@@ -0,0 +1,126 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+import pytest
+from data_plumber import Stage
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import Object, String, Integer
+from data_plumber_http.settings import Responses
+from data_plumber_http.instrumentation import Instrumentation, StageTimer
+
+
+@pytest.fixture(name="timer")
+def _timer():
+    timer = StageTimer()
+    Instrumentation().register(timer)
+    yield timer
+    Instrumentation().unregister(timer)
+
+
+def test_instrumentation_disabled():
+    """Test that `Stage`s are not instrumented without hooks."""
+    assert not Instrumentation().enabled
+    stage = Stage()
+    assert Instrumentation().stage(stage, ".", "field", "field") is stage
+
+
+def test_instrumentation_enabled(timer):
+    """Test that `Stage`s are instrumented with hooks."""
+    assert Instrumentation().enabled
+    stage = Stage()
+    assert Instrumentation().stage(stage, ".", "field", "field") is not stage
+
+
+def test_instrumentation_reports():
+    """Test `StageReport`s generated during `Pipeline.run`."""
+    reports = []
+    Instrumentation().register(reports.append)
+    try:
+        pipeline = Object(
+            properties={
+                Property("field1"): String(),
+                Property("field2"): Object(
+                    properties={Property("field3"): Integer()}
+                )
+            }
+        ).assemble()
+        output = pipeline.run(json={"field1": "a", "field2": {"field3": 0}})
+    finally:
+        Instrumentation().unregister(reports.append)
+
+    assert output.last_status == Responses().GOOD.status
+    assert [(r.loc, r.stage) for r in reports if r.name == "field1"] == [
+        (".", "field1"), (".", "field1[type]"), (".", "field1[dptype]"),
+        (".", "field1[output]")
+    ]
+    assert [r.stack for r in reports if r.stage == "field3[type]"] == [
+        (".field2[dptype]", ".field2.field3[type]")
+    ]
+    assert all(
+        r.duration >= r.self_duration >= 0 and r.stack[-1].endswith(r.stage)
+        for r in reports
+    )
+
+
+def test_instrumentation_assembled_without_hook(timer):
+    """Test that `Pipeline`s assembled without hooks are not reported."""
+    Instrumentation().unregister(timer)
+    pipeline = Object(properties={Property("field"): String()}).assemble()
+    Instrumentation().register(timer)
+    pipeline.run(json={"field": "a"})
+
+    assert not timer.fields
+
+
+def test_stage_timer(timer):
+    """Test aggregation of `StageReport`s in `StageTimer`."""
+    pipeline = Object(
+        properties={
+            Property("field1"): Object(
+                properties={Property("field2"): Integer()}
+            ),
+            OneOf("oneof"): {
+                Property("field3"): String(),
+                Property("field4"): Integer(),
+            }
+        }
+    ).assemble()
+    pipeline.run(json={"field1": {"field2": 0}, "field3": "a"})
+    output = pipeline.run(json={"field1": {"field2": "a"}})
+    assert output.last_status == Responses().BAD_TYPE.status
+
+    fields = timer.fields
+    assert fields[(".", "field1")]["count"] == 4 + 3
+    assert fields[(".field1", "field2")]["count"] == 4 + 2
+    assert fields[(".field1", "field2")]["status"] \
+        == {Responses().GOOD.status: 5, Responses().BAD_TYPE.status: 1}
+    assert (".", "oneof") in fields
+
+    collapsed = timer.collapsed().splitlines()
+    assert ".field1[dptype];.field1.field2[type] " \
+        in "\n".join(line.rsplit(" ", 1)[0] + " " for line in collapsed)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+
+    timer.clear()
+    assert not timer.fields
+    assert not timer.collapsed()
+
+
+def test_stage_timer_dump(tmp_path, timer):
+    """Test `StageTimer.dump`."""
+    Object(
+        properties={Property("field"): String()}
+    ).assemble().run(json={"field": "a"})
+    timer.dump(tmp_path / "stacks.folded")
+
+    assert (tmp_path / "stacks.folded").read_text(encoding="utf-8") \
+        == timer.collapsed()
@@ -0,0 +1,58 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+from data_plumber_http.metrics import Histogram, ValidationMetrics, \
+    render_prometheus
+
+
+def test_histogram():
+    """Test `Histogram`."""
+    histogram = Histogram([1, 10])
+    for value in (0.5, 1, 5, 100):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.sum == 106.5
+    assert histogram.cumulative() == [(1, 2), (10, 3), (float("inf"), 4)]
+
+
+def test_validation_metrics():
+    """Test `ValidationMetrics`."""
+    metrics = ValidationMetrics(latency_buckets=[0.1], size_buckets=[10])
+    metrics.observe("a", 0.05, 0, 5)
+    metrics.observe("a", 0.5, 422, None)
+    metrics.observe("b", 0.05, 0, 50)
+
+    assert metrics.endpoints["a"].status == {0: 1, 422: 1}
+    assert metrics.endpoints["a"].latency.count == 2
+    assert metrics.endpoints["a"].size.count == 1
+    assert metrics.endpoints["b"].size.cumulative() == [(10, 0), (float("inf"), 1)]
+
+    metrics.clear()
+    assert not metrics.endpoints
+
+
+def test_render_prometheus():
+    """Test `render_prometheus`."""
+    metrics = ValidationMetrics(latency_buckets=[0.1], size_buckets=[10])
+    metrics.observe('my"endpoint', 0.05, 0, 5)
+    metrics.observe('my"endpoint', 0.5, 422, 50)
+
+    lines = render_prometheus(metrics, prefix="test").splitlines()
+
+    assert "# TYPE test_validation_duration_seconds histogram" in lines
+    assert 'test_validation_duration_seconds_bucket{endpoint="my\\"endpoint",le="0.1"} 1' in lines
+    assert 'test_validation_duration_seconds_bucket{endpoint="my\\"endpoint",le="+Inf"} 2' in lines
+    assert 'test_validation_duration_seconds_count{endpoint="my\\"endpoint"} 2' in lines
+    assert 'test_payload_size_bytes_sum{endpoint="my\\"endpoint"} 55' in lines
+    assert "# TYPE test_validations_total counter" in lines
+    assert 'test_validations_total{endpoint="my\\"endpoint",status="0"} 1' in lines
+    assert 'test_validations_total{endpoint="my\\"endpoint",status="422"} 1' in lines
@@ -0,0 +1,235 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.engine
+"""
+
+from dataclasses import dataclass
+import random
+
+import pytest
+
+from data_plumber_http.keys import Property, OneOf, AllOf
+from data_plumber_http.types import Object, Array, String, Integer, Ref
+from data_plumber_http.settings import Responses
+from data_plumber_http.engine import IterativeValidator
+from data_plumber_http.compiler import CompiledValidator
+
+
+@dataclass
+class Pet:
+    name: str
+    age: int
+    owner: dict
+
+
+def _schema(**kwargs):
+    return Object(
+        model=Pet,
+        properties={
+            Property("name", required=True): String(),
+            Property("age", default=1): Integer(),
+            Property("owner"): Object(
+                properties={
+                    Property("id", required=True): Integer(),
+                    Property("nick", default="-"): String(),
+                }
+            ),
+            Property("tags"): Array(
+                items=Object(
+                    properties={Property("id", required=True): Integer()}
+                )
+            ),
+        },
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    ("json", "status", "value"),
+    [
+        ({}, Responses().GOOD.status, {}),
+        ({"age": 2}, Responses().GOOD.status, {"age": 2}),
+        ({"name": "a"}, Responses().GOOD.status, {"name": "a"}),
+        ({"name": 0}, Responses().BAD_TYPE.status, None),
+        ({"owner": {}}, Responses().GOOD.status, {"owner": {}}),
+        (
+            {"owner": {"nick": "b"}}, Responses().GOOD.status,
+            {"owner": {"nick": "b"}}
+        ),
+        ({"owner": {"id": "0"}}, Responses().BAD_TYPE.status, None),
+        (
+            {"tags": [{"id": 0}]}, Responses().GOOD.status,
+            {"tags": [{"id": 0}]}
+        ),
+        ({"tags": [{}]}, Responses().MISSING_REQUIRED.status, None),
+    ]
+)
+def test_partial(json, status, value):
+    """Test validation in partial mode."""
+    output = _schema().assemble().run(json=json, partial=True)
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value == value
+        assert output.data.kwargs == value
+
+
+def test_partial_regular_mode_unchanged():
+    """Test that the same `Pipeline` validates regularly without flag."""
+    pipeline = _schema().assemble()
+    assert pipeline.run(json={"age": 2}, partial=True).last_status \
+        == Responses().GOOD.status
+    assert pipeline.run(json={"age": 2}).last_status \
+        == Responses().MISSING_REQUIRED.status
+    output = pipeline.run(json={"name": "a", "owner": {"id": 0}})
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == Pet("a", 1, {"id": 0, "nick": "-"})
+
+
+def test_partial_unknown_property():
+    """Test that unknown properties are rejected in partial mode."""
+    output = _schema(additional_properties=False).assemble().run(
+        json={"age": 1, "unknown": 0}, partial=True
+    )
+    assert output.last_status == Responses().UNKNOWN_PROPERTY.status
+
+
+def test_partial_callable_default():
+    """Test that callable defaults are not evaluated in partial mode."""
+    calls = []
+    pipeline = Object(
+        properties={
+            Property(
+                "a", default=lambda **kwargs: calls.append(kwargs) or "x"
+            ): String()
+        }
+    ).assemble()
+    output = pipeline.run(json={}, partial=True)
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {}
+    assert calls == []
+    assert pipeline.run(json={}).data.value == {"a": "x"}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("key", [OneOf, AllOf])
+def test_partial_conditional(key):
+    """Test `OneOf` and `AllOf` in partial mode."""
+    pipeline = Object(
+        properties={
+            key("key", required=True): {
+                Property("a"): String(),
+                Property("b"): String(),
+            },
+            Property("c"): Integer(),
+        }
+    ).assemble()
+    output = pipeline.run(json={"c": 0}, partial=True)
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {"c": 0}
+    output = pipeline.run(json={"a": 0}, partial=True)
+    assert output.last_status == Responses().BAD_TYPE.status
+    assert pipeline.run(json={"c": 0}).last_status >= 400
+
+
+@pytest.mark.parametrize("key", [OneOf, AllOf])
+def test_partial_conditional_nested(key):
+    """Test nested `Object`s in `OneOf` and `AllOf` in partial mode."""
+    nested = Object(
+        properties={
+            Property("a", required=True): String(),
+            Property("b"): Integer(),
+        }
+    )
+    for properties in (
+        {key("key"): {Property("y"): nested}}, {Property("y"): nested}
+    ):
+        pipeline = Object(properties=properties).assemble()
+        output = pipeline.run(json={"y": {"b": 1}}, partial=True)
+        assert output.last_status == Responses().GOOD.status
+        assert output.data.value == {"y": {"b": 1}}
+        output = pipeline.run(json={"y": {"b": "1"}}, partial=True)
+        assert output.last_status == Responses().BAD_TYPE.status
+        assert pipeline.run(json={"y": {"b": 1}}).last_status >= 400
+
+
+def test_partial_make():
+    """Test `Object.make` in partial mode."""
+    schema = _schema()
+    assert schema.make({"age": 2}, ".field", partial=True) \
+        == ({"age": 2}, Responses().GOOD.msg, Responses().GOOD.status)
+    assert schema.make({"age": 2}, ".field")[2] \
+        == Responses().MISSING_REQUIRED.status
+
+
+def test_partial_ref():
+    """Test `Ref` in partial mode."""
+    node = Object(
+        properties={
+            Property("name", required=True): String(),
+            Property("child"): Ref(lambda: node),
+        }
+    )
+    output = node.assemble().run(json={"child": {"child": {}}}, partial=True)
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {"child": {"child": {}}}
+    output = node.assemble().run(json={"child": {"name": 0}}, partial=True)
+    assert output.last_status == Responses().BAD_TYPE.status
+
+
+@pytest.mark.parametrize("name", ["name", "age", "owner", "tags", "unknown"])
+def test_partial_iterative(name):
+    """Test `IterativeValidator` in partial mode."""
+    schema = _schema()
+    pipeline = schema.assemble()
+    validator = IterativeValidator(schema)
+    values = [
+        None, 0, "a", {}, {"id": 0}, {"id": "0"}, {"nick": "b"}, [],
+        [{"id": 0}], [{}],
+    ]
+    rng = random.Random(0)
+    for _ in range(50):
+        json = {
+            name: rng.choice(values),
+            **{k: rng.choice(values) for k in rng.sample(["age", "owner"], 1)}
+        }
+        expected = pipeline.run(json=json, partial=True)
+        output = validator.run(json=json, partial=True)
+        assert output.last_status == expected.last_status, json
+        assert output.last_message == expected.last_message, json
+        assert output.data.value == expected.data.value, json
+
+
+def test_partial_compiled():
+    """Test that compiled validators reject partial mode."""
+    validator = CompiledValidator(
+        lambda json, loc: ({}, "", Responses().GOOD.status, {})
+    )
+    with pytest.raises(ValueError):
+        validator.run(json={}, partial=True)
+
+
+def test_partial_flask_handler():
+    """Test argument `partial` of `flask_handler`."""
+    from flask import Flask
+    from data_plumber_http.decorators import flask_handler, flask_json
+
+    app = Flask(__name__)
+    schema = _schema()
+
+    @app.route("/", methods=["PATCH"])
+    @flask_handler(handler=schema.assemble(), json=flask_json, partial=True)
+    def patch(**kwargs):
+        return kwargs, 200
+
+    client = app.test_client()
+    response = client.patch("/", json={"owner": {"nick": "b"}})
+    assert response.status_code == 200
+    assert response.json == {"owner": {"nick": "b"}}
+    response = client.patch("/", json={"age": "1"})
+    assert response.status_code == Responses().BAD_TYPE.status
@@ -0,0 +1,252 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.engine
+  --cov=data_plumber_http.compiler
+"""
+
+from types import MappingProxyType
+import sys
+import random
+import importlib
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import (
+    Object, Array, Boolean, Float, Integer, Null, Number, String, Any, Url,
+    FileSystemObject, Ref
+)
+from data_plumber_http.settings import Responses
+from data_plumber_http.engine import IterativeValidator
+from data_plumber_http.compiler import main
+
+
+@pytest.mark.parametrize(
+    ("dptype", "identity"),
+    [
+        (String(), True),
+        (Integer(), False),
+        (Float(), True),
+        (Number(), False),
+        (Boolean(), True),
+        (Null(), True),
+        (Any(), True),
+        (Boolean() | Integer(), True),
+        (Integer() | Boolean(), False),
+        (Array(), True),
+        (Array(items=String()), True),
+        (Array(items=Url(return_parsed=True)), False),
+        (Url(), True),
+        (FileSystemObject(), False),
+        (Ref(String()), False),
+        (String() | FileSystemObject(), False),
+        (Object(), False),
+        (Object(free_form=True), True),
+        (Object(accept_only=[]), True),
+        (Object(additional_properties=False), True),
+        (Object(additional_properties=String()), True),
+        (Object(additional_properties=FileSystemObject()), False),
+        (Object(properties={Property("a"): String()}), False),
+        (Object(
+            properties={Property("a"): String()}, accept_only=["a"]
+        ), True),
+        (Object(
+            properties={Property("a"): String()}, accept_only=["a", "b"]
+        ), False),
+        (Object(
+            model="record",
+            properties={Property("a"): String()},
+            additional_properties=False
+        ), False),
+        (Object(
+            properties={Property("a", name="b"): String()},
+            additional_properties=False
+        ), False),
+        (Object(
+            properties={Property("a", default="x"): String()},
+            additional_properties=False
+        ), False),
+        (Object(
+            properties={Property("a", validation_only=True): String()},
+            additional_properties=False
+        ), False),
+        (Object(
+            properties={OneOf("a"): {Property("a"): String()}},
+            additional_properties=False
+        ), False),
+    ]
+)
+def test_is_identity(dptype, identity):
+    """Test `is_identity` of types."""
+    assert dptype.is_identity() is identity
+
+
+def test_passthrough_rejected():
+    """Test that `passthrough` requires an identity-`Object`."""
+    with pytest.raises(ValueError):
+        Object(properties={Property("a"): String()}, passthrough=True)
+
+
+SCHEMA = Object(
+    properties={
+        Property("name", required=True): String(),
+        Property("tags"): Array(items=String()),
+        Property("size"): Float(min_value=0),
+        Property("meta"): Object(free_form=True),
+    },
+    additional_properties=False,
+    passthrough=True
+)
+KEYS = ["name", "tags", "size", "meta", "other"]
+VALUES = [
+    None, "a", 0, 1, -1, 0.5, -0.5, True, [], ["a"], [1], {}, {"x": 1}
+]
+
+
+def _result(output):
+    return (
+        output.data.value if output.last_status == Responses().GOOD.status
+        else None,
+        output.last_message,
+        output.last_status
+    )
+
+
+def test_passthrough_boolean_values():
+    """
+    Test that passthrough-`Object`s produce the same (typed) output as
+    regular `Object`s for booleans and that `Integer`s (which convert
+    booleans) prevent passthrough.
+    """
+    properties = {Property("a"): Boolean(), Property("b"): Float()}
+    regular = Object(properties=properties, additional_properties=False)
+    passthrough = Object(
+        properties=properties, additional_properties=False,
+        passthrough=True
+    )
+    json = {"a": True, "b": 1.5}
+    expected = regular.assemble().run(json=json).data.value
+    value = passthrough.assemble().run(json=json).data.value
+    assert value == expected
+    assert [type(v) for v in value.values()] \
+        == [type(v) for v in expected.values()]
+
+    properties = {Property("a"): Integer()}
+    output = Object(
+        properties=properties, additional_properties=False
+    ).assemble().run(json={"a": True})
+    assert output.data.value == {"a": 1}
+    assert type(output.data.value["a"]) is int
+    with pytest.raises(ValueError):
+        Object(
+            properties=properties, additional_properties=False,
+            passthrough=True
+        )
+
+
+def test_passthrough():
+    """Test output of `passthrough`-`Object`s."""
+    json = {"name": "a", "tags": ["b"], "meta": {"x": 1}}
+    output = SCHEMA.assemble().run(json=json)
+    assert output.last_status == Responses().GOOD.status
+    assert isinstance(output.data.value, MappingProxyType)
+    assert output.data.value == json
+    assert output.data.value["tags"] is json["tags"]
+    with pytest.raises(TypeError):
+        output.data.value["name"] = "b"  # type: ignore[index]
+    assert output.data.kwargs == {}
+
+
+def test_passthrough_records():
+    """Test that properties are not collected into the output."""
+    json = {"name": "a"}
+    regular = Object(
+        properties=SCHEMA.properties, additional_properties=False
+    ).assemble().run(json=json, expand_records=True)
+    output = SCHEMA.assemble().run(json=json, expand_records=True)
+    assert output.data.value == regular.data.value
+    assert len(output.records) < len(regular.records)
+    assert not any(r.id_.endswith("[output]") for r in output.records)
+
+
+@pytest.mark.parametrize("handler", ["pipeline", "iterative"])
+def test_passthrough_equivalence(handler):
+    """
+    Test that `passthrough`-`Object`s validate like regular `Object`s.
+    """
+    regular = Object(
+        properties=SCHEMA.properties, additional_properties=False
+    ).assemble()
+    validator = SCHEMA.assemble() if handler == "pipeline" \
+        else IterativeValidator(SCHEMA)
+    rng = random.Random(0)
+    for _ in range(500):
+        json = {
+            k: rng.choice(VALUES)
+            for k in rng.sample(KEYS, rng.randint(0, len(KEYS)))
+        }
+        assert _result(validator.run(json=json)) \
+            == _result(regular.run(json=json)), json
+
+
+@pytest.mark.parametrize("handler", ["pipeline", "iterative"])
+def test_passthrough_modes(handler):
+    """Test `passthrough`-`Object`s in partial- and coerce-mode."""
+    schema = Object(
+        properties={
+            Property("a", required=True): Float(),
+            Property("b"): Array(items=Boolean()),
+        },
+        additional_properties=Float(),
+        passthrough=True
+    )
+    validator = schema.assemble() if handler == "pipeline" \
+        else IterativeValidator(schema)
+
+    output = validator.run(json={"b": [True]}, partial=True)
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {"b": [True]}
+
+    output = validator.run(
+        json=MultiDict(
+            [("a", "1"), ("b", "true"), ("b", "false"), ("c", "2")]
+        ),
+        coerce=True
+    )
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == {"a": 1.0, "b": [True, False], "c": 2.0}
+
+
+def test_passthrough_compiled(tmp_path, monkeypatch):
+    """Test compiled validators for `passthrough`-`Object`s."""
+    (tmp_path / "passthrough_schemas.py").write_text(
+        "from data_plumber_http.keys import Property\n"
+        + "from data_plumber_http.types import Object, String\n"
+        + "Schema = Object(\n"
+        + "    properties={Property('a'): String()},\n"
+        + "    additional_properties=False,\n"
+        + "    passthrough=True\n"
+        + ")\n",
+        encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        main([
+            "passthrough_schemas",
+            "-o", str(tmp_path / "passthrough_validators.py")
+        ])
+        validator = importlib.import_module("passthrough_validators").Schema
+        json = {"a": "x"}
+        output = validator.run(json=json)
+        assert isinstance(output.data.value, MappingProxyType)
+        assert output.data.value == json
+        assert validator.run(json={"b": "x"}).last_status \
+            == Responses().UNKNOWN_PROPERTY.status
+    finally:
+        for module in ("passthrough_schemas", "passthrough_validators"):
+            sys.modules.pop(module, None)
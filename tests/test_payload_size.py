@@ -0,0 +1,254 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+from io import BytesIO
+import json
+import random
+
+import pytest
+from flask import Flask, Response
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import (
+    Object, Array, Boolean, Float, Integer, Null, Number, String, Ref, Url
+)
+from data_plumber_http.settings import Responses
+from data_plumber_http.metrics import ValidationMetrics
+from data_plumber_http.decorators import flask_handler, flask_json
+
+
+@pytest.mark.parametrize(
+    ("dptype", "size"),
+    [
+        (Boolean(), 5),
+        (Null(), 4),
+        (Integer(), None),
+        (Integer(min_value=0), None),
+        (Integer(min_value=0, max_value=100), 5),
+        (Integer(min_value_inclusive=-12345, max_value=1), 6),
+        (Integer(min_value=-0.5, max_value_inclusive=99999.5), 6),
+        (Integer(values=[1, 123456]), 6),
+        (Float(), 24),
+        (Float(values=[0.5, 12.25]), 5),
+        (Number(min_value=0, max_value=10), 24),
+        (String(), None),
+        (String(enum=["a", "bc"]), 2 + 2 * 12),
+        (String(pattern=r"[a-z]{2,5}"), 2 + 5 * 12),
+        (String(pattern=r"[a-z]+"), None),
+        (String(pattern=r"[a-z]"), 2 + 12),
+        (Array(items=Boolean()), None),
+        (Boolean() | Null(), 5),
+        (Boolean() | String(), None),
+        (Ref(Boolean()), None),
+        (Url(), None),
+        (Object(), None),
+        (Object(properties={Property("a"): Boolean()}), None),
+        (Object(properties={Property("a"): Boolean()}, free_form=True), None),
+        (Object(additional_properties=Boolean()), None),
+        (Object(accept_only=[]), 2),
+        (Object(additional_properties=False), 2),
+        (Object(properties={Property("a"): Boolean()}, accept_only=["a"]),
+         2 + (2 + 12) + 1 + 5),
+        (Object(properties={Property("a"): Boolean()}, accept_only=["b"]),
+         None),
+        (Object(
+            properties={
+                Property("a"): Boolean(),
+                Property("b"): Object(
+                    properties={Property("c"): Null()},
+                    additional_properties=False
+                ),
+            },
+            additional_properties=False
+        ), 2 + (14 + 1 + 5) + 1 + (14 + 1 + (2 + 14 + 1 + 4))),
+        (Object(
+            properties={
+                OneOf("x"): {
+                    Property("a"): Boolean(),
+                    Property("b", name="c"): Null(),
+                },
+                Property("b"): Integer(min_value=0, max_value=10**6),
+            },
+            additional_properties=False
+        ), 2 + (14 + 1 + 5) + 1 + (14 + 1 + 7)),
+    ]
+)
+def test_max_json_size(dptype, size):
+    """Test `max_json_size` of types."""
+    assert dptype.max_json_size() == size
+
+
+SCHEMA = Object(
+    properties={
+        Property("name"): String(pattern=r"(?s).{0,20}"),
+        Property("kind"): String(enum=["cat", "dög", "🐍"]),
+        Property("age"): Integer(min_value_inclusive=-100, max_value=1000),
+        Property("weight"): Float(),
+        Property("flag"): Boolean() | Null(),
+        Property("owner"): Object(
+            properties={Property("id"): Integer(min_value=0, max_value=99)},
+            accept_only=["id"]
+        ),
+    },
+    additional_properties=False
+)
+
+
+def _document():
+    return {
+        "name": "".join(
+            random.choice(["a", "\n", "\"", "ä", "😀", "\x00"])
+            for _ in range(20)
+        ),
+        "kind": random.choice(["cat", "dög", "🐍"]),
+        "age": random.choice([-100, 999]),
+        "weight": random.choice([-2.2250738585072014e-308, 1e300, 0.1]),
+        "flag": random.choice([True, False, None]),
+        "owner": {"id": random.choice([1, 98])},
+    }
+
+
+def test_max_json_size_bound():
+    """Test that `max_json_size` is an upper bound for valid documents."""
+    size = SCHEMA.max_json_size()
+    pipeline = SCHEMA.assemble()
+    for _ in range(200):
+        document = _document()
+        assert pipeline.run(json=document).last_status \
+            == Responses().GOOD.status
+        for ensure_ascii in (True, False):
+            assert len(
+                json.dumps(
+                    document, ensure_ascii=ensure_ascii,
+                    separators=(",", ":")
+                ).encode("utf-8")
+            ) <= size
+
+
+def test_max_json_size_compact_only():
+    """Test that `max_json_size` does not bound formatted JSON."""
+    schema = Object(
+        properties={
+            Property("a"): Object(
+                properties={
+                    Property("b"): Object(
+                        properties={Property("c"): Boolean()},
+                        additional_properties=False
+                    )
+                },
+                additional_properties=False
+            )
+        },
+        additional_properties=False
+    )
+    document = {"a": {"b": {"c": True}}}
+    assert schema.assemble().run(json=document).last_status \
+        == Responses().GOOD.status
+    assert len(json.dumps(document, separators=(",", ":"))) \
+        <= schema.max_json_size() \
+        < len(json.dumps(document, indent=4))
+
+
+@pytest.fixture(name="app")
+def _app():
+    app = Flask(__name__)
+    app.config.update({"TESTING": True})
+    return app
+
+
+def test_flask_handler_max_content_length(app):
+    """Test argument `max_content_length` of `flask_handler`."""
+    decoded = []
+    metrics = ValidationMetrics()
+
+    def _json():
+        decoded.append(True)
+        return flask_json()
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=SCHEMA.assemble(),
+        json=_json,
+        metrics=metrics,
+        max_content_length=SCHEMA.max_json_size()
+    )
+    def main(**kwargs):
+        return Response("OK", status=Responses().GOOD.status)
+
+    client = app.test_client()
+
+    response = client.post("/", json=_document())
+    assert response.status_code == Responses().GOOD.status
+    assert len(decoded) == 1
+
+    response = client.post(
+        "/", json={"name": "a" * SCHEMA.max_json_size()}
+    )
+    assert response.status_code == Responses().PAYLOAD_TOO_LARGE.status
+    assert "too large" in response.data.decode()
+    assert len(decoded) == 1
+    assert sum(metrics.endpoints["main"].status.values()) == 2
+    assert metrics.endpoints["main"].status[
+        Responses().PAYLOAD_TOO_LARGE.status
+    ] == 1
+
+
+def test_flask_handler_max_content_length_server_timing(app):
+    """
+    Test `Server-Timing`-header of responses rejected due to
+    `max_content_length`.
+    """
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(properties={Property("a"): String()}).assemble(),
+        json=flask_json,
+        server_timing=True,
+        max_content_length=20
+    )
+    def main(**kwargs):
+        return Response("OK", status=Responses().GOOD.status)
+
+    response = app.test_client().post("/", json={"a": "a" * 20})
+    assert response.status_code == Responses().PAYLOAD_TOO_LARGE.status
+    assert response.headers["Server-Timing"].startswith("validate;dur=")
+
+
+def test_flask_handler_max_content_length_chunked(app):
+    """Test argument `max_content_length` for bodies without length."""
+
+    @app.route("/", methods=["POST"])
+    @flask_handler(
+        handler=Object(properties={Property("a"): String()}).assemble(),
+        json=flask_json,
+        max_content_length=20
+    )
+    def main(**kwargs):
+        return Response("OK", status=Responses().GOOD.status)
+
+    client = app.test_client()
+
+    def body(size):
+        return BytesIO(json.dumps({"a": "a" * size}).encode())
+
+    response = client.post(
+        "/", input_stream=body(2), content_type="application/json",
+        headers={"Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True}
+    )
+    assert response.status_code == Responses().GOOD.status
+    response = client.post(
+        "/", input_stream=body(100), content_type="application/json",
+        headers={"Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True}
+    )
+    # werkzeug either raises RequestEntityTooLarge or truncates the body
+    # (which then fails to decode)
+    assert response.status_code in (400, 413)
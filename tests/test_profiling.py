@@ -0,0 +1,77 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+import pstats
+
+import pytest
+
+from data_plumber_http.keys import Property
+from data_plumber_http.types import Object, String
+from data_plumber_http.settings import Responses
+from data_plumber_http.profiling import SamplingProfiler, ENV_RATE, \
+    ENV_DIRECTORY, ENV_INTERVAL
+
+
+def _count_calls(stats: pstats.Stats, name: str) -> int:
+    # only count calls of the entry point (data_plumber_http.execution)
+    return sum(
+        v[1] for k, v in stats.stats.items()  # type: ignore[attr-defined]
+        if k[2] == name and k[0].endswith("execution.py")
+    )
+
+
+def test_sampling_profiler(tmp_path):
+    """Test sampling and aggregation of `SamplingProfiler`."""
+    profiler = SamplingProfiler(3, tmp_path, interval=3600)
+    pipeline = Object(properties={Property("field"): String()}).assemble()
+
+    for _ in range(7):
+        output = profiler.profile("endpoint", pipeline.run, json={"field": "a"})
+        assert output.last_status == Responses().GOOD.status
+
+    assert list(profiler.stats) == ["endpoint"]
+    assert _count_calls(profiler.stats["endpoint"], "run") == 2
+    assert not list(tmp_path.iterdir())
+
+    profiler.write()
+    assert [p.name for p in tmp_path.iterdir()] == ["endpoint.prof"]
+    assert _count_calls(pstats.Stats(str(tmp_path / "endpoint.prof")), "run") == 2
+
+
+def test_sampling_profiler_periodic_write(tmp_path):
+    """Test periodic writing of `SamplingProfiler`."""
+    profiler = SamplingProfiler(1, tmp_path / "profiles", interval=0)
+    profiler.profile("my/endpoint", sum, [1, 2])
+    profiler.profile("my/endpoint", lambda: None)
+
+    assert [p.name for p in (tmp_path / "profiles").iterdir()] \
+        == ["my_endpoint.prof"]
+
+
+def test_sampling_profiler_bad_rate(tmp_path):
+    """Test `SamplingProfiler` with bad `rate`."""
+    with pytest.raises(ValueError):
+        SamplingProfiler(0, tmp_path)
+
+
+def test_sampling_profiler_from_env(tmp_path, monkeypatch):
+    """Test `SamplingProfiler.from_env`."""
+    monkeypatch.delenv(ENV_RATE, raising=False)
+    assert SamplingProfiler.from_env() is None
+
+    monkeypatch.setenv(ENV_RATE, "10")
+    monkeypatch.setenv(ENV_DIRECTORY, str(tmp_path))
+    monkeypatch.setenv(ENV_INTERVAL, "5")
+    profiler = SamplingProfiler.from_env()
+    assert profiler is not None
+    assert profiler.rate == 10
+    assert profiler.directory == tmp_path
+    assert profiler.interval == 5
@@ -0,0 +1,197 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.registry
+"""
+
+import gc
+
+import pytest
+from data_plumber import Pipeline
+
+from data_plumber_http.keys import Property, OneOf
+from data_plumber_http.types import Object, Array, String, Integer
+from data_plumber_http.settings import Responses
+from data_plumber_http.registry import SchemaRegistry
+
+
+@pytest.fixture(name="registry")
+def _registry():
+    registry = SchemaRegistry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+def _schema():
+    inner = Object(properties={Property("b"): Integer()})
+    item = Object(properties={Property("c"): String()})
+    option = Object(properties={Property("d"): String()})
+    outer = Object(
+        properties={
+            Property("a"): inner,
+            Property("list"): Array(items=item),
+            OneOf("oneof"): {Property("e"): option},
+        }
+    )
+    return outer, inner, item, option
+
+
+def test_registry_singleton():
+    """Test singleton-property of `SchemaRegistry`."""
+    assert SchemaRegistry() is SchemaRegistry()
+
+
+def test_registry_warm_up(registry):
+    """Test method `warm_up` of `SchemaRegistry`."""
+    outer, inner, item, option = _schema()
+    assert registry.pipeline(inner, ".a") \
+        is not registry.pipeline(inner, ".a")
+    outer.assemble()
+    report = registry.warm_up()
+    assert report.pipelines >= 3
+    assert report.frozen is None
+    assert report.duration >= 0
+    for object_, loc in ((inner, ".a"), (item, ".list"), (option, ".e")):
+        assert isinstance(registry.pipeline(object_, loc), Pipeline)
+        assert registry.pipeline(object_, loc) \
+            is registry.pipeline(object_, loc)
+    # top-level Pipeline is not cached
+    assert registry.pipeline(outer, None) is not registry.pipeline(outer, None)
+
+    # repeated warm-up does not rebuild
+    assert registry.warm_up().pipelines == 0
+    assert registry.pipelines >= 3
+
+    registry.clear()
+    assert registry.pipelines == 0
+    assert registry.pipeline(inner, ".a") \
+        is not registry.pipeline(inner, ".a")
+
+
+def test_registry_warm_up_validation(registry):
+    """
+    Test that validation with `Pipeline`s from `warm_up` gives same
+    results.
+    """
+    outer, *_ = _schema()
+    pipeline = outer.assemble()
+    inputs = [
+        {"a": {"b": 1}, "list": [{"c": "x"}], "e": {"d": "y"}},
+        {"a": {"b": "1"}},
+        {"list": [{"c": 0}]},
+        {"e": {"d": 0}},
+    ]
+    before = [pipeline.run(json=json) for json in inputs]
+    registry.warm_up()
+    after = [pipeline.run(json=json) for json in inputs]
+    for b, a in zip(before, after):
+        assert b.last_status == a.last_status
+        assert b.last_message == a.last_message
+        assert b.data.value == a.data.value
+
+
+def test_registry_handlers(registry):
+    """Test exercising registered handlers in `warm_up`."""
+    calls = []
+
+    class Handler:
+        def run(self, **kwargs):
+            calls.append(kwargs)
+
+    handler = Handler()
+    registry.register_handler(handler)
+    report = registry.warm_up()
+    assert report.handlers >= 1
+    assert {"json": {}} in calls
+
+
+def test_registry_handlers_failure(registry):
+    """Test that failing handlers do not abort `warm_up`."""
+    calls = []
+
+    class Failing:
+        def run(self, **kwargs):
+            raise KeyError("json")
+
+    class Handler:
+        def run(self, **kwargs):
+            calls.append(kwargs)
+
+    failing, handler = Failing(), Handler()
+    registry.register_handler(failing)
+    registry.register_handler(handler)
+    report = registry.warm_up()
+    assert calls == [{"json": {}}]
+    assert len(report.failures) == 1
+    assert report.failures[0][0] is failing
+    assert isinstance(report.failures[0][1], KeyError)
+
+
+def test_registry_register_top_level_only(registry):
+    """Test that internal and temporary `Object`s are not registered."""
+    schema = Object(
+        properties={Property("a"): Object()},
+        additional_properties=Integer()
+    )
+    gc.collect()
+    roots = set(registry._roots)
+    pipeline = schema.assemble()
+    assert set(registry._roots) == roots | {schema}
+    for _ in range(10):
+        assert pipeline.run(json={"a": {}, "b": 1}).last_status \
+            == Responses().GOOD.status
+    assert schema.make({"a": {}}, None)[2] == Responses().GOOD.status
+    assert set(registry._roots) == roots | {schema}
+    other = Object()
+    other.assemble(register=False)
+    assert other not in registry._roots
+
+
+def test_registry_weak_references(registry):
+    """Test that registered schemas and handlers are not kept alive."""
+    class Handler:
+        def run(self, **kwargs):
+            pass
+
+    gc.collect()
+    roots, handlers = len(registry._roots), len(registry._handlers)
+    handler = Handler()
+    registry.register_handler(handler)
+    outer, *_ = _schema()
+    outer.assemble()
+    assert len(registry._roots) == roots + 1
+    assert len(registry._handlers) == handlers + 1
+    del outer, handler, _
+    gc.collect()
+    assert len(registry._roots) == roots
+    assert len(registry._handlers) == handlers
+
+
+def test_registry_warm_up_freeze(registry):
+    """Test argument `freeze` of `SchemaRegistry.warm_up`."""
+    outer, *_ = _schema()
+    outer.assemble()
+    try:
+        report = registry.warm_up(freeze=True)
+        assert report.frozen is not None
+        assert report.frozen > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_registry_flask_handler(registry):
+    """Test registration of `flask_handler`-handlers."""
+    pytest.importorskip("flask")
+    from data_plumber_http.decorators import flask_handler, flask_json
+
+    pipeline = Object(properties={Property("a"): String()}).assemble()
+    flask_handler(handler=pipeline, json=flask_json)(lambda: None)
+    assert pipeline in registry._handlers
+    assert registry.warm_up().handlers >= 1
+    assert pipeline.run(json={"a": 0}).last_status \
+        == Responses().BAD_TYPE.status
@@ -0,0 +1,119 @@
+"""
+Part of the test suite for data-plumber-http.
+
+Run with
+pytest -v -s
+  --cov=data_plumber_http.keys
+  --cov=data_plumber_http.types
+  --cov=data_plumber_http.decorators
+  --cov=data_plumber_http.settings
+"""
+
+import sys
+import time
+
+import pytest
+
+from data_plumber_http.keys import Property
+from data_plumber_http.types import Object, FileSystemObject
+from data_plumber_http.settings import Responses
+from data_plumber_http.stat_cache import StatCache
+
+
+def test_stat_cache_counters(tmp_path):
+    """Test counters of `StatCache`."""
+    cache = StatCache()
+    assert cache.hit_rate == 0.0
+    assert cache.stat(tmp_path) is not None
+    assert cache.stat(tmp_path) is not None
+    assert cache.stat(tmp_path / "missing") is None
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert cache.hit_rate == pytest.approx(1/3)
+    cache.reset_counters()
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_stat_cache_ttl(tmp_path):
+    """Test expiration of entries in `StatCache`."""
+    cache = StatCache(ttl=0.05)
+    file = tmp_path / "file"
+    assert cache.stat(file) is None
+    file.touch()
+    assert cache.stat(file) is None
+    time.sleep(0.1)
+    assert cache.stat(file) is not None
+    assert cache.misses == 2
+
+
+def test_stat_cache_max_size(tmp_path):
+    """Test size bound of `StatCache`."""
+    cache = StatCache(max_size=2)
+    for name in ("a", "b", "c"):
+        cache.stat(tmp_path / name)
+    assert len(cache) == 2
+    cache.stat(tmp_path / "a")
+    assert cache.hits == 0
+    cache.stat(tmp_path / "c")
+    assert cache.hits == 1
+
+
+def test_stat_cache_bad_max_size():
+    """Test `StatCache` with bad `max_size`."""
+    with pytest.raises(ValueError):
+        StatCache(max_size=0)
+
+
+def test_stat_cache_invalidate(tmp_path):
+    """Test explicit invalidation of `StatCache`."""
+    cache = StatCache(ttl=None)
+    file = tmp_path / "file"
+    assert cache.stat(file) is None
+    file.touch()
+    assert cache.stat(file) is None
+    cache.invalidate(file)
+    assert cache.stat(file) is not None
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="requires inotify"
+)
+def test_stat_cache_inotify(tmp_path):
+    """Test invalidation of `StatCache` via inotify."""
+    cache = StatCache(ttl=None, inotify=True)
+    file = tmp_path / "file"
+    try:
+        assert cache.stat(file) is None
+        file.touch()
+        for _ in range(100):
+            if len(cache) == 0:
+                break
+            time.sleep(0.01)
+        assert cache.stat(file) is not None
+        assert cache.stat(file) is not None
+        assert cache.hits == 1
+    finally:
+        cache.close()
+
+
+def test_file_system_object_stat_cache(tmp_path):
+    """Test `FileSystemObject` with `StatCache`."""
+    cache = StatCache()
+    pipeline = Object(
+        properties={
+            Property("field"): FileSystemObject(
+                exists=True, is_dir=True, stat_cache=cache
+            )
+        }
+    ).assemble()
+
+    for _ in range(3):
+        output = pipeline.run(json={"field": str(tmp_path)})
+        assert output.last_status == Responses().GOOD.status
+    output = pipeline.run(json={"field": str(tmp_path / "missing")})
+    assert output.last_status == Responses().RESOURCE_NOT_FOUND.status
+    assert cache.hits == 2
+    assert cache.misses == 2
@@ -10,14 +10,16 @@ pytest -v -s
 """
 
 from pathlib import Path
+import os
 
 import pytest
 
 from data_plumber_http.keys import Property
 from data_plumber_http.types \
     import Any, Array, Boolean, Float, Integer, Null, Number, \
-        Object, String, Uri, Url, FileSystemObject
+        Object, String, Uri, Url, FileSystemObject, Ref
 from data_plumber_http.settings import Responses
+from data_plumber_http.registry import SchemaRegistry
 
 
 @pytest.mark.parametrize(
@@ -465,6 +467,122 @@ def test_url_return_parsed():
     assert hasattr(output.data.value["field"], "path")
 
 
+@pytest.mark.parametrize(
+    ("json", "status"),
+    [
+        ("HTTP://pypi.org", Responses().GOOD.status),
+        (" http://pypi.org", Responses().GOOD.status),
+        ("ht\ttp://pypi.org", Responses().GOOD.status),
+        ("https://pypi.org", Responses().BAD_VALUE.status),
+        ("httpx://pypi.org", Responses().BAD_VALUE.status),
+        ("h", Responses().BAD_VALUE.status),
+        ("", Responses().BAD_VALUE.status),
+    ]
+)
+def test_url_schemes_prefilter(json, status):
+    """Test scheme-prefilter of type `Url` against full parsing."""
+    output = Object(
+        properties={
+            Property("field"): Url(schemes=["http"])
+        }
+    ).assemble().run(json={"field": json})
+
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value["field"] == json
+    else:
+        print(output.last_message)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "json", "status"),
+    [
+        ({"allowed_hosts": ["pypi.org"]}, "http://pypi.org/path", Responses().GOOD.status),
+        ({"allowed_hosts": ["pypi.org"]}, "http://PyPI.org:80", Responses().GOOD.status),
+        ({"allowed_hosts": ["pypi.org"]}, "http://a.pypi.org", Responses().BAD_VALUE.status),
+        ({"allowed_hosts": ["pypi.org"]}, "pypi.org", Responses().BAD_VALUE.status),
+        ({"allowed_hosts": ["*.pypi.org"]}, "http://a.b.pypi.org", Responses().GOOD.status),
+        ({"allowed_hosts": ["*.pypi.org"]}, "http://pypi.org", Responses().BAD_VALUE.status),
+        ({"allowed_hosts": ["*.pypi.org"]}, "http://pypi.org.evil", Responses().BAD_VALUE.status),
+        ({"denied_hosts": ["*.pypi.org"]}, "http://a.pypi.org", Responses().BAD_VALUE.status),
+        ({"denied_hosts": ["*.pypi.org"]}, "http://pypi.org", Responses().GOOD.status),
+        ({"denied_hosts": ["*.pypi.org"]}, "pypi.org", Responses().GOOD.status),
+        (
+            {"allowed_hosts": ["*.pypi.org"], "denied_hosts": ["a.pypi.org"]},
+            "http://a.pypi.org",
+            Responses().BAD_VALUE.status
+        ),
+        (
+            {"allowed_hosts": ["*.pypi.org"], "denied_hosts": ["a.pypi.org"]},
+            "http://b.pypi.org",
+            Responses().GOOD.status
+        ),
+    ]
+)
+def test_url_hosts(kwargs, json, status):
+    """Test type `Url` with host allow- and deny-lists."""
+    output = Object(
+        properties={
+            Property("field"): Url(**kwargs)
+        }
+    ).assemble().run(json={"field": json})
+
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value["field"] == json
+    else:
+        print(output.last_message)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["", "a.*.org", "*.*.org", "pypi..org"]
+)
+def test_url_hosts_bad_pattern(pattern):
+    """Test type `Url` with malformed host-patterns."""
+    with pytest.raises(ValueError):
+        Url(allowed_hosts=[pattern])
+    with pytest.raises(ValueError):
+        Uri(denied_hosts=[pattern])
+
+
+@pytest.mark.parametrize(
+    ("json", "status"),
+    [
+        (["http://pypi.org", "http://pypi.org"], Responses().GOOD.status),
+        (["http://pypi.org", "sftp://pypi.org"], Responses().BAD_VALUE.status),
+        (["http://pypi.org", 0], Responses().BAD_TYPE.status),
+    ]
+)
+def test_url_array(json, status):
+    """Test type `Url` in `Array`."""
+    output = Object(
+        properties={
+            Property("field"): Array(items=Url(schemes=["http"]))
+        }
+    ).assemble().run(json={"field": json})
+
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value["field"] == json
+    else:
+        print(output.last_message)
+
+
+def test_url_array_return_parsed():
+    """Test type `Url` in `Array` with shared results."""
+    output = Object(
+        properties={
+            Property("field"): Array(items=Url(return_parsed=True))
+        }
+    ).assemble().run(json={"field": ["http://pypi.org"] * 3})
+
+    assert output.last_status == Responses().GOOD.status
+    assert len(output.data.value["field"]) == 3
+    assert output.data.value["field"][0] is output.data.value["field"][2]
+    assert output.data.value["field"][0].netloc == "pypi.org"
+
+
 @pytest.mark.parametrize(
     ("json", "status"),
     [
@@ -621,6 +739,145 @@ def test_file_system_object(kwargs, json, status):
         print(output.last_message)
 
 
+@pytest.mark.parametrize(
+    ("kwargs", "status"),
+    [
+        ({"is_fifo": True}, Responses().GOOD.status),
+        ({"exists": True, "is_file": False}, Responses().GOOD.status),
+        ({"is_file": True}, Responses().BAD_RESOURCE.status),
+        ({"is_fifo": False}, Responses().CONFLICT.status),
+    ],
+    ids=["is_fifo-good", "not is_file-good", "is_file-but fifo", "is_fifo-conflict"]
+)
+def test_file_system_object_fifo(tmp_path, kwargs, status):
+    """Test type `FileSystemObject` with a fifo."""
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+    output = Object(
+        properties={
+            Property("field"): FileSystemObject(**kwargs)
+        }
+    ).assemble().run(json={"field": str(fifo)})
+
+    assert output.last_status == status
+
+
+def test_file_system_object_single_stat(monkeypatch):
+    """Test type `FileSystemObject` for number of stat-calls."""
+    calls = []
+    stat = os.stat
+
+    def _stat(path, *args, **kwargs):
+        calls.append(path)
+        return stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", _stat)
+    output = Object(
+        properties={
+            Property("field"): FileSystemObject(
+                exists=True, is_file=True, is_dir=False, is_fifo=False
+            )
+        }
+    ).assemble().run(json={"field": __file__})
+
+    assert output.last_status == Responses().GOOD.status
+    assert len(calls) == 1
+
+
+@pytest.fixture(name="file_tree")
+def _file_tree(tmp_path):
+    for index in range(FileSystemObject.SCANDIR_THRESHOLD + 2):
+        (tmp_path / f"file{index}").touch()
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "dir")
+    os.mkfifo(tmp_path / "fifo")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "names", "status"),
+    [
+        ({"is_file": True}, [], Responses().GOOD.status),
+        (
+            {"is_file": True},
+            [f"file{i}" for i in range(FileSystemObject.SCANDIR_THRESHOLD + 2)],
+            Responses().GOOD.status
+        ),
+        (
+            {"exists": True},
+            ["dir", "link", "fifo"]
+            + [f"file{i}" for i in range(FileSystemObject.SCANDIR_THRESHOLD)],
+            Responses().GOOD.status
+        ),
+        ({"is_dir": True}, ["dir", "link"], Responses().GOOD.status),
+        ({"is_fifo": True}, ["fifo"], Responses().GOOD.status),
+        ({"is_file": True}, ["file0", "dir"], Responses().BAD_RESOURCE.status),
+        ({"is_file": True}, ["file0", "missing"], Responses().RESOURCE_NOT_FOUND.status),
+        (
+            {"is_file": True},
+            ["dir"]
+            + [f"file{i}" for i in range(FileSystemObject.SCANDIR_THRESHOLD)],
+            Responses().BAD_RESOURCE.status
+        ),
+        (
+            {"exists": False},
+            ["missing", "missing/file", "file0"],
+            Responses().CONFLICT.status
+        ),
+        (
+            {"is_dir": True},
+            ["missing", "file0"],
+            Responses().RESOURCE_NOT_FOUND.status
+        ),
+    ]
+)
+@pytest.mark.parametrize("batch", [False, True], ids=["sequential", "batch"])
+def test_file_system_object_array(file_tree, kwargs, names, status, batch):
+    """Test type `FileSystemObject` in `Array` with and without batch."""
+    json = [str(file_tree / name) for name in names]
+    output = Object(
+        properties={
+            Property("field"): Array(
+                items=FileSystemObject(batch=batch, max_workers=4, **kwargs)
+            )
+        }
+    ).assemble().run(json={"field": json})
+
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value["field"] == [Path(p) for p in json]
+    else:
+        print(output.last_message)
+
+
+def test_file_system_object_array_relative_to():
+    """Test type `FileSystemObject` in `Array` with batch and bad input."""
+    output = Object(
+        properties={
+            Property("field"): Array(
+                items=FileSystemObject(
+                    relative_to=Path(__file__).parent, batch=True,
+                    is_file=True
+                )
+            )
+        }
+    ).assemble().run(json={"field": [__file__ + ".x", "/another_path"]})
+
+    assert output.last_status == Responses().RESOURCE_NOT_FOUND.status
+    output = Object(
+        properties={
+            Property("field"): Array(
+                items=FileSystemObject(
+                    relative_to=Path(__file__).parent, batch=True,
+                    is_file=True
+                )
+            )
+        }
+    ).assemble().run(json={"field": ["/another_path", __file__ + ".x"]})
+
+    assert output.last_status == Responses().BAD_VALUE.status
+
+
 @pytest.mark.parametrize(
     ("json", "status"),
     [
@@ -644,3 +901,102 @@ def test_any(json, status):
     assert output.last_status == status
     if status == Responses().GOOD.status:
         assert output.data.value["field"] == json
+
+
+def _tree(depth):
+    tree = {"name": "leaf"}
+    for index in range(depth):
+        tree = {"name": str(index), "children": [{"name": "x"}, tree]}
+    return tree
+
+
+@pytest.mark.parametrize(
+    ("json", "status"),
+    [
+        ({"name": "root"}, Responses().GOOD.status),
+        (
+            {"name": "root", "children": [{"name": "a", "children": []}]},
+            Responses().GOOD.status
+        ),
+        (_tree(50), Responses().GOOD.status),
+        (
+            {"name": "root", "children": [{"name": 0}]},
+            Responses().BAD_TYPE.status
+        ),
+        (
+            {"name": "root", "children": [{}]},
+            Responses().MISSING_REQUIRED.status
+        ),
+        ({"name": "root", "children": [0]}, Responses().BAD_TYPE.status),
+    ]
+)
+def test_ref(json, status):
+    """Test type `Ref` for recursive schemas."""
+    node = Object(
+        properties={
+            Property("name", required=True): String(),
+            Property("children"): Array(items=Ref(lambda: node)),
+        }
+    )
+    output = node.assemble().run(json=json)
+
+    assert output.last_status == status
+    if status == Responses().GOOD.status:
+        assert output.data.value == json
+
+
+def test_ref_messages():
+    """Test that `Ref` reports the location like a nested `Object`."""
+    inner = Object(properties={Property("a", required=True): String()})
+    for field in (inner, Ref(inner), Ref(lambda: inner)):
+        output = Object(
+            properties={Property("field"): field}
+        ).assemble().run(json={"field": {}})
+        assert output.last_status == Responses().MISSING_REQUIRED.status
+        assert ".field" in output.last_message
+
+
+def test_ref_shared_validator(monkeypatch):
+    """
+    Test that all levels of a recursive schema share one validator
+    without assembling `Pipeline`s.
+    """
+    node = Object(
+        properties={
+            Property("name"): String(),
+            Property("children"): Array(items=Ref(lambda: node)),
+        }
+    )
+    pipeline = node.assemble()
+    SchemaRegistry().clear()
+
+    calls = []
+    assemble = Object.assemble
+    monkeypatch.setattr(
+        Object, "assemble",
+        lambda self, _loc=None: calls.append(_loc) or assemble(self, _loc)
+    )
+    output = pipeline.run(json=_tree(200))
+    assert output.last_status == Responses().GOOD.status
+    assert output.data.value == _tree(200)
+    # deeper than recursion limit
+    output = pipeline.run(json=_tree(1500))
+    assert output.last_status == Responses().GOOD.status
+    assert calls == []
+
+
+def test_ref_non_object():
+    """Test `Ref` with other `DPType`s."""
+    ref = Ref(lambda: Integer(min_value=0))
+    assert ref.TYPE is int
+    assert ref.__name__ == "int"
+    output = Object(
+        properties={Property("field"): Array(items=ref)}
+    ).assemble().run(json={"field": [1, 0]})
+    assert output.last_status == Responses().BAD_VALUE.status
+
+
+def test_ref_bad_target():
+    """Test `Ref` with bad target."""
+    with pytest.raises(ValueError):
+        Ref(lambda: "string").TYPE